@@ -1,12 +1,28 @@
 """AI module for response generation using LLMs."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import BaseLLMClient
 from .character import Character, SpeakingStyle, ExampleDialogue
 from .memory import ConversationMemory, Message
-from .openai_client import OpenAIClient
-from .anthropic_client import AnthropicClient
-from .google_client import GoogleClient
-from .ollama_client import OllamaClient
+
+if TYPE_CHECKING:
+    from .openai_client import OpenAIClient
+    from .anthropic_client import AnthropicClient
+    from .google_client import GoogleClient
+    from .ollama_client import OllamaClient
+    from .response_cache import ResponseCache
+
+# Provider SDKs are only imported when their client is first used, and the
+# response cache (which pulls in NumPy) when it is enabled
+_LAZY_IMPORTS = {
+    "OpenAIClient": ".openai_client",
+    "AnthropicClient": ".anthropic_client",
+    "GoogleClient": ".google_client",
+    "OllamaClient": ".ollama_client",
+    "ResponseCache": ".response_cache",
+}
 
 __all__ = [
     "BaseLLMClient",
@@ -19,4 +35,15 @@ __all__ = [
     "AnthropicClient",
     "GoogleClient",
     "OllamaClient",
+    "ResponseCache",
 ]
+
+
+def __getattr__(name: str):
+    """Import backend clients on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
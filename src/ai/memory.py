@@ -1,5 +1,6 @@
 """Conversation memory management for context retention."""
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
@@ -48,7 +49,8 @@ class ConversationMemory:
         Args:
             max_messages: Maximum messages to keep in history.
         """
-        self._messages: list[Message] = []
+        # Ring buffer: appending past the limit drops the oldest message
+        self._messages: deque[Message] = deque(maxlen=max_messages)
         self._max_messages = max_messages
 
     def add_user_message(
@@ -67,7 +69,6 @@ class ConversationMemory:
                 user_name=user_name,
             )
         )
-        self._trim()
 
     def add_assistant_message(self, content: str) -> None:
         """Add an assistant (AI) message to history.
@@ -81,12 +82,6 @@ class ConversationMemory:
                 content=content,
             )
         )
-        self._trim()
-
-    def _trim(self) -> None:
-        """Trim messages to max size, keeping most recent."""
-        if len(self._messages) > self._max_messages:
-            self._messages = self._messages[-self._max_messages :]
 
     def get_context(self) -> list[dict[str, str]]:
         """Get conversation context for LLM.
@@ -123,7 +118,7 @@ class ConversationMemory:
         Returns:
             List of recent Message objects.
         """
-        return self._messages[-n:] if n > 0 else []
+        return list(self._messages)[-n:] if n > 0 else []
 
     def clear(self) -> None:
         """Clear all conversation history."""
@@ -0,0 +1,198 @@
+"""Cache of responses to repeated chat comments."""
+
+import asyncio
+import logging
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from ..memory.embeddings import EmbeddingIndex
+from ..tts.models import AudioData
+
+if TYPE_CHECKING:
+    from ..memory.embeddings import TextEncoder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A cached response and its synthesized speech.
+
+    Attributes:
+        response: The response text.
+        audio: Synthesized audio, one clip per sentence.
+    """
+
+    response: str
+    audio: list[AudioData]
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached audio in bytes."""
+        return sum(len(clip) for clip in self.audio)
+
+
+class ResponseCache:
+    """Least recently used cache of responses keyed by comment text.
+
+    Comments are matched exactly after normalization (NFKC, case and
+    surrounding whitespace). With an encoder, a comment without an exact
+    match also reuses the response to the most similar cached comment when
+    their cosine similarity reaches the threshold. Encoding runs on a
+    worker thread so the event loop keeps serving playback and chat.
+
+    Args:
+        max_entries: Maximum number of cached responses.
+        max_bytes: Maximum total size of cached audio.
+        encoder: Optional text encoder that enables similarity matching.
+        similarity_threshold: Minimum cosine similarity for a similar match.
+
+    Example:
+        ```python
+        cache = ResponseCache()
+        cached = await cache.get("こんにちは")
+        if cached is None:
+            await cache.put("こんにちは", response, audio_clips)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        encoder: Optional["TextEncoder"] = None,
+        similarity_threshold: float = 0.92,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached responses.
+            max_bytes: Maximum total size of cached audio.
+            encoder: Optional text encoder for similarity matching.
+            similarity_threshold: Minimum cosine similarity for a match.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.similarity_threshold = similarity_threshold
+        self._encoder = encoder
+        self._index: Optional[EmbeddingIndex] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if encoder is not None:
+            self._index = EmbeddingIndex(encoder.dimension)
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="response-cache",
+            )
+
+        # Cached responses by normalized comment, least recently used first
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    @staticmethod
+    def normalize(message: str) -> str:
+        """Normalize a comment for exact matching.
+
+        Args:
+            message: The comment text.
+
+        Returns:
+            The NFKC-normalized, lowercased and stripped text.
+        """
+        return unicodedata.normalize("NFKC", message).strip().lower()
+
+    async def _encode(self, key: str) -> np.ndarray:
+        """Encode a normalized comment on the worker thread.
+
+        Args:
+            key: The normalized comment.
+
+        Returns:
+            The embedding vector of the comment.
+        """
+        loop = asyncio.get_running_loop()
+        vectors = await loop.run_in_executor(
+            self._executor, self._encoder.encode, [key]
+        )
+        return vectors[0]
+
+    async def get(self, message: str) -> Optional[CachedResponse]:
+        """Find the cached response for a comment.
+
+        Args:
+            message: The comment text.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        key = self.normalize(message)
+        if key not in self._entries and self._index is not None and len(self._index):
+            query = await self._encode(key)
+            matches = self._index.search(query, 1)
+            if matches and matches[0][1] >= self.similarity_threshold:
+                similar_key, similarity = matches[0]
+                logger.debug(
+                    "Similar cached response (%.2f): %s", similarity, similar_key
+                )
+                key = similar_key
+
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+        return cached
+
+    async def put(
+        self, message: str, response: str, audio: list[AudioData]
+    ) -> None:
+        """Cache the response to a comment.
+
+        Args:
+            message: The comment text.
+            response: The response text.
+            audio: Synthesized audio of the response, one clip per sentence.
+        """
+        key = self.normalize(message)
+        entry = CachedResponse(response=response, audio=audio)
+        if entry.size > self.max_bytes:
+            return
+
+        # Encode before changing anything, since other calls may run
+        # while this one waits for the worker thread
+        vector = None
+        if self._index is not None and key not in self._entries:
+            vector = await self._encode(key)
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= previous.size
+        elif vector is not None:
+            self._index.add([key], vector[np.newaxis], [""], [None])
+
+        self._entries[key] = entry
+        self._size += entry.size
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+            if self._index is not None:
+                self._index.remove([evicted_key])
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+        self._size = 0
+        if self._index is not None:
+            self._index = EmbeddingIndex(self._encoder.dimension)
+
+    def close(self) -> None:
+        """Stop the encoding worker thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
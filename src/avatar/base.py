@@ -1,8 +1,13 @@
 """Abstract base class for avatar controllers."""
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 class BaseAvatarController(ABC):
     """Abstract base class for avatar controllers.
@@ -102,6 +107,27 @@ class BaseAvatarController(ABC):
         """
         await self.set_parameter("MouthOpen", value)
 
+    async def set_lip_sync_schedule(
+        self, values: Sequence[float], interval: float
+    ) -> None:
+        """Play back a precomputed sequence of lip sync values.
+
+        The default implementation sends one set_lip_sync() call per value,
+        waiting ``interval`` seconds after each. A failed value is logged and
+        skipped so the rest of the animation still plays. Override in
+        subclasses that can submit the whole sequence in fewer requests.
+
+        Args:
+            values: Mouth open values in playback order.
+            interval: Time between consecutive values in seconds.
+        """
+        for value in values:
+            try:
+                await self.set_lip_sync(value)
+            except Exception as e:
+                logger.error("Failed to set mouth value: %s", e)
+            await asyncio.sleep(interval)
+
     async def get_available_parameters(self) -> list[dict]:
         """Get list of available model parameters.
 
@@ -1,10 +1,21 @@
 """Chat module for retrieving comments from streaming platforms."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import BaseChatClient
 from .models import Comment, Platform
 from .comment_queue import CommentQueue
-from .youtube_chat import YouTubeChatClient
-from .twitch_chat import TwitchChatClient
+
+if TYPE_CHECKING:
+    from .youtube_chat import YouTubeChatClient
+    from .twitch_chat import TwitchChatClient
+
+# Platform libraries are only imported when their client is first used
+_LAZY_IMPORTS = {
+    "YouTubeChatClient": ".youtube_chat",
+    "TwitchChatClient": ".twitch_chat",
+}
 
 __all__ = [
     "BaseChatClient",
@@ -14,3 +25,13 @@ __all__ = [
     "YouTubeChatClient",
     "TwitchChatClient",
 ]
+
+
+def __getattr__(name: str):
+    """Import backend clients on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,6 +2,7 @@
 
 import asyncio
 import heapq
+import itertools
 import logging
 import re
 from pathlib import Path
@@ -15,8 +16,10 @@ logger = logging.getLogger(__name__)
 class CommentQueue:
     """Priority queue for managing and filtering incoming comments.
 
-    Comments are ordered by priority (higher priority first), with support
-    for NG word filtering and duplicate detection.
+    Comments are ordered by priority (higher priority first, oldest first
+    within a priority), with support for NG word filtering and duplicate
+    detection. When the queue is full, a new comment replaces the lowest
+    priority one if it has a higher priority and is dropped otherwise.
 
     Args:
         max_size: Maximum number of comments to keep in queue.
@@ -43,12 +46,16 @@ class CommentQueue:
             max_size: Maximum queue size.
             ng_words: Initial set of NG words to filter.
         """
-        self._queue: list[Comment] = []
+        # Heap of (-priority, arrival number, comment)
+        self._queue: list[tuple[int, int, Comment]] = []
+        self._counter = itertools.count()
         self._max_size = max_size
         self._ng_words: set[str] = ng_words or set()
         self._ng_pattern: Optional[re.Pattern[str]] = None
-        self._seen_ids: set[str] = set()
+        # Seen comment IDs in arrival order (values unused)
+        self._seen_ids: dict[str, None] = {}
         self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Event()
 
         if self._ng_words:
             self._compile_ng_pattern()
@@ -129,17 +136,26 @@ class CommentQueue:
                 return False
 
             # Track seen IDs (limit size to prevent memory issues)
-            self._seen_ids.add(comment.id)
+            self._seen_ids[comment.id] = None
             if len(self._seen_ids) > self._max_size * 2:
                 # Remove oldest half
-                self._seen_ids = set(list(self._seen_ids)[self._max_size :])
+                self._seen_ids = dict.fromkeys(
+                    list(self._seen_ids)[self._max_size :]
+                )
 
             # Add to priority queue
+            entry = (-comment.priority, next(self._counter), comment)
             if len(self._queue) >= self._max_size:
                 # Replace lowest priority if new comment has higher priority
-                heapq.heappushpop(self._queue, comment)
+                lowest = max(range(len(self._queue)), key=self._queue.__getitem__)
+                if comment.priority <= -self._queue[lowest][0]:
+                    logger.debug("Queue full, dropped comment: %s", comment.id)
+                    return False
+                self._queue[lowest] = entry
+                heapq.heapify(self._queue)
             else:
-                heapq.heappush(self._queue, comment)
+                heapq.heappush(self._queue, entry)
+            self._not_empty.set()
 
             logger.debug(
                 f"Queued comment from {comment.user_name} "
@@ -154,9 +170,16 @@ class CommentQueue:
             The highest priority comment, or None if queue is empty.
         """
         async with self._lock:
-            if self._queue:
-                return heapq.heappop(self._queue)
-            return None
+            if not self._queue:
+                return None
+            comment = heapq.heappop(self._queue)[2]
+            if not self._queue:
+                self._not_empty.clear()
+            return comment
+
+    async def wait(self) -> None:
+        """Wait until the queue has at least one comment."""
+        await self._not_empty.wait()
 
     async def peek(self) -> Optional[Comment]:
         """View the highest priority comment without removing it.
@@ -166,7 +189,7 @@ class CommentQueue:
         """
         async with self._lock:
             if self._queue:
-                return self._queue[0]
+                return self._queue[0][2]
             return None
 
     def __len__(self) -> int:
@@ -189,4 +212,5 @@ class CommentQueue:
     def clear(self) -> None:
         """Clear all comments from the queue."""
         self._queue.clear()
+        self._not_empty.clear()
         logger.info("Comment queue cleared")
@@ -1,12 +1,16 @@
 """Configuration management for AITuber Starter Kit."""
 
+import json
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import yaml
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class LLMConfig(BaseModel):
     """LLM provider configuration."""
@@ -15,6 +19,8 @@ class LLMConfig(BaseModel):
     model: str = "gpt-4o-mini"
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     max_tokens: int = Field(default=150, ge=1, le=4096)
+    # Seconds to wait for a response, or None to wait indefinitely
+    timeout: Optional[float] = Field(default=30.0, gt=0.0)
 
     # Ollama specific settings
     ollama_host: str = "localhost"
@@ -32,6 +38,8 @@ class TTSConfig(BaseModel):
     pitch: float = Field(default=0.0, ge=-0.15, le=0.15)
     intonation: float = Field(default=1.0, ge=0.0, le=2.0)
     volume: float = Field(default=1.0, ge=0.0, le=2.0)
+    warmup: bool = True  # Synthesize a short phrase on startup
+    lookahead: int = Field(default=1, ge=1, le=8)  # Sentences synthesized ahead
 
     # Style-Bert-VITS2 specific settings
     style_bert_model: str = "default"
@@ -101,6 +109,18 @@ class MemoryConfig(BaseModel):
     db_path: str = "data/memory.db"
     max_results: int = 5
     relevance_threshold: float = 0.3
+    embedding_model: Optional[str] = None  # None = keyword search
+    embedding_quantization: Literal["fp32", "binary"] = "fp32"
+
+
+class ResponseCacheConfig(BaseModel):
+    """Response cache configuration."""
+
+    enabled: bool = False
+    max_entries: int = Field(default=1024, ge=1)
+    max_size_mb: int = Field(default=64, ge=1)
+    embedding_model: Optional[str] = None  # None = exact matches only
+    similarity_threshold: float = Field(default=0.92, ge=0.0, le=1.0)
 
 
 class AppConfig(BaseModel):
@@ -115,6 +135,7 @@ class AppConfig(BaseModel):
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     dashboard: DashboardConfig = Field(default_factory=DashboardConfig)
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
+    response_cache: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)
     character_file: Path = Path("config/characters/default.yaml")
 
 
@@ -153,10 +174,45 @@ def load_config(config_path: Path = Path("config/config.yaml")) -> AppConfig:
     if not config_path.exists():
         return AppConfig()
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    return AppConfig(**_load_config_data(config_path))
+
+
+def _load_config_data(config_path: Path) -> dict:
+    """Read raw configuration data from a YAML file.
+
+    The parsed data is cached in a JSON file next to the YAML file and
+    reused while the YAML file's modification time and size are unchanged.
 
-    return AppConfig(**data)
+    Args:
+        config_path: Path to the YAML configuration file.
+
+    Returns:
+        Parsed configuration data.
+    """
+    stat = config_path.stat()
+    cache_key = [stat.st_mtime_ns, stat.st_size]
+    cache_path = config_path.with_name(config_path.name + ".cache.json")
+
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cached["key"] == cache_key:
+            return cached["data"]
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader) or {}
+
+    try:
+        cache_path.write_text(
+            json.dumps({"key": cache_key, "data": data}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+    except (OSError, TypeError, ValueError):
+        # Read-only directory or data that is not JSON-serializable
+        pass
+
+    return data
 
 
 # Global settings instance
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +12,8 @@ from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
 
 from .models import (
     CharacterInfo,
@@ -21,15 +24,76 @@ from .models import (
     PipelineStatus,
     ResponseData,
     SystemStats,
-    WebSocketMessage,
 )
 
 logger = logging.getLogger(__name__)
 
+# Health probes may fire every few seconds from several watchers, so the
+# payload is reused for a short window instead of being rebuilt per request.
+_HEALTH_TTL_SECONDS = 0.5
+_health_cache: tuple[float, dict] = (0.0, {})
 
-def create_app() -> FastAPI:
+# Memory statistics are polled by the dashboard but change slowly
+_MEMORY_STATS_TTL_SECONDS = 10.0
+
+# Pre-built WebSocket status messages (only the timestamp varies)
+_STATUS_TEMPLATES: dict[PipelineStatus, dict] = {
+    status: {"type": "status", "data": {"status": status.value}}
+    for status in PipelineStatus
+}
+
+
+def _status_message(status: PipelineStatus) -> dict:
+    """Build a JSON-ready status message without pydantic validation.
+
+    Args:
+        status: Current pipeline status.
+
+    Returns:
+        WebSocket message dictionary.
+    """
+    return {**_STATUS_TEMPLATES[status], "timestamp": datetime.now().isoformat()}
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds Cache-Control headers to served assets.
+
+    HTML pages are cached briefly so UI updates show up quickly, while
+    scripts and stylesheets are cached longer. Starlette's built-in
+    ETag/Last-Modified handling still applies for revalidation.
+    """
+
+    HTML_CACHE_CONTROL = "public, max-age=60"
+    ASSET_CACHE_CONTROL = "public, max-age=3600"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve a static file with cache headers.
+
+        Args:
+            path: Requested path relative to the static directory.
+            scope: ASGI request scope.
+
+        Returns:
+            The file (or not-modified) response.
+        """
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            suffix = Path(path).suffix
+            if suffix in ("", ".html"):
+                response.headers["Cache-Control"] = self.HTML_CACHE_CONTROL
+            else:
+                response.headers["Cache-Control"] = self.ASSET_CACHE_CONTROL
+        return response
+
+
+def create_app(allowed_origins: Optional[list[str]] = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
+    Args:
+        allowed_origins: Origins allowed to call the API cross-origin.
+            The bundled dashboard UI is served from the same origin and
+            does not need to be listed.
+
     Returns:
         Configured FastAPI application instance.
     """
@@ -41,13 +105,15 @@ def create_app() -> FastAPI:
         redoc_url="/api/redoc",
     )
 
-    # Add CORS middleware
+    # Add CORS middleware (restricted to known origins; preflight results
+    # are cached by the browser so OPTIONS requests stay rare)
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],  # Configure appropriately for production
+        allow_origins=allowed_origins or [],
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "PATCH"],
+        allow_headers=["Content-Type"],
+        max_age=600,
     )
 
     # Store for pipeline reference and state
@@ -62,6 +128,7 @@ def create_app() -> FastAPI:
     app.state.recent_responses: list[ResponseData] = []
     app.state.websocket_clients: list[WebSocket] = []
     app.state.memory_store = None  # Long-term memory store
+    app.state.memory_stats_cache: tuple[float, dict] = (0.0, {})
 
     # Register routes
     _register_routes(app)
@@ -69,7 +136,11 @@ def create_app() -> FastAPI:
     # Mount static files (dashboard UI)
     static_dir = Path(__file__).parent / "static"
     if static_dir.exists():
-        app.mount("/", StaticFiles(directory=str(static_dir), html=True), name="static")
+        app.mount(
+            "/",
+            CachedStaticFiles(directory=str(static_dir), html=True),
+            name="static",
+        )
 
     return app
 
@@ -84,7 +155,14 @@ def _register_routes(app: FastAPI) -> None:
     @app.get("/api/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+        global _health_cache
+
+        now = time.monotonic()
+        expiry, payload = _health_cache
+        if now >= expiry:
+            payload = {"status": "healthy", "timestamp": datetime.now().isoformat()}
+            _health_cache = (now + _HEALTH_TTL_SECONDS, payload)
+        return payload
 
     @app.get("/api/status", response_model=SystemStats)
     async def get_status():
@@ -129,6 +207,7 @@ def _register_routes(app: FastAPI) -> None:
 
             app.state.pipeline_status = PipelineStatus.RUNNING
             app.state.start_time = datetime.now()
+            app.state.memory_stats_cache = (0.0, {})
             await _broadcast_status(app)
 
             return {"message": "Pipeline started", "status": "running"}
@@ -327,12 +406,28 @@ def _register_routes(app: FastAPI) -> None:
                 "memory_type": "short-term only",
             }
 
+        now = time.monotonic()
+        expiry, payload = app.state.memory_stats_cache
+        if now < expiry:
+            return payload
+
         stats = await app.state.memory_store.get_stats()
-        return {
+        payload = {
             "enabled": True,
             "memory_type": "long-term",
             **stats,
         }
+        app.state.memory_stats_cache = (now + _MEMORY_STATS_TTL_SECONDS, payload)
+        return payload
+
+    @app.post("/api/memory/analyze")
+    async def analyze_memory():
+        """Recompute query planner statistics for the memory database."""
+        if not app.state.memory_store:
+            raise HTTPException(status_code=400, detail="Long-term memory not enabled")
+
+        await app.state.memory_store.analyze()
+        return {"message": "Memory database analyzed"}
 
     @app.websocket("/api/ws")
     async def websocket_endpoint(websocket: WebSocket):
@@ -343,26 +438,13 @@ def _register_routes(app: FastAPI) -> None:
 
         try:
             # Send initial status
-            await websocket.send_json(
-                WebSocketMessage(
-                    type="status",
-                    data={"status": app.state.pipeline_status.value},
-                    timestamp=datetime.now(),
-                ).model_dump(mode="json")
-            )
+            await websocket.send_json(_status_message(app.state.pipeline_status))
 
-            # Keep connection alive and handle messages
+            # Handle incoming messages (keep-alive is done with protocol-level
+            # ping frames configured on the uvicorn server)
             while True:
-                try:
-                    data = await asyncio.wait_for(
-                        websocket.receive_text(),
-                        timeout=30.0,  # Ping every 30 seconds
-                    )
-                    # Handle incoming messages if needed
-                    logger.debug(f"WebSocket received: {data}")
-                except asyncio.TimeoutError:
-                    # Send ping to keep alive
-                    await websocket.send_json({"type": "ping"})
+                data = await websocket.receive_text()
+                logger.debug(f"WebSocket received: {data}")
 
         except WebSocketDisconnect:
             logger.info("WebSocket client disconnected")
@@ -375,40 +457,41 @@ def _register_routes(app: FastAPI) -> None:
 
 async def _broadcast_status(app: FastAPI) -> None:
     """Broadcast status update to all WebSocket clients."""
-    message = WebSocketMessage(
-        type="status",
-        data={"status": app.state.pipeline_status.value},
-        timestamp=datetime.now(),
-    )
-    await _broadcast_message(app, message)
+    await _broadcast_message(app, _status_message(app.state.pipeline_status))
 
 
 async def _broadcast_comment(app: FastAPI, comment: CommentData) -> None:
     """Broadcast new comment to all WebSocket clients."""
-    message = WebSocketMessage(
-        type="comment",
-        data=comment.model_dump(mode="json"),
-        timestamp=datetime.now(),
-    )
+    message = {
+        "type": "comment",
+        "data": comment.model_dump(mode="json"),
+        "timestamp": datetime.now().isoformat(),
+    }
     await _broadcast_message(app, message)
 
 
 async def _broadcast_response(app: FastAPI, response: ResponseData) -> None:
     """Broadcast new response to all WebSocket clients."""
-    message = WebSocketMessage(
-        type="response",
-        data=response.model_dump(mode="json"),
-        timestamp=datetime.now(),
-    )
+    message = {
+        "type": "response",
+        "data": response.model_dump(mode="json"),
+        "timestamp": datetime.now().isoformat(),
+    }
     await _broadcast_message(app, message)
 
 
-async def _broadcast_message(app: FastAPI, message: WebSocketMessage) -> None:
-    """Broadcast a message to all connected WebSocket clients."""
+async def _broadcast_message(app: FastAPI, message: dict) -> None:
+    """Broadcast a message to all connected WebSocket clients.
+
+    Args:
+        app: FastAPI application instance.
+        message: JSON-ready message dictionary (see WebSocketMessage for
+            the shape).
+    """
     disconnected = []
     for client in app.state.websocket_clients:
         try:
-            await client.send_json(message.model_dump(mode="json"))
+            await client.send_json(message)
         except Exception as e:
             logger.warning(f"Failed to send to WebSocket client: {e}")
             disconnected.append(client)
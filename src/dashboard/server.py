@@ -6,7 +6,8 @@ from typing import Optional
 
 import uvicorn
 
-from .api import create_app
+from .api import _broadcast_comment, _broadcast_response, create_app
+from .models import CommentData, ResponseData
 
 logger = logging.getLogger(__name__)
 
@@ -44,10 +45,15 @@ class DashboardServer:
         """
         self.host = host
         self.port = port
-        self.app = create_app()
+        self.app = create_app(allowed_origins=[self.get_url()])
         self._server: Optional[uvicorn.Server] = None
         self._server_task: Optional[asyncio.Task] = None
 
+        # WebSocket broadcasts are queued and sent by a single drain task
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._broadcast_queue: Optional[asyncio.Queue] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
+
         logger.info(f"Dashboard server initialized (http://{host}:{port})")
 
     def set_pipeline(self, pipeline) -> None:
@@ -66,6 +72,7 @@ class DashboardServer:
             memory_store: LongTermMemory instance.
         """
         self.app.state.memory_store = memory_store
+        self.app.state.memory_stats_cache = (0.0, {})
         logger.info("Memory store attached to dashboard")
 
     async def start(self) -> None:
@@ -80,9 +87,17 @@ class DashboardServer:
             port=self.port,
             log_level="warning",
             access_log=False,
+            ws_ping_interval=20.0,
+            ws_ping_timeout=20.0,
         )
         self._server = uvicorn.Server(config)
 
+        self._loop = asyncio.get_running_loop()
+        self._broadcast_queue = asyncio.Queue()
+        self._broadcast_task = asyncio.create_task(
+            self._drain_broadcasts(self._broadcast_queue)
+        )
+
         logger.info(f"Starting dashboard server at http://{self.host}:{self.port}")
         self._server_task = asyncio.create_task(self._server.serve())
 
@@ -104,6 +119,16 @@ class DashboardServer:
             self._server_task = None
             logger.info("Dashboard server stopped")
 
+        if self._broadcast_task:
+            self._broadcast_task.cancel()
+            try:
+                await self._broadcast_task
+            except asyncio.CancelledError:
+                pass
+            self._broadcast_task = None
+            self._broadcast_queue = None
+            self._loop = None
+
     @property
     def is_running(self) -> bool:
         """Check if the server is running."""
@@ -125,8 +150,6 @@ class DashboardServer:
         Args:
             comment_data: Comment data dictionary.
         """
-        from .models import CommentData
-
         try:
             comment = CommentData(**comment_data)
             self.app.state.recent_comments.append(comment)
@@ -138,7 +161,7 @@ class DashboardServer:
             self.app.state.stats["comments_processed"] += 1
 
             # Broadcast to WebSocket clients
-            asyncio.create_task(self._broadcast_comment(comment))
+            self._enqueue_broadcast(_broadcast_comment, comment)
         except Exception as e:
             logger.error(f"Failed to add comment: {e}")
 
@@ -150,8 +173,6 @@ class DashboardServer:
         Args:
             response_data: Response data dictionary.
         """
-        from .models import ResponseData
-
         try:
             response = ResponseData(**response_data)
             self.app.state.recent_responses.append(response)
@@ -163,18 +184,35 @@ class DashboardServer:
             self.app.state.stats["responses_generated"] += 1
 
             # Broadcast to WebSocket clients
-            asyncio.create_task(self._broadcast_response(response))
+            self._enqueue_broadcast(_broadcast_response, response)
         except Exception as e:
             logger.error(f"Failed to add response: {e}")
 
-    async def _broadcast_comment(self, comment) -> None:
-        """Broadcast comment to WebSocket clients."""
-        from .api import _broadcast_comment
+    def _enqueue_broadcast(self, broadcaster, payload) -> None:
+        """Queue a WebSocket broadcast for the drain task.
 
-        await _broadcast_comment(self.app, comment)
+        Safe to call from any thread; does nothing if the server has
+        not been started.
 
-    async def _broadcast_response(self, response) -> None:
-        """Broadcast response to WebSocket clients."""
-        from .api import _broadcast_response
+        Args:
+            broadcaster: Broadcast coroutine function from the api module.
+            payload: Model instance to broadcast.
+        """
+        if self._loop is None or self._broadcast_queue is None:
+            return
+        self._loop.call_soon_threadsafe(
+            self._broadcast_queue.put_nowait, (broadcaster, payload)
+        )
 
-        await _broadcast_response(self.app, response)
+    async def _drain_broadcasts(self, queue: asyncio.Queue) -> None:
+        """Send queued broadcasts to WebSocket clients in order.
+
+        Args:
+            queue: Queue of (broadcaster, payload) pairs.
+        """
+        while True:
+            broadcaster, payload = await queue.get()
+            try:
+                await broadcaster(self.app, payload)
+            except Exception as e:
+                logger.error(f"Failed to broadcast update: {e}")
@@ -77,12 +77,6 @@ function handleWebSocketMessage(message) {
         case 'response':
             addConversation(message.data);
             break;
-        case 'ping':
-            // Respond to ping
-            if (ws && ws.readyState === WebSocket.OPEN) {
-                ws.send(JSON.stringify({ type: 'pong' }));
-            }
-            break;
         default:
             console.log('Unknown message type:', message.type);
     }
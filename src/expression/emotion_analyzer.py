@@ -6,12 +6,24 @@ Emotion Analyzer
 
 import re
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import Optional
 
+try:
+    import ahocorasick
+except ImportError:  # オプション依存（pip install pyahocorasick）
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# カタカナ（ァ〜ヶ）をひらがなに変換するテーブル
+_KATA_TO_HIRA = str.maketrans(
+    {chr(code): chr(code - 0x60) for code in range(0x30A1, 0x30F7)}
+)
+
 
 class Emotion(Enum):
     """感情の種類"""
@@ -26,22 +38,28 @@ class Emotion(Enum):
     THINKING = "thinking"    # 考え中
 
 
-@dataclass
+@dataclass(frozen=True)
 class EmotionResult:
-    """感情分析の結果"""
+    """感情分析の結果（キャッシュから共有されるため変更不可）"""
     primary_emotion: Emotion
     confidence: float
     secondary_emotion: Optional[Emotion] = None
     intensity: float = 0.5  # 0.0-1.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExpressionMapping:
-    """表情マッピング設定"""
+    """表情マッピング設定（複数の呼び出し元で共有されるため変更不可）"""
     # VTube Studioの表情パラメータ名
     expression_name: str
     # パラメータ値（0.0-1.0）
-    parameter_values: dict[str, float]
+    parameter_values: Mapping[str, float]
+
+    def __post_init__(self) -> None:
+        """パラメータ値を読み取り専用のコピーにする"""
+        object.__setattr__(
+            self, "parameter_values", MappingProxyType(dict(self.parameter_values))
+        )
 
 
 class EmotionAnalyzer:
@@ -188,6 +206,15 @@ class EmotionAnalyzer:
         ),
     }
 
+    # 分析結果をキャッシュする最大件数と、キャッシュ対象とするテキストの最大長
+    CACHE_SIZE = 256
+    CACHE_MAX_TEXT_LENGTH = 200
+
+    # マッチ数ごとの強度（3回以上は1.0）
+    _INTENSITY_BY_SCORE: tuple[float, ...] = tuple(
+        min(1.0, score / 3.0) for score in range(4)
+    )
+
     def __init__(
         self,
         custom_keywords: Optional[dict[Emotion, list[str]]] = None,
@@ -200,48 +227,187 @@ class EmotionAnalyzer:
             custom_keywords: カスタム感情キーワード辞書
             custom_mappings: カスタム表情マッピング
         """
-        # キーワード辞書を構築
-        self.keywords = dict(self.EMOTION_KEYWORDS)
+        # キーワード辞書を構築（クラス属性のリストを変更しないようコピー）
+        self.keywords = {
+            emotion: list(words) for emotion, words in self.EMOTION_KEYWORDS.items()
+        }
         if custom_keywords:
             for emotion, words in custom_keywords.items():
                 if emotion in self.keywords:
                     self.keywords[emotion].extend(words)
                 else:
-                    self.keywords[emotion] = words
+                    self.keywords[emotion] = list(words)
+
+        # スコアはリストで集計するため、感情に通し番号を振る
+        self._emotions: tuple[Emotion, ...] = tuple(self.keywords)
+
+        # 正規化したキーワードを(感情番号, キーワード)の平坦なリストとして事前計算
+        # （カタカナ・ひらがなの表記揺れで重複したキーワードは1つにまとめる）
+        self._flat_keywords: list[tuple[int, str]] = []
+        for index, words in enumerate(self.keywords.values()):
+            seen: set[str] = set()
+            for keyword in words:
+                normalized = self._normalize(keyword)
+                if normalized not in seen:
+                    seen.add(normalized)
+                    self._flat_keywords.append((index, normalized))
 
         # 表情マッピングを構築
         self.expression_mappings = dict(self.DEFAULT_EXPRESSION_MAPPINGS)
         if custom_mappings:
             self.expression_mappings.update(custom_mappings)
 
+        # pyahocorasickがあれば全キーワードを1つのオートマトンにまとめる
+        self._automaton = self._build_automaton()
+
+        # オートマトンがない場合に、キーワードを含まないテキストを
+        # 1回の走査で除外するための正規表現
+        self._keyword_pattern = self._build_keyword_pattern()
+
+        # ストリーミング中に繰り返し現れる短いテキストの分析結果キャッシュ
+        self._cache: dict[str, EmotionResult] = {}
+
+        # 強度で調整済みの表情マッピング（強度は数段階しか取らない）
+        self._scaled_mappings: dict[
+            tuple[Emotion, float], tuple[ExpressionMapping, ExpressionMapping]
+        ] = {}
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """
+        照合用にテキストを正規化（カタカナをひらがなに変換し小文字化）
+
+        Args:
+            text: 正規化対象のテキスト
+
+        Returns:
+            正規化済みテキスト
+        """
+        return text.translate(_KATA_TO_HIRA).lower()
+
+    def _build_automaton(self):
+        """
+        全キーワードからAho-Corasickオートマトンを構築
+
+        Returns:
+            オートマトン（pyahocorasick未インストールの場合はNone）
+        """
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for index, lowered in self._flat_keywords:
+            if not lowered:
+                continue
+            # 同じキーワードが複数の感情に登録されている場合も全て数える
+            if lowered in automaton:
+                _, indices = automaton.get(lowered)
+            else:
+                indices = []
+                automaton.add_word(lowered, (lowered, indices))
+            indices.append(index)
+        automaton.make_automaton()
+        return automaton
+
+    def _build_keyword_pattern(self) -> Optional[re.Pattern[str]]:
+        """
+        全キーワードを1つの選択パターンにコンパイル
+
+        Returns:
+            コンパイル済みパターン（キーワードがない場合はNone）
+        """
+        unique_keywords = {keyword for _, keyword in self._flat_keywords if keyword}
+        if not unique_keywords:
+            return None
+
+        ordered = sorted(unique_keywords, key=len, reverse=True)
+        return re.compile("|".join(re.escape(keyword) for keyword in ordered))
+
+    def _count_with_automaton(self, normalized_text: str) -> list[int]:
+        """
+        オートマトンで1回走査し、感情ごとのキーワード出現数を数える
+
+        str.countと同じく、同一キーワードの重なった出現は数えない。
+
+        Args:
+            normalized_text: 正規化済みテキスト
+
+        Returns:
+            感情番号ごとのスコア
+        """
+        scores = [0] * len(self._emotions)
+        last_end: dict[str, int] = {}
+
+        for end, (keyword, indices) in self._automaton.iter(normalized_text):
+            start = end - len(keyword) + 1
+            if start <= last_end.get(keyword, -1):
+                continue
+            last_end[keyword] = end
+            for index in indices:
+                scores[index] += 1
+
+        return scores
+
     def analyze(self, text: str) -> EmotionResult:
         """
         テキストから感情を分析
 
+        短いテキストの結果はキャッシュされ、同じテキストには同じ
+        EmotionResultインスタンスを返す。
+
         Args:
             text: 分析対象のテキスト
 
         Returns:
             感情分析結果
         """
-        # テキストを正規化
-        normalized_text = text.lower()
+        if len(text) > self.CACHE_MAX_TEXT_LENGTH:
+            return self._analyze_uncached(text)
+
+        result = self._cache.get(text)
+        if result is None:
+            result = self._analyze_uncached(text)
+            # 上限に達したら最も古いエントリを破棄（FIFO）
+            if len(self._cache) >= self.CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[text] = result
+        return result
 
-        # 各感情のスコアを計算
-        scores: dict[Emotion, float] = {}
-        total_matches = 0
+    def _analyze_uncached(self, text: str) -> EmotionResult:
+        """
+        キャッシュを使わずにテキストから感情を分析
 
-        for emotion, keywords in self.keywords.items():
-            score = 0.0
-            for keyword in keywords:
+        Args:
+            text: 分析対象のテキスト
+
+        Returns:
+            感情分析結果
+        """
+        # テキストを正規化
+        normalized_text = self._normalize(text)
+
+        # 各感情のスコアを計算（感情番号で索引するリスト）
+        if self._automaton is not None:
+            scores = self._count_with_automaton(normalized_text)
+            total_matches = sum(scores)
+        elif (
+            self._keyword_pattern is None
+            or not self._keyword_pattern.search(normalized_text)
+        ):
+            # どのキーワードも含まれない
+            scores = []
+            total_matches = 0
+        else:
+            scores = [0] * len(self._emotions)
+            total_matches = 0
+
+            for index, keyword in self._flat_keywords:
                 # キーワードの出現回数をカウント
-                count = normalized_text.count(keyword.lower())
+                count = normalized_text.count(keyword)
                 if count > 0:
-                    score += count
+                    scores[index] += count
                     total_matches += count
 
-            scores[emotion] = score
-
         # スコアが0の場合はNEUTRALを返す
         if total_matches == 0:
             return EmotionResult(
@@ -250,26 +416,30 @@ class EmotionAnalyzer:
                 intensity=0.3,
             )
 
-        # 最高スコアの感情を取得
-        sorted_emotions = sorted(
-            scores.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )
+        # 上位2つの感情を1回の走査で取得（同点の場合は辞書順の先を優先）
+        primary_index = secondary_index = -1
+        primary_score = secondary_score = -1
+        for index, score in enumerate(scores):
+            if score > primary_score:
+                secondary_index, secondary_score = primary_index, primary_score
+                primary_index, primary_score = index, score
+            elif score > secondary_score:
+                secondary_index, secondary_score = index, score
 
-        primary_emotion = sorted_emotions[0][0]
-        primary_score = sorted_emotions[0][1]
+        primary_emotion = self._emotions[primary_index]
 
         # 信頼度を計算（最高スコア / 総マッチ数）
         confidence = primary_score / total_matches if total_matches > 0 else 0.0
 
         # 強度を計算（マッチ数に基づく、最大1.0）
-        intensity = min(1.0, primary_score / 3.0)
+        intensity = (
+            self._INTENSITY_BY_SCORE[primary_score] if primary_score < 4 else 1.0
+        )
 
-        # セカンダリ感情を取得
-        secondary_emotion = None
-        if len(sorted_emotions) > 1 and sorted_emotions[1][1] > 0:
-            secondary_emotion = sorted_emotions[1][0]
+        # セカンダリ感情はスコアがある場合のみ
+        secondary_emotion = (
+            self._emotions[secondary_index] if secondary_score > 0 else None
+        )
 
         return EmotionResult(
             primary_emotion=primary_emotion,
@@ -288,10 +458,11 @@ class EmotionAnalyzer:
         Returns:
             表情マッピング
         """
-        return self.expression_mappings.get(
-            emotion,
-            self.expression_mappings[Emotion.NEUTRAL],
-        )
+        # 通常はマッピングが存在するため、フォールバックは見つからない場合のみ評価
+        try:
+            return self.expression_mappings[emotion]
+        except KeyError:
+            return self.expression_mappings[Emotion.NEUTRAL]
 
     def analyze_and_map(self, text: str) -> tuple[EmotionResult, ExpressionMapping]:
         """
@@ -306,7 +477,12 @@ class EmotionAnalyzer:
         result = self.analyze(text)
         mapping = self.get_expression_mapping(result.primary_emotion)
 
-        # 強度に応じてパラメータ値を調整
+        # 強度に応じてパラメータ値を調整（調整済みマッピングは共有される）
+        cache_key = (result.primary_emotion, result.intensity)
+        cached = self._scaled_mappings.get(cache_key)
+        if cached is not None and cached[0] is mapping:
+            return result, cached[1]
+
         adjusted_mapping = ExpressionMapping(
             expression_name=mapping.expression_name,
             parameter_values={
@@ -314,6 +490,7 @@ class EmotionAnalyzer:
                 for key, value in mapping.parameter_values.items()
             },
         )
+        self._scaled_mappings[cache_key] = (mapping, adjusted_mapping)
 
         return result, adjusted_mapping
 
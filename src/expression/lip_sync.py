@@ -1,14 +1,13 @@
 """Lip sync controller for audio-driven mouth animation."""
 
-import asyncio
-import io
 import logging
-import wave
-from typing import Optional
+import math
+from typing import Optional, Union
 
 import numpy as np
 
 from ..avatar.base import BaseAvatarController
+from ..tts.models import AudioData
 
 logger = logging.getLogger(__name__)
 
@@ -59,14 +58,14 @@ class LipSyncController:
         """Check if currently syncing audio."""
         return self._is_syncing
 
-    async def sync_with_audio(self, audio_data: bytes) -> None:
+    async def sync_with_audio(self, audio_data: Union[AudioData, bytes]) -> None:
         """Synchronize lip movement with audio data.
 
         This method analyzes the audio volume over time and animates
         the mouth movement accordingly.
 
         Args:
-            audio_data: WAV format audio bytes.
+            audio_data: Audio data, or WAV format audio bytes.
         """
         if self._is_syncing:
             logger.warning("Already syncing, ignoring new audio")
@@ -92,24 +91,18 @@ class LipSyncController:
                 f"Animating {total_frames} frames at {1/self._update_interval:.0f}fps"
             )
 
-            # Animate lip sync
-            for i in range(total_frames):
-                start = i * samples_per_frame
-                end = start + samples_per_frame
-                frame_samples = samples[start:end]
-
-                # Calculate volume
-                volume = self._calculate_volume(frame_samples)
+            # Calculate the volume of every frame up front
+            volumes = self._calculate_frame_volumes(
+                samples, samples_per_frame, total_frames
+            )
 
-                # Apply smoothing
-                self._current_value = (
-                    self._smoothing * self._current_value
-                    + (1 - self._smoothing) * volume
-                )
+            # Apply smoothing to the whole sequence before animating
+            mouth_values = self._smooth_volumes(volumes)
 
-                # Set mouth value
-                await self._set_mouth_open(self._current_value)
-                await asyncio.sleep(self._update_interval)
+            # Animate lip sync as a single schedule
+            if mouth_values:
+                await self._play_mouth_schedule(mouth_values)
+                self._current_value = mouth_values[-1]
 
         except Exception as e:
             logger.error(f"Error during lip sync: {e}", exc_info=True)
@@ -118,23 +111,22 @@ class LipSyncController:
             await self._close_mouth()
             self._is_syncing = False
 
-    def _parse_wav(self, audio_data: bytes) -> Optional[tuple[np.ndarray, int]]:
+    def _parse_wav(
+        self, audio: Union[AudioData, bytes]
+    ) -> Optional[tuple[np.ndarray, int]]:
         """Parse WAV audio data.
 
         Args:
-            audio_data: WAV format bytes.
+            audio: Audio data, or WAV format bytes.
 
         Returns:
             Tuple of (samples array, sample rate) or None on error.
         """
         try:
-            with io.BytesIO(audio_data) as audio_io:
-                with wave.open(audio_io, "rb") as wav:
-                    n_channels = wav.getnchannels()
-                    sampwidth = wav.getsampwidth()
-                    framerate = wav.getframerate()
-                    n_frames = wav.getnframes()
-                    raw_data = wav.readframes(n_frames)
+            if not isinstance(audio, AudioData):
+                audio = AudioData.from_wav(audio)
+            n_channels = audio.channels
+            sampwidth = audio.sample_width
 
             # Determine dtype based on sample width
             if sampwidth == 1:
@@ -147,41 +139,72 @@ class LipSyncController:
                 logger.warning(f"Unsupported sample width: {sampwidth}")
                 return None
 
-            samples = np.frombuffer(raw_data, dtype=dtype)
+            # Wrap the PCM payload in place instead of copying it out
+            samples = np.frombuffer(audio.pcm, dtype=dtype)
 
-            # Convert to mono if stereo
-            if n_channels == 2:
-                samples = samples[::2]
+            # Downmix to mono by averaging all channels
+            if n_channels > 1:
+                samples = (
+                    samples.reshape(-1, n_channels).sum(axis=1, dtype=np.int32)
+                    // n_channels
+                ).astype(dtype, copy=False)
 
-            return samples, framerate
+            return samples, audio.sample_rate
 
         except Exception as e:
             logger.error(f"Failed to parse WAV data: {e}")
             return None
 
-    def _calculate_volume(self, samples: np.ndarray) -> float:
-        """Calculate normalized volume from audio samples.
+    def _calculate_frame_volumes(
+        self,
+        samples: np.ndarray,
+        samples_per_frame: int,
+        total_frames: int,
+    ) -> np.ndarray:
+        """Calculate normalized volumes for consecutive animation frames.
+
+        The volume of a frame is its RMS scaled so that 8000 (a lower
+        threshold than the 16-bit maximum, for better sensitivity) maps to
+        1.0. Trailing samples that do not fill a frame are ignored.
 
         Args:
             samples: Audio sample array.
+            samples_per_frame: Number of samples per animation frame.
+            total_frames: Number of complete frames in samples.
 
         Returns:
-            Normalized volume (0.0 to 1.0).
+            Array of normalized volumes (0.0 to 1.0), one per frame.
         """
-        if len(samples) == 0:
-            return 0.0
+        if total_frames <= 0:
+            return np.zeros(0, dtype=np.float32)
 
-        # Calculate RMS (Root Mean Square)
-        samples_float = samples.astype(np.float32)
-        rms = np.sqrt(np.mean(samples_float**2))
+        usable = total_frames * samples_per_frame
+        frames = samples[:usable].astype(np.float32).reshape(
+            total_frames, samples_per_frame
+        )
+        rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / samples_per_frame)
+        return np.clip(rms / 8000.0, 0.0, 1.0)
 
-        # Normalize to 0-1 range
-        # Assuming 16-bit audio, max value is 32768
-        # Use a lower threshold for better sensitivity
-        normalized = rms / 8000.0
+    def _smooth_volumes(self, volumes: np.ndarray) -> list[float]:
+        """Apply exponential smoothing to a sequence of frame volumes.
 
-        # Clamp to 0-1
-        return min(1.0, max(0.0, normalized))
+        Smoothing starts from the current mouth value so consecutive
+        clips blend into each other.
+
+        Args:
+            volumes: Normalized frame volumes.
+
+        Returns:
+            Smoothed mouth open values, one per frame.
+        """
+        smoothing = self._smoothing
+        gain = 1 - smoothing
+        value = self._current_value
+        smoothed = []
+        for volume in volumes.tolist():
+            value = smoothing * value + gain * volume
+            smoothed.append(value)
+        return smoothed
 
     async def _set_mouth_open(self, value: float) -> None:
         """Set mouth open value on avatar.
@@ -194,13 +217,26 @@ class LipSyncController:
         except Exception as e:
             logger.error(f"Failed to set mouth value: {e}")
 
+    async def _play_mouth_schedule(self, values: list[float]) -> None:
+        """Play a sequence of mouth open values on the avatar.
+
+        Args:
+            values: Mouth open values, one per update interval.
+        """
+        try:
+            await self._avatar.set_lip_sync_schedule(values, self._update_interval)
+        except Exception as e:
+            logger.error(f"Failed to play mouth values: {e}")
+
     async def _close_mouth(self) -> None:
         """Gradually close the mouth."""
-        # Smooth closing animation
-        while self._current_value > 0.01:
-            self._current_value *= 0.5
-            await self._set_mouth_open(self._current_value)
-            await asyncio.sleep(self._update_interval)
+        # Smooth closing animation: halve the value until it drops to 0.01
+        start = self._current_value
+        if start > 0.01:
+            steps = math.ceil(math.log2(start / 0.01))
+            await self._play_mouth_schedule(
+                [start * 0.5**step for step in range(1, steps + 1)]
+            )
 
         self._current_value = 0.0
         await self._set_mouth_open(0.0)
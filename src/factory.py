@@ -1,41 +1,87 @@
 """Factory functions for creating components from configuration."""
 
+import dataclasses
+import hashlib
+import json
 import logging
-from typing import Optional
+from typing import Any, Optional
+
+from pydantic import BaseModel
 
 from .config import AppConfig, Settings
 
-# Chat clients
+# 基底クラスのみをインポートし、各バックエンドは選択された分岐内でインポートする
 from .chat.base import BaseChatClient
-from .chat.youtube_chat import YouTubeChatClient
-from .chat.twitch_chat import TwitchChatClient
-
-# LLM clients
 from .ai.base import BaseLLMClient
-from .ai.openai_client import OpenAIClient
-from .ai.anthropic_client import AnthropicClient
-from .ai.google_client import GoogleClient
-from .ai.ollama_client import OllamaClient
 from .ai.character import Character
-
-# TTS engines
 from .tts.base import BaseTTSEngine
-from .tts.voicevox import VoicevoxEngine
-from .tts.coeiroink import CoeiroinkEngine
-from .tts.style_bert_vits import StyleBertVitsEngine
-from .tts.nijivoice import NijivoiceEngine
-
-# Avatar
 from .avatar.base import BaseAvatarController
-from .avatar.vtube_studio import VTubeStudioController
 
 logger = logging.getLogger(__name__)
 
+# 設定ダイジェストをキーにした生成済みクライアントのキャッシュ。
+# クライアントを閉じる側（パイプラインなど）が所有し、閉じたら破棄する。
+ClientCache = dict[tuple[str, bytes], Any]
+
 
-def create_chat_client(config: AppConfig, settings: Settings) -> BaseChatClient:
+def _config_digest(*models: Any) -> bytes:
+    """
+    設定モデルの内容からダイジェストを計算
+
+    Args:
+        models: ダイジェスト対象の設定モデルまたはデータクラス
+
+    Returns:
+        設定内容のダイジェスト
+    """
+    payload = json.dumps(
+        [
+            model.model_dump(mode="json")
+            if isinstance(model, BaseModel)
+            else dataclasses.asdict(model)
+            for model in models
+        ],
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def create_chat_client(
+    config: AppConfig,
+    settings: Settings,
+    cache: Optional[ClientCache] = None,
+) -> BaseChatClient:
     """
     設定からチャットクライアントを作成
 
+    cacheを渡した場合、同じ設定で作成済みのクライアントがあればそれを返す。
+
+    Args:
+        config: アプリケーション設定
+        settings: 環境変数設定
+        cache: 生成済みクライアントのキャッシュ（オプション）
+
+    Returns:
+        チャットクライアント
+
+    Raises:
+        ValueError: 未対応のプラットフォームの場合
+    """
+    if cache is None:
+        return _create_chat_client(config, settings)
+
+    key = ("chat", _config_digest(config.platform, settings))
+    client = cache.get(key)
+    if client is None:
+        client = _create_chat_client(config, settings)
+        cache[key] = client
+    return client
+
+
+def _create_chat_client(config: AppConfig, settings: Settings) -> BaseChatClient:
+    """
+    設定からチャットクライアントを新規作成
+
     Args:
         config: アプリケーション設定
         settings: 環境変数設定
@@ -51,6 +97,8 @@ def create_chat_client(config: AppConfig, settings: Settings) -> BaseChatClient:
     if platform == "youtube":
         if not config.platform.video_id:
             raise ValueError("YouTube video_id is required")
+        from .chat.youtube_chat import YouTubeChatClient
+
         return YouTubeChatClient(video_id=config.platform.video_id)
 
     elif platform == "twitch":
@@ -58,6 +106,7 @@ def create_chat_client(config: AppConfig, settings: Settings) -> BaseChatClient:
             raise ValueError("TWITCH_ACCESS_TOKEN is required")
         if not config.platform.twitch_channel:
             raise ValueError("Twitch channel name is required")
+        from .chat.twitch_chat import TwitchChatClient
 
         return TwitchChatClient(
             access_token=settings.twitch_access_token,
@@ -73,14 +122,53 @@ def create_llm_client(
     config: AppConfig,
     settings: Settings,
     character: Optional[Character] = None,
+    cache: Optional[ClientCache] = None,
 ) -> BaseLLMClient:
     """
     設定からLLMクライアントを作成
 
+    cacheを渡した場合、同じ設定とキャラクターで作成済みのクライアントが
+    あればそれを返す。
+
     Args:
         config: アプリケーション設定
         settings: 環境変数設定
         character: キャラクター設定（オプション）
+        cache: 生成済みクライアントのキャッシュ（オプション）
+
+    Returns:
+        LLMクライアント
+
+    Raises:
+        ValueError: 未対応のプロバイダーまたはAPIキー未設定の場合
+    """
+    key = None
+    if cache is not None:
+        # キャラクターもキーに含め、共有中のクライアントは変更しない
+        models = (config.llm, settings) + ((character,) if character else ())
+        key = ("llm", _config_digest(*models))
+        client = cache.get(key)
+        if client is not None:
+            return client
+
+    client = _create_llm_client(config, settings)
+
+    # キャラクター設定を適用
+    if character:
+        client.set_character(character)
+
+    if key is not None:
+        cache[key] = client
+    return client
+
+
+def _create_llm_client(config: AppConfig, settings: Settings) -> BaseLLMClient:
+    """
+    設定からLLMクライアントを新規作成
+
+    Args:
+        config: アプリケーション設定
+        settings: 環境変数設定
 
     Returns:
         LLMクライアント
@@ -95,6 +183,7 @@ def create_llm_client(
     if provider == "openai":
         if not settings.openai_api_key:
             raise ValueError("OPENAI_API_KEY is required")
+        from .ai.openai_client import OpenAIClient
 
         client = OpenAIClient(
             api_key=settings.openai_api_key,
@@ -106,6 +195,7 @@ def create_llm_client(
     elif provider == "anthropic":
         if not settings.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY is required")
+        from .ai.anthropic_client import AnthropicClient
 
         client = AnthropicClient(
             api_key=settings.anthropic_api_key,
@@ -117,6 +207,7 @@ def create_llm_client(
     elif provider == "google":
         if not settings.google_api_key:
             raise ValueError("GOOGLE_API_KEY is required")
+        from .ai.google_client import GoogleClient
 
         client = GoogleClient(
             api_key=settings.google_api_key,
@@ -126,6 +217,8 @@ def create_llm_client(
         )
 
     elif provider == "ollama":
+        from .ai.ollama_client import OllamaClient
+
         client = OllamaClient(
             model=config.llm.model,
             host=config.llm.ollama_host,
@@ -137,18 +230,46 @@ def create_llm_client(
     else:
         raise ValueError(f"Unsupported LLM provider: {provider}")
 
-    # キャラクター設定を適用
-    if character:
-        client.set_character(character)
-
     logger.info(f"Created LLM client: {provider}/{config.llm.model}")
     return client
 
 
-def create_tts_engine(config: AppConfig, settings: Settings) -> BaseTTSEngine:
+def create_tts_engine(
+    config: AppConfig,
+    settings: Settings,
+    cache: Optional[ClientCache] = None,
+) -> BaseTTSEngine:
     """
     設定からTTSエンジンを作成
 
+    cacheを渡した場合、同じ設定で作成済みのエンジンがあればそれを返す。
+
+    Args:
+        config: アプリケーション設定
+        settings: 環境変数設定
+        cache: 生成済みクライアントのキャッシュ（オプション）
+
+    Returns:
+        TTSエンジン
+
+    Raises:
+        ValueError: 未対応のエンジンまたはAPIキー未設定の場合
+    """
+    if cache is None:
+        return _create_tts_engine(config, settings)
+
+    key = ("tts", _config_digest(config.tts, settings))
+    engine = cache.get(key)
+    if engine is None:
+        engine = _create_tts_engine(config, settings)
+        cache[key] = engine
+    return engine
+
+
+def _create_tts_engine(config: AppConfig, settings: Settings) -> BaseTTSEngine:
+    """
+    設定からTTSエンジンを新規作成
+
     Args:
         config: アプリケーション設定
         settings: 環境変数設定
@@ -162,6 +283,8 @@ def create_tts_engine(config: AppConfig, settings: Settings) -> BaseTTSEngine:
     engine = config.tts.engine.lower()
 
     if engine == "voicevox":
+        from .tts.voicevox import VoicevoxEngine
+
         return VoicevoxEngine(
             host=config.tts.host,
             port=config.tts.port,
@@ -173,6 +296,8 @@ def create_tts_engine(config: AppConfig, settings: Settings) -> BaseTTSEngine:
         )
 
     elif engine == "coeiroink":
+        from .tts.coeiroink import CoeiroinkEngine
+
         # COEIROINKのデフォルトポートは50032
         port = config.tts.port if config.tts.port != 50021 else 50032
         return CoeiroinkEngine(
@@ -186,6 +311,8 @@ def create_tts_engine(config: AppConfig, settings: Settings) -> BaseTTSEngine:
         )
 
     elif engine == "style_bert_vits":
+        from .tts.style_bert_vits import StyleBertVitsEngine
+
         # Style-Bert-VITS2のデフォルトポートは5000
         port = config.tts.port if config.tts.port != 50021 else 5000
         return StyleBertVitsEngine(
@@ -203,6 +330,7 @@ def create_tts_engine(config: AppConfig, settings: Settings) -> BaseTTSEngine:
             raise ValueError("NIJIVOICE_API_KEY is required")
         if not config.tts.nijivoice_actor_id:
             raise ValueError("Nijivoice actor_id is required")
+        from .tts.nijivoice import NijivoiceEngine
 
         return NijivoiceEngine(
             api_key=settings.nijivoice_api_key,
@@ -219,12 +347,16 @@ def create_tts_engine(config: AppConfig, settings: Settings) -> BaseTTSEngine:
 
 def create_avatar_controller(
     config: AppConfig,
+    cache: Optional[ClientCache] = None,
 ) -> Optional[BaseAvatarController]:
     """
     設定からアバターコントローラーを作成
 
+    cacheを渡した場合、同じ設定で作成済みのコントローラーがあればそれを返す。
+
     Args:
         config: アプリケーション設定
+        cache: 生成済みクライアントのキャッシュ（オプション）
 
     Returns:
         アバターコントローラー（無効の場合はNone）
@@ -233,6 +365,14 @@ def create_avatar_controller(
         logger.info("Avatar control is disabled")
         return None
 
+    key = ("avatar", _config_digest(config.avatar))
+    if cache is not None:
+        controller = cache.get(key)
+        if controller is not None:
+            return controller
+
+    from .avatar.vtube_studio import VTubeStudioController
+
     controller = VTubeStudioController(
         host=config.avatar.host,
         port=config.avatar.port,
@@ -243,4 +383,6 @@ def create_avatar_controller(
     logger.info(
         f"Created VTube Studio controller: {config.avatar.host}:{config.avatar.port}"
     )
+    if cache is not None:
+        cache[key] = controller
     return controller
@@ -5,17 +5,17 @@ import logging
 import signal
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from .config import load_config, settings, AppConfig
-from .ai.character import Character
-from .ai.openai_client import OpenAIClient
-from .avatar.vtube_studio import VTubeStudioController
-from .chat.youtube_chat import YouTubeChatClient
-from .pipeline import AITuberPipeline
-from .tts.voicevox import VoicevoxEngine
-from .dashboard import DashboardServer
-from .memory import LongTermMemory, MemoryRetriever
+
+# Subsystems are imported where they are used so that `--help` and
+# disabled features do not pay for loading them
+if TYPE_CHECKING:
+    from .avatar.vtube_studio import VTubeStudioController
+    from .dashboard import DashboardServer
+    from .memory import LongTermMemory, MemoryRetriever
+    from .pipeline import AITuberPipeline
 
 
 def setup_logging(config: AppConfig) -> None:
@@ -40,7 +40,7 @@ def setup_logging(config: AppConfig) -> None:
     )
 
 
-async def create_pipeline(config: AppConfig) -> AITuberPipeline:
+async def create_pipeline(config: AppConfig) -> "AITuberPipeline":
     """Create and configure the AITuber pipeline.
 
     Args:
@@ -63,6 +63,8 @@ async def create_pipeline(config: AppConfig) -> AITuberPipeline:
                 "YouTube video_id is required. "
                 "Set it in config/config.yaml or via command line."
             )
+        from .chat.youtube_chat import YouTubeChatClient
+
         chat_client = YouTubeChatClient(config.platform.video_id)
     else:
         raise ValueError(f"Unsupported platform: {config.platform.name}")
@@ -71,6 +73,8 @@ async def create_pipeline(config: AppConfig) -> AITuberPipeline:
     logger.info(f"Initializing LLM client: {config.llm.provider}")
 
     if config.llm.provider == "openai":
+        from .ai.openai_client import OpenAIClient
+
         llm_client = OpenAIClient(
             model=config.llm.model,
             temperature=config.llm.temperature,
@@ -83,6 +87,8 @@ async def create_pipeline(config: AppConfig) -> AITuberPipeline:
     logger.info(f"Loading character from: {config.character_file}")
 
     if config.character_file.exists():
+        from .ai.character import Character
+
         character = Character.from_yaml(config.character_file)
         llm_client.set_character(character)
         logger.info(f"Loaded character: {character.name}")
@@ -96,6 +102,8 @@ async def create_pipeline(config: AppConfig) -> AITuberPipeline:
     logger.info(f"Initializing TTS engine: {config.tts.engine}")
 
     if config.tts.engine == "voicevox":
+        from .tts.voicevox import VoicevoxEngine
+
         tts_engine = VoicevoxEngine(
             host=config.tts.host,
             port=config.tts.port,
@@ -106,10 +114,12 @@ async def create_pipeline(config: AppConfig) -> AITuberPipeline:
         raise ValueError(f"Unsupported TTS engine: {config.tts.engine}")
 
     # Initialize avatar controller (optional)
-    avatar_controller: Optional[VTubeStudioController] = None
+    avatar_controller: Optional["VTubeStudioController"] = None
 
     if config.avatar.enabled:
         logger.info("Initializing avatar controller")
+        from .avatar.vtube_studio import VTubeStudioController
+
         avatar_controller = VTubeStudioController(
             host=config.avatar.host,
             port=config.avatar.port,
@@ -123,6 +133,8 @@ async def create_pipeline(config: AppConfig) -> AITuberPipeline:
         logger.info(f"Loading NG words from: {config.comment.ng_words_file}")
 
     # Create pipeline
+    from .pipeline import AITuberPipeline
+
     pipeline = AITuberPipeline(
         chat_client=chat_client,
         llm_client=llm_client,
@@ -130,19 +142,42 @@ async def create_pipeline(config: AppConfig) -> AITuberPipeline:
         avatar_controller=avatar_controller,
         response_interval=config.comment.response_interval,
         speaker_id=config.tts.speaker_id,
+        tts_warmup=config.tts.warmup,
+        tts_lookahead=config.tts.lookahead,
+        llm_timeout=config.llm.timeout,
     )
 
+    # Cache responses to repeated comments (optional)
+    if config.response_cache.enabled:
+        from .ai.response_cache import ResponseCache
+
+        cache_encoder = None
+        if config.response_cache.embedding_model:
+            from .memory.embeddings import TextEncoder
+
+            cache_encoder = TextEncoder(config.response_cache.embedding_model)
+
+        logger.info("Enabling response cache")
+        pipeline.response_cache = ResponseCache(
+            max_entries=config.response_cache.max_entries,
+            max_bytes=config.response_cache.max_size_mb * 1024 * 1024,
+            encoder=cache_encoder,
+            similarity_threshold=config.response_cache.similarity_threshold,
+        )
+
     return pipeline
 
 
-async def main_async(config_path: Optional[Path] = None) -> None:
+async def main_async(config: Union[AppConfig, Path, None] = None) -> None:
     """Async main entry point.
 
     Args:
-        config_path: Optional path to config file.
+        config: Loaded configuration, or an optional path to the config
+            file to load.
     """
-    # Load configuration
-    config = load_config(config_path or Path("config/config.yaml"))
+    # Load configuration unless the caller already did
+    if not isinstance(config, AppConfig):
+        config = load_config(config or Path("config/config.yaml"))
 
     # Setup logging
     setup_logging(config)
@@ -163,8 +198,10 @@ async def main_async(config_path: Optional[Path] = None) -> None:
     pipeline = await create_pipeline(config)
 
     # Initialize dashboard server (if enabled)
-    dashboard: Optional[DashboardServer] = None
+    dashboard: Optional["DashboardServer"] = None
     if config.dashboard.enabled:
+        from .dashboard import DashboardServer
+
         logger.info(f"Starting dashboard at http://{config.dashboard.host}:{config.dashboard.port}")
         dashboard = DashboardServer(
             host=config.dashboard.host,
@@ -173,14 +210,26 @@ async def main_async(config_path: Optional[Path] = None) -> None:
         dashboard.set_pipeline(pipeline)
 
     # Initialize long-term memory (if enabled)
-    memory_store: Optional[LongTermMemory] = None
-    memory_retriever: Optional[MemoryRetriever] = None
+    memory_store: Optional["LongTermMemory"] = None
+    memory_retriever: Optional["MemoryRetriever"] = None
     if config.memory.enabled:
+        from .memory import LongTermMemory, MemoryRetriever
+        from .memory.retriever import RetrievalConfig
+
+        encoder = None
+        if config.memory.embedding_model:
+            from .memory.embeddings import TextEncoder
+
+            encoder = TextEncoder(config.memory.embedding_model)
+
         logger.info(f"Initializing long-term memory at {config.memory.db_path}")
-        memory_store = LongTermMemory(db_path=config.memory.db_path)
+        memory_store = LongTermMemory(
+            db_path=config.memory.db_path,
+            encoder=encoder,
+            embedding_quantization=config.memory.embedding_quantization,
+        )
         await memory_store.initialize()
 
-        from .memory.retriever import RetrievalConfig
         retriever_config = RetrievalConfig(
             max_results=config.memory.max_results,
             relevance_threshold=config.memory.relevance_threshold,
@@ -205,7 +254,7 @@ async def main_async(config_path: Optional[Path] = None) -> None:
     if sys.platform != "win32":
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, lambda s=sig: signal_handler(s))
+            loop.add_signal_handler(sig, signal_handler, sig)
 
     # Start services
     try:
@@ -216,20 +265,18 @@ async def main_async(config_path: Optional[Path] = None) -> None:
 
         # Run until shutdown signal
         pipeline_task = asyncio.create_task(pipeline.start())
+        shutdown_task = asyncio.create_task(shutdown_event.wait())
 
         # Wait for either pipeline to finish or shutdown signal
         done, pending = await asyncio.wait(
-            [pipeline_task, asyncio.create_task(shutdown_event.wait())],
+            {pipeline_task, shutdown_task},
             return_when=asyncio.FIRST_COMPLETED,
         )
 
-        # Cancel pending tasks
+        # Cancel pending tasks and wait for all of them at once
         for task in pending:
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        await asyncio.gather(*pending, return_exceptions=True)
 
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
@@ -287,7 +334,7 @@ def main() -> None:
 
     # Run
     try:
-        asyncio.run(main_async(args.config))
+        asyncio.run(main_async(config))
     except KeyboardInterrupt:
         pass
 
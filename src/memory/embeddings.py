@@ -0,0 +1,310 @@
+"""Embedding-based similarity search for long-term memory."""
+
+import logging
+from collections.abc import Sequence
+from typing import Literal, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Multilingual model that handles Japanese and English chat
+DEFAULT_EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+Quantization = Literal["fp32", "binary"]
+
+# Set bits per byte value, for NumPy versions without np.bitwise_count
+_POPCOUNT_TABLE = np.array(
+    [bin(value).count("1") for value in range(256)], dtype=np.uint8
+)
+
+
+def _hamming_distances(bits: np.ndarray, query_bits: np.ndarray) -> np.ndarray:
+    """Count differing bits between each row and a query.
+
+    Args:
+        bits: Packed bits, one row per vector, row width a multiple of 8 bytes.
+        query_bits: Packed query bits of the same width.
+
+    Returns:
+        Hamming distance of each row.
+    """
+    xor = bits ^ query_bits
+    if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+        return np.bitwise_count(xor.view(np.uint64)).sum(axis=1)
+    return _POPCOUNT_TABLE[xor].sum(axis=1)
+
+
+class TextEncoder:
+    """Encodes text into L2-normalized embedding vectors.
+
+    Wraps a sentence-transformers model. Because the vectors are
+    normalized, their dot product is the cosine similarity.
+
+    Args:
+        model_name: sentence-transformers model name or path.
+        device: Device to run the model on (e.g. "cpu", "cuda").
+
+    Example:
+        ```python
+        encoder = TextEncoder()
+        memory = LongTermMemory("data/memory.db", encoder=encoder)
+        ```
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        device: Optional[str] = None,
+    ) -> None:
+        """Load the embedding model.
+
+        Args:
+            model_name: sentence-transformers model name or path.
+            device: Device to run the model on.
+
+        Raises:
+            ImportError: If sentence-transformers is not installed.
+        """
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "sentence-transformers is required for embedding search. "
+                "Install with: pip install sentence-transformers"
+            ) from e
+
+        self.model_name = model_name
+        self._model = SentenceTransformer(model_name, device=device)
+        self.dimension: int = self._model.get_sentence_embedding_dimension()
+        logger.info(f"Loaded embedding model {model_name} ({self.dimension} dims)")
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Encode texts into embedding vectors.
+
+        Args:
+            texts: Texts to encode.
+
+        Returns:
+            float32 array of shape (len(texts), dimension) with unit-length rows.
+        """
+        vectors = self._model.encode(
+            list(texts),
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(vectors, dtype=np.float32)
+
+
+class EmbeddingIndex:
+    """In-memory matrix of memory embeddings for cosine top-k search.
+
+    Rows are kept contiguous in a preallocated buffer that grows by
+    doubling; removing a row moves the last row into its place. A search is
+    a single matrix-vector product followed by a partial sort.
+
+    With binary quantization the index also keeps the sign bit of every
+    component. Searches then rank all rows by Hamming distance and compute
+    exact cosine similarities only for the closest candidates, which is
+    faster on large indexes but may miss some matches.
+
+    Args:
+        dimension: Length of each embedding vector.
+        quantization: "fp32" for exact search or "binary" for sign-bit
+            candidate selection with exact rescoring.
+    """
+
+    INITIAL_CAPACITY = 256
+
+    # Candidates rescored per requested result with binary quantization
+    BINARY_RESCORE_FACTOR = 10
+
+    def __init__(self, dimension: int, quantization: Quantization = "fp32") -> None:
+        """Initialize an empty index.
+
+        Args:
+            dimension: Length of each embedding vector.
+            quantization: "fp32" or "binary".
+
+        Raises:
+            ValueError: If the quantization is not supported.
+        """
+        if quantization not in ("fp32", "binary"):
+            raise ValueError(f"Unsupported quantization: {quantization}")
+
+        self.dimension = dimension
+        self.quantization = quantization
+        self._size = 0
+        self._vectors = np.empty((self.INITIAL_CAPACITY, dimension), dtype=np.float32)
+        # Packed sign bits, padded to whole 64-bit words
+        self._bits: Optional[np.ndarray] = None
+        if quantization == "binary":
+            row_bytes = -(-dimension // 64) * 8
+            self._bits = np.zeros((self.INITIAL_CAPACITY, row_bytes), dtype=np.uint8)
+        # Per-row filter values, kept in step with the vector rows
+        self._memory_types = np.empty(self.INITIAL_CAPACITY, dtype=object)
+        self._user_names = np.empty(self.INITIAL_CAPACITY, dtype=object)
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed entries."""
+        return self._size
+
+    def __contains__(self, entry_id: object) -> bool:
+        """Check whether an entry is indexed."""
+        return entry_id in self._positions
+
+    def add(
+        self,
+        entry_ids: Sequence[str],
+        vectors: np.ndarray,
+        memory_types: Sequence[str],
+        user_names: Sequence[Optional[str]],
+    ) -> None:
+        """Add or replace entries in the index.
+
+        Args:
+            entry_ids: Memory entry IDs.
+            vectors: Normalized vectors, one row per entry.
+            memory_types: Memory type value of each entry.
+            user_names: User name of each entry.
+        """
+        self._reserve(self._size + len(entry_ids))
+        for entry_id, vector, memory_type, user_name in zip(
+            entry_ids, vectors, memory_types, user_names
+        ):
+            position = self._positions.get(entry_id)
+            if position is None:
+                position = self._size
+                self._size += 1
+                self._ids.append(entry_id)
+                self._positions[entry_id] = position
+            self._vectors[position] = vector
+            if self._bits is not None:
+                self._bits[position] = self._pack_bits(vector)
+            self._memory_types[position] = memory_type
+            self._user_names[position] = user_name
+
+    def remove(self, entry_ids: Sequence[str]) -> None:
+        """Remove entries from the index, ignoring unknown IDs.
+
+        Args:
+            entry_ids: Memory entry IDs to remove.
+        """
+        for entry_id in entry_ids:
+            position = self._positions.pop(entry_id, None)
+            if position is None:
+                continue
+
+            last = self._size - 1
+            if position != last:
+                moved_id = self._ids[last]
+                self._vectors[position] = self._vectors[last]
+                if self._bits is not None:
+                    self._bits[position] = self._bits[last]
+                self._memory_types[position] = self._memory_types[last]
+                self._user_names[position] = self._user_names[last]
+                self._ids[position] = moved_id
+                self._positions[moved_id] = position
+
+            self._ids.pop()
+            self._memory_types[last] = None
+            self._user_names[last] = None
+            self._size = last
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int,
+        memory_type: Optional[str] = None,
+        user_name: Optional[str] = None,
+    ) -> list[tuple[str, float]]:
+        """Find the entries most similar to a query vector.
+
+        Args:
+            query: Normalized query vector.
+            k: Maximum number of results.
+            memory_type: Only match entries with this memory type value.
+            user_name: Only match entries from this user.
+
+        Returns:
+            (entry ID, cosine similarity) pairs, most similar first.
+        """
+        size = self._size
+        if size == 0 or k <= 0:
+            return []
+
+        # Rows excluded by the filters, or None when nothing is filtered
+        excluded = None
+        if memory_type is not None:
+            excluded = self._memory_types[:size] != memory_type
+        if user_name is not None:
+            mismatched = self._user_names[:size] != user_name
+            excluded = mismatched if excluded is None else excluded | mismatched
+
+        candidate_count = k * self.BINARY_RESCORE_FACTOR
+        if self._bits is not None and size > candidate_count:
+            distances = _hamming_distances(self._bits[:size], self._pack_bits(query))
+            if excluded is not None:
+                distances[excluded] = self.dimension + 1
+            candidates = np.argpartition(distances, candidate_count - 1)
+            candidates = candidates[:candidate_count]
+            similarities = self._vectors[candidates] @ query
+            if excluded is not None:
+                similarities[excluded[candidates]] = -np.inf
+        else:
+            candidates = None
+            similarities = self._vectors[:size] @ query
+            if excluded is not None:
+                similarities[excluded] = -np.inf
+
+        k = min(k, len(similarities))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top], kind="stable")]
+        positions = top if candidates is None else candidates[top]
+        return [
+            (self._ids[position], float(similarity))
+            for position, similarity in zip(positions, similarities[top])
+            if similarity != -np.inf
+        ]
+
+    def _pack_bits(self, vector: np.ndarray) -> np.ndarray:
+        """Pack the sign bits of a vector into a padded byte row.
+
+        Args:
+            vector: Embedding vector.
+
+        Returns:
+            uint8 row matching the width of the stored bits.
+        """
+        row = np.zeros(self._bits.shape[1], dtype=np.uint8)
+        packed = np.packbits(vector > 0)
+        row[: len(packed)] = packed
+        return row
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the buffers to hold at least the given number of rows.
+
+        Args:
+            capacity: Required number of rows.
+        """
+        current = len(self._vectors)
+        if capacity <= current:
+            return
+
+        new_capacity = max(capacity, current * 2)
+        vectors = np.empty((new_capacity, self.dimension), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        self._vectors = vectors
+
+        if self._bits is not None:
+            bits = np.zeros((new_capacity, self._bits.shape[1]), dtype=np.uint8)
+            bits[: self._size] = self._bits[: self._size]
+            self._bits = bits
+
+        for name in ("_memory_types", "_user_names"):
+            values = np.empty(new_capacity, dtype=object)
+            values[: self._size] = getattr(self, name)[: self._size]
+            setattr(self, name, values)
@@ -1,26 +1,228 @@
 """SQLite-based long-term memory storage."""
 
 import asyncio
+import copy
+import dataclasses
 import json
 import logging
 import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, TypeVar
 
+import numpy as np
+
+from .embeddings import EmbeddingIndex, Quantization, TextEncoder
 from .models import Importance, MemoryEntry, MemoryType, UserProfile
 
+try:
+    import orjson
+except ImportError:  # Optional dependency (pip install orjson)
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a JSON column value.
+
+    Uses orjson when available. Both paths write non-ASCII characters
+    as-is so the stored text is the same either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_loads(text: Optional[str], default: Any) -> Any:
+    """Deserialize a JSON column value, returning default for empty values."""
+    if not text:
+        return default
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@contextmanager
+def _transaction(connection: sqlite3.Connection) -> Iterator[None]:
+    """Run the enclosed statements in one explicit write transaction.
+
+    The connection is in autocommit mode, so single statements commit on
+    their own; use this only to group several writes.
+
+    Args:
+        connection: The SQLite connection.
+    """
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+# Memory columns in the order _entry_to_params() writes them and
+# _row_to_entry() unpacks them. Selecting them explicitly keeps the order
+# fixed even if columns are added to the table later.
+_MEMORY_COLUMN_NAMES = (
+    "id",
+    "memory_type",
+    "content",
+    "user_name",
+    "keywords",
+    "importance",
+    "emotion",
+    "timestamp",
+    "last_accessed",
+    "access_count",
+    "metadata",
+)
+_MEMORY_COLUMNS = ", ".join(_MEMORY_COLUMN_NAMES)
+
+_INSERT_MEMORY_SQL = f"""
+    INSERT OR REPLACE INTO memories ({_MEMORY_COLUMNS})
+    VALUES ({", ".join("?" * len(_MEMORY_COLUMN_NAMES))})
+"""
+
+_GET_MEMORY_SQL = f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id = ?"
+
+_UPDATE_ACCESS_SQL = """
+    UPDATE memories
+    SET last_accessed = ?, access_count = access_count + ?
+    WHERE id = ?
+"""
+
+_SEARCH_BY_USER_SQL = f"""
+    SELECT {_MEMORY_COLUMNS} FROM memories
+    WHERE user_name = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_GET_RECENT_SQL = f"""
+    SELECT {_MEMORY_COLUMNS} FROM memories
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_GET_RECENT_BY_TYPE_SQL = f"""
+    SELECT {_MEMORY_COLUMNS} FROM memories
+    WHERE memory_type = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_DELETE_MEMORY_SQL = "DELETE FROM memories WHERE id = ?"
+
+# Memory counts per type plus the profile count, which is tagged with a NULL
+# type (memory_type is NOT NULL, so the marker cannot collide)
+_GET_STATS_SQL = """
+    SELECT memory_type, COUNT(*) AS count FROM memories GROUP BY memory_type
+    UNION ALL
+    SELECT NULL, COUNT(*) FROM user_profiles
+"""
+
+_UPSERT_EMBEDDING_SQL = """
+    INSERT OR REPLACE INTO memory_embeddings (id, model, vector)
+    VALUES (?, ?, ?)
+"""
+
+# Every memory with its stored embedding for the given model, if any
+_LOAD_EMBEDDINGS_SQL = """
+    SELECT m.id, m.memory_type, m.user_name, m.content, e.vector
+    FROM memories m
+    LEFT JOIN memory_embeddings e ON e.id = m.id AND e.model = ?
+"""
+
+_GET_PROFILE_SQL = "SELECT * FROM user_profiles WHERE user_name = ?"
+
+_UPSERT_PROFILE_SQL = """
+    INSERT OR REPLACE INTO user_profiles
+    (user_name, first_seen, last_seen, interaction_count, topics, preferences, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Importance values ordered from lowest to highest
+_IMPORTANCE_LEVELS = [importance.value for importance in Importance]
+
+# Search filter per minimum importance: its level index and the values at
+# or above it, so search() needs no per-call lookup or slicing
+_IMPORTANCE_FILTERS: dict[Importance, tuple[int, tuple[str, ...]]] = {
+    importance: (level, tuple(_IMPORTANCE_LEVELS[level:]))
+    for level, importance in enumerate(Importance)
+}
+
+# Enum members by stored value; a dict lookup is much cheaper than calling
+# the Enum class for every row
+_MEMORY_TYPE_BY_VALUE = {memory_type.value: memory_type for memory_type in MemoryType}
+_IMPORTANCE_BY_VALUE = {importance.value: importance for importance in Importance}
+
+
+def _build_search_sql(
+    has_memory_type: bool,
+    has_user_name: bool,
+    min_level: Optional[int],
+) -> str:
+    """Build the full-text search statement for one combination of filters.
+
+    Args:
+        has_memory_type: Whether to filter by memory type.
+        has_user_name: Whether to filter by user name.
+        min_level: Index of the minimum importance level, or None.
+
+    Returns:
+        SQL statement with placeholders in the order query, memory type,
+        user name, importance values, limit.
+    """
+    columns = ", ".join(f"m.{name}" for name in _MEMORY_COLUMN_NAMES)
+    sql = f"""
+        SELECT {columns} FROM memories m
+        JOIN memories_fts ON m.rowid = memories_fts.rowid
+        WHERE memories_fts MATCH ?
+    """
+    if has_memory_type:
+        sql += " AND m.memory_type = ?"
+    if has_user_name:
+        sql += " AND m.user_name = ?"
+    if min_level is not None:
+        placeholders = ",".join("?" * (len(_IMPORTANCE_LEVELS) - min_level))
+        sql += f" AND m.importance IN ({placeholders})"
+    return sql + " ORDER BY rank LIMIT ?"
+
+
+# Every search statement variant, built once so the SQL text is identical
+# across calls and hits sqlite3's statement cache
+_SEARCH_SQL: dict[tuple[bool, bool, Optional[int]], str] = {
+    (has_memory_type, has_user_name, min_level): _build_search_sql(
+        has_memory_type, has_user_name, min_level
+    )
+    for has_memory_type in (False, True)
+    for has_user_name in (False, True)
+    for min_level in (None, *range(len(_IMPORTANCE_LEVELS)))
+}
+
 
 class LongTermMemory:
     """SQLite-based long-term memory storage.
 
     This class provides persistent storage for conversation history,
     user information, and other memories that should persist across sessions.
+    All database access runs on a single worker thread, so queries never
+    block the event loop and never run concurrently with each other.
 
     Args:
         db_path: Path to the SQLite database file.
+        encoder: Optional text encoder that enables search_similar().
+        embedding_quantization: Embedding index quantization, "fp32" for
+            exact search or "binary" for faster approximate search.
 
     Example:
         ```python
@@ -40,99 +242,412 @@ class LongTermMemory:
         ```
     """
 
-    def __init__(self, db_path: str = "data/memory.db") -> None:
+    # Seconds between access tracking flushes, and the number of pending
+    # entries that triggers an early flush
+    ACCESS_FLUSH_INTERVAL = 5.0
+    ACCESS_FLUSH_THRESHOLD = 100
+
+    # Seconds between WAL checkpoints that truncate the -wal file
+    CHECKPOINT_INTERVAL = 300.0
+
+    # Seconds after initialize() before refreshing query planner statistics
+    OPTIMIZE_DELAY = 10.0
+
+    # Number of recently stored entry fingerprints kept to skip unchanged
+    # re-stores
+    STORED_FINGERPRINT_CACHE_SIZE = 4096
+
+    # Seconds a get_stats() result is reused while nothing is written
+    STATS_CACHE_TTL = 1.0
+
+    # Number of user profiles kept in memory for repeat viewers
+    PROFILE_CACHE_SIZE = 512
+
+    # Number of memories encoded per batch
+    EMBEDDING_BATCH_SIZE = 64
+
+    # Seconds new memories wait to be encoded together with later writes
+    EMBEDDING_FLUSH_DELAY = 0.1
+
+    def __init__(
+        self,
+        db_path: str = "data/memory.db",
+        encoder: Optional[TextEncoder] = None,
+        embedding_quantization: Quantization = "fp32",
+    ) -> None:
         """Initialize the long-term memory store.
 
         Args:
             db_path: Path to the SQLite database file.
+            encoder: Optional text encoder that enables search_similar().
+            embedding_quantization: Embedding index quantization.
         """
         self.db_path = Path(db_path)
         self._connection: Optional[sqlite3.Connection] = None
-        self._lock = asyncio.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Embeddings of every memory, loaded on initialize() when an encoder
+        # is configured. Only touched on the worker thread.
+        self._encoder = encoder
+        self._embedding_quantization = embedding_quantization
+        self._embedding_index: Optional[EmbeddingIndex] = None
+
+        # Stored memories waiting to be encoded, by ID. Only touched on the
+        # worker thread and encoded in batches shortly after being queued,
+        # before any embedding search, or on close.
+        self._pending_embeddings: dict[str, MemoryEntry] = {}
+        self._embedding_task: Optional[asyncio.Task] = None
+
+        # Pending access tracking updates: entry ID -> (count, last accessed).
+        # Only touched on the worker thread and written back in batches.
+        self._access_buffer: dict[str, tuple[int, str]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        self._optimize_task: Optional[asyncio.Task] = None
+
+        # Recently used user profiles, least recently used first. Only
+        # touched on the worker thread and updated after each commit.
+        self._profile_cache: OrderedDict[str, UserProfile] = OrderedDict()
+
+        # Fingerprints of recently stored entries by ID, least recently
+        # stored first. Only touched on the worker thread.
+        self._stored_fingerprints: OrderedDict[str, tuple] = OrderedDict()
+
+        # Last get_stats() result as (monotonic time, stats). Set and
+        # cleared on the worker thread; any write clears it.
+        self._stats_cache: Optional[tuple[float, dict]] = None
 
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking database function on the worker thread.
+
+        Args:
+            func: Function to run.
+            *args: Positional arguments for the function.
+
+        Returns:
+            The function's return value.
+
+        Raises:
+            RuntimeError: If the memory store is not initialized.
+        """
+        if self._executor is None:
+            raise RuntimeError("Memory not initialized")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _require_connection(self) -> sqlite3.Connection:
+        """Get the open database connection.
+
+        Returns:
+            The SQLite connection.
+
+        Raises:
+            RuntimeError: If the memory store is not initialized.
+        """
+        if not self._connection:
+            raise RuntimeError("Memory not initialized")
+        return self._connection
+
     async def initialize(self) -> None:
         """Initialize the database and create tables."""
-        async with self._lock:
-            self._connection = sqlite3.connect(
-                str(self.db_path),
-                check_same_thread=False,
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="long-term-memory",
             )
-            self._connection.row_factory = sqlite3.Row
-
-            # Create tables
-            self._connection.executescript(
-                """
-                -- Memory entries table
-                CREATE TABLE IF NOT EXISTS memories (
-                    id TEXT PRIMARY KEY,
-                    memory_type TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    user_name TEXT,
-                    keywords TEXT,
-                    importance TEXT DEFAULT 'medium',
-                    emotion TEXT,
-                    timestamp TEXT NOT NULL,
-                    last_accessed TEXT,
-                    access_count INTEGER DEFAULT 0,
-                    metadata TEXT
-                );
-
-                -- Index for faster searches
-                CREATE INDEX IF NOT EXISTS idx_memories_user ON memories(user_name);
-                CREATE INDEX IF NOT EXISTS idx_memories_type ON memories(memory_type);
-                CREATE INDEX IF NOT EXISTS idx_memories_timestamp ON memories(timestamp);
-
-                -- User profiles table
-                CREATE TABLE IF NOT EXISTS user_profiles (
-                    user_name TEXT PRIMARY KEY,
-                    first_seen TEXT NOT NULL,
-                    last_seen TEXT NOT NULL,
-                    interaction_count INTEGER DEFAULT 0,
-                    topics TEXT,
-                    preferences TEXT,
-                    notes TEXT
-                );
-
-                -- Full-text search table
-                CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
-                    content,
-                    keywords,
-                    content='memories',
-                    content_rowid='rowid'
-                );
-
-                -- Triggers to keep FTS in sync
-                CREATE TRIGGER IF NOT EXISTS memories_ai AFTER INSERT ON memories BEGIN
-                    INSERT INTO memories_fts(rowid, content, keywords)
-                    VALUES (new.rowid, new.content, new.keywords);
-                END;
-
-                CREATE TRIGGER IF NOT EXISTS memories_ad AFTER DELETE ON memories BEGIN
-                    INSERT INTO memories_fts(memories_fts, rowid, content, keywords)
-                    VALUES ('delete', old.rowid, old.content, old.keywords);
-                END;
-
-                CREATE TRIGGER IF NOT EXISTS memories_au AFTER UPDATE ON memories BEGIN
-                    INSERT INTO memories_fts(memories_fts, rowid, content, keywords)
-                    VALUES ('delete', old.rowid, old.content, old.keywords);
-                    INSERT INTO memories_fts(rowid, content, keywords)
-                    VALUES (new.rowid, new.content, new.keywords);
-                END;
-                """
+        await self._run(self._initialize_sync)
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_access_periodically())
+        if self._checkpoint_task is None:
+            self._checkpoint_task = asyncio.create_task(self._checkpoint_periodically())
+        if self._optimize_task is None:
+            self._optimize_task = asyncio.create_task(self._optimize_in_background())
+
+    def _initialize_sync(self) -> None:
+        """Open the database and create tables."""
+        self._connection = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            # Autocommit: single writes commit by themselves and batches
+            # use explicit transactions via _transaction()
+            isolation_level=None,
+        )
+        self._connection.row_factory = sqlite3.Row
+
+        # WAL lets readers run alongside the writer, and synchronous=NORMAL
+        # only fsyncs at checkpoints. A power loss can drop the most recent
+        # commits, but the database itself stays consistent.
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-64000;
+            """
+        )
+
+        # Create tables
+        self._connection.executescript(
+            """
+            -- Memory entries table
+            CREATE TABLE IF NOT EXISTS memories (
+                id TEXT PRIMARY KEY,
+                memory_type TEXT NOT NULL,
+                content TEXT NOT NULL,
+                user_name TEXT,
+                keywords TEXT,
+                importance TEXT DEFAULT 'medium',
+                emotion TEXT,
+                timestamp TEXT NOT NULL,
+                last_accessed TEXT,
+                access_count INTEGER DEFAULT 0,
+                metadata TEXT
+            );
+
+            -- Index for faster searches
+            CREATE INDEX IF NOT EXISTS idx_memories_user ON memories(user_name);
+            CREATE INDEX IF NOT EXISTS idx_memories_type ON memories(memory_type);
+            CREATE INDEX IF NOT EXISTS idx_memories_timestamp ON memories(timestamp);
+
+            -- User profiles table
+            CREATE TABLE IF NOT EXISTS user_profiles (
+                user_name TEXT PRIMARY KEY,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                interaction_count INTEGER DEFAULT 0,
+                topics TEXT,
+                preferences TEXT,
+                notes TEXT
+            );
+
+            -- Full-text search table
+            CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+                content,
+                keywords,
+                content='memories',
+                content_rowid='rowid'
+            );
+
+            -- Triggers to keep FTS in sync
+            CREATE TRIGGER IF NOT EXISTS memories_ai AFTER INSERT ON memories BEGIN
+                INSERT INTO memories_fts(rowid, content, keywords)
+                VALUES (new.rowid, new.content, new.keywords);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS memories_ad AFTER DELETE ON memories BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, content, keywords)
+                VALUES ('delete', old.rowid, old.content, old.keywords);
+            END;
+
+            -- Embedding vectors per memory, tagged with the encoder model
+            CREATE TABLE IF NOT EXISTS memory_embeddings (
+                id TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL
+            );
+
+            CREATE TRIGGER IF NOT EXISTS memories_embedding_ad
+            AFTER DELETE ON memories BEGIN
+                DELETE FROM memory_embeddings WHERE id = old.id;
+            END;
+
+            -- Only reindex when indexed columns change, so access tracking
+            -- updates do not rewrite the FTS index (replaces the older
+            -- trigger that fired on every UPDATE)
+            DROP TRIGGER IF EXISTS memories_au;
+            CREATE TRIGGER memories_au
+            AFTER UPDATE OF content, keywords ON memories BEGIN
+                INSERT INTO memories_fts(memories_fts, rowid, content, keywords)
+                VALUES ('delete', old.rowid, old.content, old.keywords);
+                INSERT INTO memories_fts(rowid, content, keywords)
+                VALUES (new.rowid, new.content, new.keywords);
+            END;
+            """
+        )
+
+        if self._encoder is not None:
+            self._load_embeddings_sync()
+
+        logger.info(f"Long-term memory initialized at {self.db_path}")
+
+    def _load_embeddings_sync(self) -> None:
+        """Load stored embeddings and encode memories that have none yet.
+
+        Vectors stored for a different model or dimension are re-encoded.
+        """
+        connection = self._require_connection()
+        encoder = self._encoder
+        index = EmbeddingIndex(encoder.dimension, self._embedding_quantization)
+        vector_size = encoder.dimension * np.dtype(np.float32).itemsize
+
+        loaded = []
+        missing = []
+        for entry_id, memory_type, user_name, content, vector in connection.execute(
+            _LOAD_EMBEDDINGS_SQL, (encoder.model_name,)
+        ):
+            if vector is not None and len(vector) == vector_size:
+                loaded.append((entry_id, memory_type, user_name, vector))
+            else:
+                missing.append((entry_id, memory_type, user_name, content))
+
+        if loaded:
+            ids, memory_types, user_names, vectors = zip(*loaded)
+            matrix = np.frombuffer(b"".join(vectors), dtype=np.float32)
+            index.add(
+                ids,
+                matrix.reshape(len(ids), encoder.dimension),
+                memory_types,
+                user_names,
+            )
+
+        for start in range(0, len(missing), self.EMBEDDING_BATCH_SIZE):
+            batch = missing[start : start + self.EMBEDDING_BATCH_SIZE]
+            ids, memory_types, user_names, contents = zip(*batch)
+            vectors = encoder.encode(contents)
+            with _transaction(connection):
+                connection.executemany(
+                    _UPSERT_EMBEDDING_SQL,
+                    [
+                        (entry_id, encoder.model_name, vector.tobytes())
+                        for entry_id, vector in zip(ids, vectors)
+                    ],
+                )
+            index.add(ids, vectors, memory_types, user_names)
+
+        if missing:
+            logger.info(f"Encoded embeddings for {len(missing)} memories")
+        self._embedding_index = index
+
+    @property
+    def has_embeddings(self) -> bool:
+        """Whether embedding similarity search is available."""
+        return self._encoder is not None
+
+    def _queue_embeddings(self, entries: list[MemoryEntry]) -> None:
+        """Queue committed entries for encoding if an encoder is configured.
+
+        The queue is encoded right away once it holds a full batch.
+
+        Args:
+            entries: Entries to encode.
+        """
+        if self._encoder is None:
+            return
+        for entry in entries:
+            self._pending_embeddings[entry.id] = entry
+        if len(self._pending_embeddings) >= self.EMBEDDING_BATCH_SIZE:
+            self._flush_embeddings_sync()
+
+    def _schedule_embedding_flush(self) -> None:
+        """Encode queued entries after a short delay, unless already scheduled."""
+        if self._encoder is not None and self._embedding_task is None:
+            self._embedding_task = asyncio.create_task(self._flush_embeddings_later())
+
+    async def _flush_embeddings_later(self) -> None:
+        """Encode queued entries once nearby writes have been queued too."""
+        await asyncio.sleep(self.EMBEDDING_FLUSH_DELAY)
+        # Writes queued from here on schedule another flush
+        self._embedding_task = None
+        try:
+            await self._run(self._flush_embeddings_sync)
+        except Exception as e:
+            logger.error(f"Failed to encode memory embeddings: {e}")
+
+    def _flush_embeddings_sync(self) -> None:
+        """Encode queued entries in batches, then store and index them."""
+        if not self._pending_embeddings or not self._connection:
+            return
+
+        pending = list(self._pending_embeddings.values())
+        self._pending_embeddings = {}
+        for start in range(0, len(pending), self.EMBEDDING_BATCH_SIZE):
+            batch = pending[start : start + self.EMBEDDING_BATCH_SIZE]
+            vectors = self._encoder.encode([entry.content for entry in batch])
+            with _transaction(self._connection):
+                self._write_embeddings(self._connection, batch, vectors)
+            self._index_embeddings(batch, vectors)
+
+    def _write_embeddings(
+        self,
+        connection: sqlite3.Connection,
+        entries: list[MemoryEntry],
+        vectors: np.ndarray,
+    ) -> None:
+        """Store entry embeddings in the current transaction.
+
+        Args:
+            connection: The SQLite connection.
+            entries: Entries the vectors belong to.
+            vectors: One vector per entry.
+        """
+        model = self._encoder.model_name
+        connection.executemany(
+            _UPSERT_EMBEDDING_SQL,
+            [
+                (entry.id, model, vector.tobytes())
+                for entry, vector in zip(entries, vectors)
+            ],
+        )
+
+    def _index_embeddings(
+        self, entries: list[MemoryEntry], vectors: np.ndarray
+    ) -> None:
+        """Add committed entry embeddings to the in-memory index.
+
+        Args:
+            entries: Entries the vectors belong to.
+            vectors: One vector per entry.
+        """
+        if self._embedding_index is not None:
+            self._embedding_index.add(
+                [entry.id for entry in entries],
+                vectors,
+                [entry.memory_type.value for entry in entries],
+                [entry.user_name for entry in entries],
             )
-            self._connection.commit()
-            logger.info(f"Long-term memory initialized at {self.db_path}")
 
     async def close(self) -> None:
         """Close the database connection."""
-        async with self._lock:
-            if self._connection:
-                self._connection.close()
-                self._connection = None
-                logger.info("Long-term memory closed")
+        if self._executor is None:
+            return
+
+        for task in (
+            self._flush_task,
+            self._checkpoint_task,
+            self._optimize_task,
+            self._embedding_task,
+        ):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._flush_task = None
+        self._checkpoint_task = None
+        self._optimize_task = None
+        self._embedding_task = None
+
+        await self._run(self._close_sync)
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    def _close_sync(self) -> None:
+        """Close the database connection."""
+        if self._connection:
+            self._flush_access_sync()
+            self._flush_embeddings_sync()
+            self._profile_cache.clear()
+            self._stored_fingerprints.clear()
+            self._embedding_index = None
+            self._connection.close()
+            self._connection = None
+            logger.info("Long-term memory closed")
 
     async def store(self, entry: MemoryEntry) -> str:
         """Store a memory entry.
@@ -143,36 +658,71 @@ class LongTermMemory:
         Returns:
             The ID of the stored entry.
         """
-        async with self._lock:
-            if not self._connection:
-                raise RuntimeError("Memory not initialized")
-
-            self._connection.execute(
-                """
-                INSERT OR REPLACE INTO memories
-                (id, memory_type, content, user_name, keywords, importance,
-                 emotion, timestamp, last_accessed, access_count, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    entry.id,
-                    entry.memory_type.value,
-                    entry.content,
-                    entry.user_name,
-                    json.dumps(entry.keywords),
-                    entry.importance.value,
-                    entry.emotion,
-                    entry.timestamp.isoformat(),
-                    entry.last_accessed.isoformat() if entry.last_accessed else None,
-                    entry.access_count,
-                    json.dumps(entry.metadata),
-                ),
-            )
-            self._connection.commit()
+        entry_id = await self._run(self._store_sync, entry)
+        self._schedule_embedding_flush()
+        return entry_id
 
-            logger.debug(f"Stored memory: {entry.id[:8]}...")
+    def _store_sync(self, entry: MemoryEntry) -> str:
+        """Blocking implementation of store()."""
+        connection = self._require_connection()
+
+        # Storing an unchanged entry again (e.g. on a retry) is a no-op, so
+        # skip the serialization and the write
+        fingerprint = self._entry_fingerprint(entry)
+        if self._stored_fingerprints.get(entry.id) == fingerprint:
             return entry.id
 
+        self._insert_entry(connection, entry)
+        self._queue_embeddings([entry])
+
+        self._stored_fingerprints[entry.id] = fingerprint
+        self._stored_fingerprints.move_to_end(entry.id)
+        if len(self._stored_fingerprints) > self.STORED_FINGERPRINT_CACHE_SIZE:
+            self._stored_fingerprints.popitem(last=False)
+
+        logger.debug(f"Stored memory: {entry.id[:8]}...")
+        return entry.id
+
+    def _insert_entry(self, connection: sqlite3.Connection, entry: MemoryEntry) -> None:
+        """Insert or replace a memory entry in the current transaction, if any.
+
+        Args:
+            connection: The SQLite connection.
+            entry: The memory entry to write.
+        """
+        connection.execute(_INSERT_MEMORY_SQL, self._entry_to_params(entry))
+        self._stats_cache = None
+
+    async def store_many(self, entries: list[MemoryEntry]) -> list[str]:
+        """Store multiple memory entries in a single transaction.
+
+        Args:
+            entries: The memory entries to store.
+
+        Returns:
+            The IDs of the stored entries, in input order.
+        """
+        if not entries:
+            return []
+        entry_ids = await self._run(self._store_many_sync, entries)
+        self._schedule_embedding_flush()
+        return entry_ids
+
+    def _store_many_sync(self, entries: list[MemoryEntry]) -> list[str]:
+        """Blocking implementation of store_many()."""
+        connection = self._require_connection()
+
+        params = [self._entry_to_params(entry) for entry in entries]
+        with _transaction(connection):
+            connection.executemany(_INSERT_MEMORY_SQL, params)
+        self._queue_embeddings(entries)
+        self._stats_cache = None
+        for entry in entries:
+            self._stored_fingerprints.pop(entry.id, None)
+
+        logger.debug(f"Stored {len(entries)} memories")
+        return [entry.id for entry in entries]
+
     async def get(self, entry_id: str) -> Optional[MemoryEntry]:
         """Get a memory entry by ID.
 
@@ -182,31 +732,89 @@ class LongTermMemory:
         Returns:
             The memory entry, or None if not found.
         """
-        async with self._lock:
-            if not self._connection:
-                raise RuntimeError("Memory not initialized")
-
-            cursor = self._connection.execute(
-                "SELECT * FROM memories WHERE id = ?",
-                (entry_id,),
-            )
-            row = cursor.fetchone()
-
-            if not row:
-                return None
-
-            # Update access tracking
-            self._connection.execute(
-                """
-                UPDATE memories
-                SET last_accessed = ?, access_count = access_count + 1
-                WHERE id = ?
-                """,
-                (datetime.now().isoformat(), entry_id),
+        return await self._run(self._get_sync, entry_id)
+
+    def _get_sync(self, entry_id: str) -> Optional[MemoryEntry]:
+        """Blocking implementation of get()."""
+        connection = self._require_connection()
+
+        cursor = connection.execute(_GET_MEMORY_SQL, (entry_id,))
+        row = cursor.fetchone()
+
+        if not row:
+            return None
+
+        # Record the access; it is written back with the next flush
+        count, _ = self._access_buffer.get(entry_id, (0, ""))
+        self._access_buffer[entry_id] = (count + 1, datetime.now().isoformat())
+        if len(self._access_buffer) >= self.ACCESS_FLUSH_THRESHOLD:
+            self._flush_access_sync()
+
+        return self._row_to_entry(row)
+
+    async def _flush_access_periodically(self) -> None:
+        """Write buffered access tracking back to the database periodically."""
+        while True:
+            await asyncio.sleep(self.ACCESS_FLUSH_INTERVAL)
+            try:
+                await self._run(self._flush_access_sync)
+            except Exception as e:
+                logger.error(f"Failed to flush memory access tracking: {e}")
+
+    async def _checkpoint_periodically(self) -> None:
+        """Checkpoint the write-ahead log periodically so it does not grow."""
+        while True:
+            await asyncio.sleep(self.CHECKPOINT_INTERVAL)
+            try:
+                await self._run(self._checkpoint_sync)
+            except Exception as e:
+                logger.error(f"Failed to checkpoint memory database: {e}")
+
+    def _checkpoint_sync(self) -> None:
+        """Copy the write-ahead log into the database and truncate it."""
+        if self._connection:
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    async def _optimize_in_background(self) -> None:
+        """Refresh query planner statistics once the store has warmed up."""
+        await asyncio.sleep(self.OPTIMIZE_DELAY)
+        try:
+            await self._run(self._optimize_sync)
+        except Exception as e:
+            logger.error(f"Failed to optimize memory database: {e}")
+
+    def _optimize_sync(self) -> None:
+        """Let SQLite re-analyze tables whose statistics are out of date."""
+        if self._connection:
+            self._connection.execute("PRAGMA optimize")
+
+    async def analyze(self) -> None:
+        """Recompute query planner statistics for all tables and indexes.
+
+        Unlike the automatic ``PRAGMA optimize`` after startup, this always
+        runs a full ``ANALYZE``, which can take a while on large databases.
+        """
+        await self._run(self._analyze_sync)
+
+    def _analyze_sync(self) -> None:
+        """Blocking implementation of analyze()."""
+        self._require_connection().execute("ANALYZE")
+
+    def _flush_access_sync(self) -> None:
+        """Write buffered access tracking updates in one batch."""
+        if not self._access_buffer or not self._connection:
+            return
+
+        pending = self._access_buffer
+        self._access_buffer = {}
+        with _transaction(self._connection):
+            self._connection.executemany(
+                _UPDATE_ACCESS_SQL,
+                [
+                    (last_accessed, count, entry_id)
+                    for entry_id, (count, last_accessed) in pending.items()
+                ],
             )
-            self._connection.commit()
-
-            return self._row_to_entry(row)
 
     async def search(
         self,
@@ -228,41 +836,106 @@ class LongTermMemory:
         Returns:
             List of matching memory entries.
         """
-        async with self._lock:
-            if not self._connection:
-                raise RuntimeError("Memory not initialized")
-
-            # Build query
-            sql = """
-                SELECT m.* FROM memories m
-                JOIN memories_fts ON m.rowid = memories_fts.rowid
-                WHERE memories_fts MATCH ?
-            """
-            params: list = [query]
-
-            if memory_type:
-                sql += " AND m.memory_type = ?"
-                params.append(memory_type.value)
-
-            if user_name:
-                sql += " AND m.user_name = ?"
-                params.append(user_name)
-
-            if min_importance:
-                importance_order = {"low": 0, "medium": 1, "high": 2, "critical": 3}
-                min_level = importance_order.get(min_importance.value, 0)
-                sql += f" AND m.importance IN ({','.join('?' * (4 - min_level))})"
-                params.extend(
-                    [i.value for i in Importance][min_level:]
-                )
+        return await self._run(
+            self._search_sync, query, limit, memory_type, user_name, min_importance
+        )
+
+    def _search_sync(
+        self,
+        query: str,
+        limit: int,
+        memory_type: Optional[MemoryType],
+        user_name: Optional[str],
+        min_importance: Optional[Importance],
+    ) -> list[MemoryEntry]:
+        """Blocking implementation of search()."""
+        connection = self._require_connection()
+
+        params: list = [query]
+
+        if memory_type:
+            params.append(memory_type.value)
+
+        if user_name:
+            params.append(user_name)
+
+        min_level = None
+        if min_importance:
+            min_level, levels = _IMPORTANCE_FILTERS[min_importance]
+            params.extend(levels)
+
+        params.append(limit)
+
+        sql = _SEARCH_SQL[(bool(memory_type), bool(user_name), min_level)]
+        cursor = connection.execute(sql, params)
+        rows = cursor.fetchall()
+
+        return [self._row_to_entry(row) for row in rows]
+
+    async def search_similar(
+        self,
+        query: str,
+        limit: int = 10,
+        memory_type: Optional[MemoryType] = None,
+        user_name: Optional[str] = None,
+    ) -> list[tuple[MemoryEntry, float]]:
+        """Search for memories by embedding similarity.
 
-            sql += " ORDER BY rank LIMIT ?"
-            params.append(limit)
+        Requires an encoder to be configured.
 
-            cursor = self._connection.execute(sql, params)
-            rows = cursor.fetchall()
+        Args:
+            query: Text to compare memories against.
+            limit: Maximum number of results.
+            memory_type: Filter by memory type.
+            user_name: Filter by user name.
 
-            return [self._row_to_entry(row) for row in rows]
+        Returns:
+            (entry, cosine similarity) pairs, most similar first.
+
+        Raises:
+            RuntimeError: If no encoder is configured.
+        """
+        if self._encoder is None:
+            raise RuntimeError("Embedding search requires an encoder")
+        return await self._run(
+            self._search_similar_sync, query, limit, memory_type, user_name
+        )
+
+    def _search_similar_sync(
+        self,
+        query: str,
+        limit: int,
+        memory_type: Optional[MemoryType],
+        user_name: Optional[str],
+    ) -> list[tuple[MemoryEntry, float]]:
+        """Blocking implementation of search_similar()."""
+        connection = self._require_connection()
+
+        # Make recently stored memories searchable
+        self._flush_embeddings_sync()
+
+        query_vector = self._encoder.encode([query])[0]
+        hits = self._embedding_index.search(
+            query_vector,
+            limit,
+            memory_type=memory_type.value if memory_type else None,
+            user_name=user_name,
+        )
+        if not hits:
+            return []
+
+        placeholders = ",".join("?" * len(hits))
+        cursor = connection.execute(
+            f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id IN ({placeholders})",
+            [entry_id for entry_id, _ in hits],
+        )
+        entries = {entry.id: entry for entry in map(self._row_to_entry, cursor)}
+
+        return [
+            (entries[entry_id], similarity)
+            for entry_id, similarity in hits
+            if entry_id in entries
+        ]
 
     async def search_by_user(
         self,
@@ -278,22 +951,16 @@ class LongTermMemory:
         Returns:
             List of memory entries for the user.
         """
-        async with self._lock:
-            if not self._connection:
-                raise RuntimeError("Memory not initialized")
-
-            cursor = self._connection.execute(
-                """
-                SELECT * FROM memories
-                WHERE user_name = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (user_name, limit),
-            )
-            rows = cursor.fetchall()
+        return await self._run(self._search_by_user_sync, user_name, limit)
+
+    def _search_by_user_sync(self, user_name: str, limit: int) -> list[MemoryEntry]:
+        """Blocking implementation of search_by_user()."""
+        connection = self._require_connection()
 
-            return [self._row_to_entry(row) for row in rows]
+        cursor = connection.execute(_SEARCH_BY_USER_SQL, (user_name, limit))
+        rows = cursor.fetchall()
+
+        return [self._row_to_entry(row) for row in rows]
 
     async def get_recent(
         self,
@@ -309,32 +976,25 @@ class LongTermMemory:
         Returns:
             List of recent memory entries.
         """
-        async with self._lock:
-            if not self._connection:
-                raise RuntimeError("Memory not initialized")
-
-            if memory_type:
-                cursor = self._connection.execute(
-                    """
-                    SELECT * FROM memories
-                    WHERE memory_type = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                    """,
-                    (memory_type.value, limit),
-                )
-            else:
-                cursor = self._connection.execute(
-                    """
-                    SELECT * FROM memories
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                    """,
-                    (limit,),
-                )
+        return await self._run(self._get_recent_sync, limit, memory_type)
 
-            rows = cursor.fetchall()
-            return [self._row_to_entry(row) for row in rows]
+    def _get_recent_sync(
+        self,
+        limit: int,
+        memory_type: Optional[MemoryType],
+    ) -> list[MemoryEntry]:
+        """Blocking implementation of get_recent()."""
+        connection = self._require_connection()
+
+        if memory_type:
+            cursor = connection.execute(
+                _GET_RECENT_BY_TYPE_SQL, (memory_type.value, limit)
+            )
+        else:
+            cursor = connection.execute(_GET_RECENT_SQL, (limit,))
+
+        rows = cursor.fetchall()
+        return [self._row_to_entry(row) for row in rows]
 
     async def delete(self, entry_id: str) -> bool:
         """Delete a memory entry.
@@ -345,17 +1005,51 @@ class LongTermMemory:
         Returns:
             True if deleted, False if not found.
         """
-        async with self._lock:
-            if not self._connection:
-                raise RuntimeError("Memory not initialized")
+        return await self._run(self._delete_sync, entry_id)
+
+    def _delete_sync(self, entry_id: str) -> bool:
+        """Blocking implementation of delete()."""
+        connection = self._require_connection()
+
+        cursor = connection.execute(_DELETE_MEMORY_SQL, (entry_id,))
+        self._stored_fingerprints.pop(entry_id, None)
+        self._pending_embeddings.pop(entry_id, None)
+        if self._embedding_index is not None:
+            self._embedding_index.remove([entry_id])
+        self._stats_cache = None
 
-            cursor = self._connection.execute(
-                "DELETE FROM memories WHERE id = ?",
-                (entry_id,),
+        return cursor.rowcount > 0
+
+    async def delete_many(self, entry_ids: list[str]) -> int:
+        """Delete multiple memory entries in a single transaction.
+
+        Args:
+            entry_ids: The IDs of the entries to delete.
+
+        Returns:
+            Number of entries deleted.
+        """
+        if not entry_ids:
+            return 0
+        return await self._run(self._delete_many_sync, entry_ids)
+
+    def _delete_many_sync(self, entry_ids: list[str]) -> int:
+        """Blocking implementation of delete_many()."""
+        connection = self._require_connection()
+
+        with _transaction(connection):
+            cursor = connection.executemany(
+                _DELETE_MEMORY_SQL,
+                [(entry_id,) for entry_id in entry_ids],
             )
-            self._connection.commit()
+        self._stats_cache = None
+        for entry_id in entry_ids:
+            self._stored_fingerprints.pop(entry_id, None)
+            self._pending_embeddings.pop(entry_id, None)
+        if self._embedding_index is not None:
+            self._embedding_index.remove(entry_ids)
 
-            return cursor.rowcount > 0
+        return cursor.rowcount
 
     async def get_user_profile(self, user_name: str) -> Optional[UserProfile]:
         """Get a user's profile.
@@ -366,28 +1060,50 @@ class LongTermMemory:
         Returns:
             The user profile, or None if not found.
         """
-        async with self._lock:
-            if not self._connection:
-                raise RuntimeError("Memory not initialized")
+        profile = await self._run(self._get_user_profile_sync, user_name)
+        # Hand out a copy so callers cannot modify the cached profile
+        return copy.deepcopy(profile)
 
-            cursor = self._connection.execute(
-                "SELECT * FROM user_profiles WHERE user_name = ?",
-                (user_name,),
-            )
-            row = cursor.fetchone()
-
-            if not row:
-                return None
-
-            return UserProfile(
-                user_name=row["user_name"],
-                first_seen=datetime.fromisoformat(row["first_seen"]),
-                last_seen=datetime.fromisoformat(row["last_seen"]),
-                interaction_count=row["interaction_count"],
-                topics=json.loads(row["topics"] or "[]"),
-                preferences=json.loads(row["preferences"] or "{}"),
-                notes=json.loads(row["notes"] or "[]"),
-            )
+    def _get_user_profile_sync(self, user_name: str) -> Optional[UserProfile]:
+        """Blocking implementation of get_user_profile().
+
+        Returns the cached instance, which must not be modified in place.
+        """
+        profile = self._profile_cache.get(user_name)
+        if profile is not None:
+            self._profile_cache.move_to_end(user_name)
+            return profile
+
+        connection = self._require_connection()
+
+        cursor = connection.execute(_GET_PROFILE_SQL, (user_name,))
+        row = cursor.fetchone()
+
+        if not row:
+            return None
+
+        profile = UserProfile(
+            user_name=row["user_name"],
+            first_seen=datetime.fromisoformat(row["first_seen"]),
+            last_seen=datetime.fromisoformat(row["last_seen"]),
+            interaction_count=row["interaction_count"],
+            topics=_json_loads(row["topics"], []),
+            preferences=_json_loads(row["preferences"], {}),
+            notes=_json_loads(row["notes"], []),
+        )
+        self._cache_user_profile(profile)
+        return profile
+
+    def _cache_user_profile(self, profile: UserProfile) -> None:
+        """Add a profile to the LRU cache, evicting the oldest if full.
+
+        Args:
+            profile: The user profile to cache.
+        """
+        self._profile_cache[profile.user_name] = profile
+        self._profile_cache.move_to_end(profile.user_name)
+        if len(self._profile_cache) > self.PROFILE_CACHE_SIZE:
+            self._profile_cache.popitem(last=False)
 
     async def update_user_profile(self, profile: UserProfile) -> None:
         """Update or create a user profile.
@@ -395,27 +1111,39 @@ class LongTermMemory:
         Args:
             profile: The user profile to save.
         """
-        async with self._lock:
-            if not self._connection:
-                raise RuntimeError("Memory not initialized")
-
-            self._connection.execute(
-                """
-                INSERT OR REPLACE INTO user_profiles
-                (user_name, first_seen, last_seen, interaction_count, topics, preferences, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    profile.user_name,
-                    profile.first_seen.isoformat(),
-                    profile.last_seen.isoformat(),
-                    profile.interaction_count,
-                    json.dumps(profile.topics),
-                    json.dumps(profile.preferences),
-                    json.dumps(profile.notes),
-                ),
-            )
-            self._connection.commit()
+        await self._run(self._update_user_profile_sync, copy.deepcopy(profile))
+
+    def _update_user_profile_sync(self, profile: UserProfile) -> None:
+        """Blocking implementation of update_user_profile()."""
+        connection = self._require_connection()
+
+        self._upsert_user_profile(connection, profile)
+        self._cache_user_profile(profile)
+
+    def _upsert_user_profile(
+        self,
+        connection: sqlite3.Connection,
+        profile: UserProfile,
+    ) -> None:
+        """Insert or replace a user profile in the current transaction, if any.
+
+        Args:
+            connection: The SQLite connection.
+            profile: The user profile to write.
+        """
+        connection.execute(
+            _UPSERT_PROFILE_SQL,
+            (
+                profile.user_name,
+                profile.first_seen.isoformat(),
+                profile.last_seen.isoformat(),
+                profile.interaction_count,
+                _json_dumps(profile.topics),
+                _json_dumps(profile.preferences),
+                _json_dumps(profile.notes),
+            ),
+        )
+        self._stats_cache = None
 
     async def record_interaction(
         self,
@@ -427,7 +1155,7 @@ class LongTermMemory:
         """Record a conversation interaction.
 
         This is a convenience method that creates a memory entry
-        and updates the user profile.
+        and updates the user profile in a single transaction.
 
         Args:
             user_name: The user's name.
@@ -438,9 +1166,11 @@ class LongTermMemory:
         Returns:
             The ID of the created memory entry.
         """
-        # Create memory entry
+        # Create memory entry; its timestamp doubles as the profile's
+        # last seen time
         entry = MemoryEntry(
             memory_type=MemoryType.CONVERSATION,
+            timestamp=datetime.now(),
             content=f"{user_name}: {user_message}\nAI: {ai_response}",
             user_name=user_name,
             emotion=emotion,
@@ -449,21 +1179,41 @@ class LongTermMemory:
                 "ai_response": ai_response,
             },
         )
-        entry_id = await self.store(entry)
+        entry_id = await self._run(self._record_interaction_sync, entry)
+        self._schedule_embedding_flush()
+        return entry_id
 
-        # Update user profile
-        profile = await self.get_user_profile(user_name)
-        if profile:
-            profile.last_seen = datetime.now()
-            profile.interaction_count += 1
-        else:
-            profile = UserProfile(
-                user_name=user_name,
-                interaction_count=1,
-            )
-        await self.update_user_profile(profile)
+    def _record_interaction_sync(self, entry: MemoryEntry) -> str:
+        """Blocking implementation of record_interaction()."""
+        connection = self._require_connection()
+        user_name = entry.user_name
+        now = entry.timestamp
+
+        # Commits once on success, rolls back everything on error
+        with _transaction(connection):
+            self._insert_entry(connection, entry)
+
+            # Update user profile (a new instance, so the cached one stays
+            # valid if the transaction rolls back)
+            profile = self._get_user_profile_sync(user_name)
+            if profile:
+                profile = dataclasses.replace(
+                    profile,
+                    last_seen=now,
+                    interaction_count=profile.interaction_count + 1,
+                )
+            else:
+                profile = UserProfile(
+                    user_name=user_name,
+                    first_seen=now,
+                    last_seen=now,
+                    interaction_count=1,
+                )
+            self._upsert_user_profile(connection, profile)
 
-        return entry_id
+        self._queue_embeddings([entry])
+        self._cache_user_profile(profile)
+        return entry.id
 
     async def get_stats(self) -> dict:
         """Get memory statistics.
@@ -471,34 +1221,78 @@ class LongTermMemory:
         Returns:
             Dictionary with memory statistics.
         """
-        async with self._lock:
-            if not self._connection:
-                raise RuntimeError("Memory not initialized")
+        cached = self._stats_cache
+        if cached is None or time.monotonic() - cached[0] >= self.STATS_CACHE_TTL:
+            stats = await self._run(self._get_stats_sync)
+        else:
+            stats = cached[1]
+        return {**stats, "by_type": dict(stats["by_type"])}
+
+    def _get_stats_sync(self) -> dict:
+        """Blocking implementation of get_stats()."""
+        connection = self._require_connection()
+
+        by_type = {}
+        user_count = 0
+        for memory_type, count in connection.execute(_GET_STATS_SQL):
+            if memory_type is None:
+                user_count = count
+            else:
+                by_type[memory_type] = count
 
-            cursor = self._connection.execute(
-                "SELECT COUNT(*) as total FROM memories"
-            )
-            total = cursor.fetchone()["total"]
-
-            cursor = self._connection.execute(
-                """
-                SELECT memory_type, COUNT(*) as count
-                FROM memories
-                GROUP BY memory_type
-                """
-            )
-            by_type = {row["memory_type"]: row["count"] for row in cursor.fetchall()}
+        stats = {
+            "total_entries": sum(by_type.values()),
+            "by_type": by_type,
+            "unique_users": user_count,
+        }
+        self._stats_cache = (time.monotonic(), stats)
+        return stats
 
-            cursor = self._connection.execute(
-                "SELECT COUNT(*) as total FROM user_profiles"
-            )
-            user_count = cursor.fetchone()["total"]
+    def _entry_to_params(self, entry: MemoryEntry) -> tuple:
+        """Convert a MemoryEntry to INSERT parameters.
 
-            return {
-                "total_entries": total,
-                "by_type": by_type,
-                "unique_users": user_count,
-            }
+        Args:
+            entry: The memory entry.
+
+        Returns:
+            Parameter tuple matching the memories column order.
+        """
+        return (
+            entry.id,
+            entry.memory_type.value,
+            entry.content,
+            entry.user_name,
+            _json_dumps(entry.keywords),
+            entry.importance.value,
+            entry.emotion,
+            entry.timestamp.isoformat(),
+            entry.last_accessed.isoformat() if entry.last_accessed else None,
+            entry.access_count,
+            _json_dumps(entry.metadata),
+        )
+
+    @staticmethod
+    def _entry_fingerprint(entry: MemoryEntry) -> tuple:
+        """Build a value that compares equal for entries that store the same.
+
+        Args:
+            entry: The memory entry.
+
+        Returns:
+            Tuple of the entry's stored fields.
+        """
+        return (
+            entry.memory_type,
+            entry.content,
+            entry.user_name,
+            tuple(entry.keywords),
+            entry.importance,
+            entry.emotion,
+            entry.timestamp,
+            entry.last_accessed,
+            entry.access_count,
+            repr(entry.metadata),
+        )
 
     def _row_to_entry(self, row: sqlite3.Row) -> MemoryEntry:
         """Convert a database row to a MemoryEntry.
@@ -509,18 +1303,34 @@ class LongTermMemory:
         Returns:
             MemoryEntry instance.
         """
+        # Positional unpacking is cheaper than looking up each column by
+        # name; the queries select _MEMORY_COLUMN_NAMES in this order
+        (
+            entry_id,
+            memory_type,
+            content,
+            user_name,
+            keywords,
+            importance,
+            emotion,
+            timestamp,
+            last_accessed,
+            access_count,
+            metadata,
+        ) = row
         return MemoryEntry(
-            id=row["id"],
-            memory_type=MemoryType(row["memory_type"]),
-            content=row["content"],
-            user_name=row["user_name"],
-            keywords=json.loads(row["keywords"] or "[]"),
-            importance=Importance(row["importance"]),
-            emotion=row["emotion"],
-            timestamp=datetime.fromisoformat(row["timestamp"]),
-            last_accessed=datetime.fromisoformat(row["last_accessed"])
-            if row["last_accessed"]
+            id=entry_id,
+            memory_type=_MEMORY_TYPE_BY_VALUE.get(memory_type)
+            or MemoryType(memory_type),
+            content=content,
+            user_name=user_name,
+            keywords=_json_loads(keywords, []),
+            importance=_IMPORTANCE_BY_VALUE.get(importance) or Importance(importance),
+            emotion=emotion,
+            timestamp=datetime.fromisoformat(timestamp),
+            last_accessed=datetime.fromisoformat(last_accessed)
+            if last_accessed
             else None,
-            access_count=row["access_count"],
-            metadata=json.loads(row["metadata"] or "{}"),
+            access_count=access_count,
+            metadata=_json_loads(metadata, {}),
         )
@@ -26,7 +26,7 @@ class Importance(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryEntry:
     """A single memory entry.
 
@@ -105,7 +105,7 @@ class MemoryEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MemorySearchResult:
     """Result from a memory search.
 
@@ -132,7 +132,7 @@ class MemorySearchResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """Profile information about a user.
 
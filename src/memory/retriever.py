@@ -1,18 +1,86 @@
 """Memory retrieval system for context-aware responses."""
 
+import asyncio
+import heapq
 import logging
 import re
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
 from .long_term_memory import LongTermMemory
 from .models import Importance, MemoryEntry, MemorySearchResult, MemoryType
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Common words ignored when extracting keywords
+_STOPWORDS = frozenset({
+    "の", "は", "が", "を", "に", "で", "と", "も", "や", "から",
+    "まで", "より", "など", "って", "という", "です", "ます",
+    "だ", "な", "ね", "よ", "か", "い", "う", "え", "お",
+    "the", "a", "an", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "could", "should", "may", "might", "must", "shall",
+    "can", "need", "dare", "ought", "used", "to", "of", "in",
+    "for", "on", "with", "at", "by", "from", "as", "into",
+    "through", "during", "before", "after", "above", "below",
+    "between", "under", "again", "further", "then", "once",
+    "here", "there", "when", "where", "why", "how", "all",
+    "each", "few", "more", "most", "other", "some", "such",
+    "no", "nor", "not", "only", "own", "same", "so", "than",
+    "too", "very", "just", "and", "but", "if", "or", "because",
+    "until", "while", "this", "that", "these", "those", "it",
+})
+
+# Durations in seconds
+_MINUTE = 60
+_HOUR = 60 * _MINUTE
+_DAY = 24 * _HOUR
+_WEEK = 7 * _DAY
+
+# Memory content longer than this is truncated in formatted context
+_MAX_CONTENT_LENGTH = 200
+
+# Recency score by memory age: under an hour, a day, a week, 30 days, older
+_RECENCY_LIMITS = np.array([_HOUR, _DAY, _WEEK, 30 * _DAY], dtype=np.float64)
+_RECENCY_SCORES = np.array([1.0, 0.8, 0.5, 0.3, 0.1])
+
+# Importance score by level, indexed by each member's position in Importance
+_IMPORTANCE_INDEX = {importance: level for level, importance in enumerate(Importance)}
+_IMPORTANCE_SCORES = np.array([0.25, 0.5, 0.75, 1.0])
+
+# Keywords extracted from a query at most
+_MAX_KEYWORDS = 10
+
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Facts stored per message at most
+_MAX_FACTS = 3
+
+# Pattern matching for common fact expressions, each capturing the fact in
+# its first group. The patterns overlap, so each one scans the message
+# separately rather than as one alternation, which would drop overlapping
+# matches.
+_FACT_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), importance)
+    for pattern, importance in [
+        # Japanese patterns
+        (r"(?:私|僕|俺)(?:は|の)(.+?)(?:が好き|が嫌い|です)", Importance.MEDIUM),
+        (r"(.+?)(?:が好き|が嫌い)", Importance.MEDIUM),
+        (r"(?:私|僕|俺)(?:は|の)(.+?)(?:をしている|をやっている)", Importance.MEDIUM),
+        (r"(?:誕生日|たんじょうび)(?:は|が)(.+)", Importance.HIGH),
+        # English patterns
+        (r"(?:I|my)\s+(?:like|love|enjoy)\s+(.+)", Importance.MEDIUM),
+        (r"(?:I|my)\s+(?:hate|dislike)\s+(.+)", Importance.MEDIUM),
+        (r"(?:I am|I'm)\s+(.+)", Importance.MEDIUM),
+        (r"my\s+(?:birthday|name)\s+is\s+(.+)", Importance.HIGH),
+    ]
+]
+
+
+@dataclass(slots=True)
 class RetrievalConfig:
     """Configuration for memory retrieval.
 
@@ -92,8 +160,9 @@ class MemoryRetriever:
 
         # Extract keywords from query
         keywords = self._extract_keywords(query)
+        now = datetime.now()
 
-        if not keywords:
+        if not keywords and not self.memory.has_embeddings:
             # No meaningful keywords, return recent memories
             recent = await self.memory.get_recent(limit=self.config.max_results)
             for entry in recent:
@@ -106,25 +175,54 @@ class MemoryRetriever:
                 )
             return results
 
-        # Search by keywords
+        # Search by embedding similarity when an encoder is configured,
+        # otherwise by keywords
         try:
             search_query = " OR ".join(keywords)
-            for mem_type in memory_types or [None]:
-                entries = await self.memory.search(
-                    query=search_query,
-                    limit=self.config.max_results * 2,
-                    memory_type=mem_type,
-                    user_name=user_name if self.config.user_context_weight > 0 else None,
+            search_user = user_name if self.config.user_context_weight > 0 else None
+            semantic = self.memory.has_embeddings
+            # Run the searches for all memory types concurrently
+            if semantic:
+                searches = [
+                    self.memory.search_similar(
+                        query=query,
+                        limit=self.config.max_results * 2,
+                        memory_type=mem_type,
+                        user_name=search_user,
+                    )
+                    for mem_type in memory_types or [None]
+                ]
+            else:
+                searches = [
+                    self.memory.search(
+                        query=search_query,
+                        limit=self.config.max_results * 2,
+                        memory_type=mem_type,
+                        user_name=search_user,
+                    )
+                    for mem_type in memory_types or [None]
+                ]
+
+            for found in await asyncio.gather(*searches):
+                if semantic:
+                    entries = [entry for entry, _ in found]
+                    similarities = [similarity for _, similarity in found]
+                    match_reason = "semantic_match"
+                else:
+                    entries = found
+                    similarities = None
+                    match_reason = "keyword_match"
+
+                scores = self._score_batch(
+                    entries, keywords, user_name, similarities, now=now
                 )
-
-                for entry in entries:
-                    score = self._calculate_relevance(entry, query, keywords, user_name)
+                for entry, score in zip(entries, scores.tolist()):
                     if score >= self.config.relevance_threshold:
                         results.append(
                             MemorySearchResult(
                                 entry=entry,
                                 relevance_score=score,
-                                match_reason="keyword_match",
+                                match_reason=match_reason,
                             )
                         )
         except Exception as e:
@@ -145,22 +243,26 @@ class MemoryRetriever:
                 user_name,
                 limit=self.config.max_results,
             )
-            for entry in user_memories:
-                # Check if already in results
-                if not any(r.entry.id == entry.id for r in results):
-                    score = self._calculate_relevance(entry, query, keywords, user_name)
-                    score += self.config.user_context_weight * 0.5  # Boost user-specific
-                    results.append(
-                        MemorySearchResult(
-                            entry=entry,
-                            relevance_score=min(score, 1.0),
-                            match_reason="user_context",
-                        )
+            # Skip entries already in results
+            seen_ids = {r.entry.id for r in results}
+            user_memories = [
+                entry for entry in user_memories if entry.id not in seen_ids
+            ]
+            scores = self._score_batch(user_memories, keywords, user_name, now=now)
+            scores += self.config.user_context_weight * 0.5  # Boost user-specific
+            for entry, score in zip(user_memories, np.minimum(scores, 1.0).tolist()):
+                results.append(
+                    MemorySearchResult(
+                        entry=entry,
+                        relevance_score=score,
+                        match_reason="user_context",
                     )
+                )
 
-        # Sort by relevance and limit
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
-        return results[: self.config.max_results]
+        # Keep the most relevant results
+        return heapq.nlargest(
+            self.config.max_results, results, key=lambda x: x.relevance_score
+        )
 
     async def retrieve_context(
         self,
@@ -179,7 +281,15 @@ class MemoryRetriever:
         Returns:
             Formatted context string.
         """
-        results = await self.retrieve(query, user_name)
+        if user_name and self.config.include_user_profile:
+            # Look up the profile while memories are retrieved
+            results, profile = await asyncio.gather(
+                self.retrieve(query, user_name),
+                self.memory.get_user_profile(user_name),
+            )
+        else:
+            results = await self.retrieve(query, user_name)
+            profile = None
 
         if not results:
             return ""
@@ -187,28 +297,17 @@ class MemoryRetriever:
         context_parts = []
 
         # Add user profile if available
-        if user_name and self.config.include_user_profile:
-            profile = await self.memory.get_user_profile(user_name)
-            if profile:
-                profile_str = self._format_user_profile(profile)
-                if profile_str:
-                    context_parts.append(f"[User Info: {user_name}]\n{profile_str}")
+        if profile:
+            profile_str = self._format_user_profile(profile)
+            if profile_str:
+                context_parts.append(f"[User Info: {user_name}]\n{profile_str}")
 
         # Add relevant memories
-        if results:
-            memory_strs = []
-            for result in results:
-                formatted = self._format_memory(result)
-                if formatted:
-                    memory_strs.append(formatted)
-
-            if memory_strs:
-                context_parts.append(
-                    "[Relevant Memories]\n" + "\n".join(memory_strs)
-                )
-
-        if not context_parts:
-            return ""
+        now = datetime.now()
+        context_parts.append(
+            "[Relevant Memories]\n"
+            + "\n".join([self._format_memory(result, now) for result in results])
+        )
 
         return "\n\n".join(context_parts)
 
@@ -268,91 +367,90 @@ class MemoryRetriever:
         Returns:
             List of keywords.
         """
-        # Remove common words and punctuation
-        stopwords = {
-            "の", "は", "が", "を", "に", "で", "と", "も", "や", "から",
-            "まで", "より", "など", "って", "という", "です", "ます",
-            "だ", "な", "ね", "よ", "か", "い", "う", "え", "お",
-            "the", "a", "an", "is", "are", "was", "were", "be", "been",
-            "being", "have", "has", "had", "do", "does", "did", "will",
-            "would", "could", "should", "may", "might", "must", "shall",
-            "can", "need", "dare", "ought", "used", "to", "of", "in",
-            "for", "on", "with", "at", "by", "from", "as", "into",
-            "through", "during", "before", "after", "above", "below",
-            "between", "under", "again", "further", "then", "once",
-            "here", "there", "when", "where", "why", "how", "all",
-            "each", "few", "more", "most", "other", "some", "such",
-            "no", "nor", "not", "only", "own", "same", "so", "than",
-            "too", "very", "just", "and", "but", "if", "or", "because",
-            "until", "while", "this", "that", "these", "those", "it",
-        }
-
-        # Tokenize (simple split for now)
-        words = re.findall(r'\b\w+\b', text.lower())
-
-        # Filter and return
-        keywords = [
-            word for word in words
-            if word not in stopwords and len(word) > 1
-        ]
-
-        return list(set(keywords))[:10]  # Limit to 10 unique keywords
-
-    def _calculate_relevance(
+        # Tokenize (simple split for now), dropping stopwords and keeping
+        # the first unique keywords in order
+        keywords: dict[str, None] = {}
+        for match in _WORD_RE.finditer(text.lower()):
+            word = match.group()
+            if len(word) > 1 and word not in _STOPWORDS and word not in keywords:
+                keywords[word] = None
+                if len(keywords) == _MAX_KEYWORDS:
+                    break
+
+        return list(keywords)
+
+    def _score_batch(
         self,
-        entry: MemoryEntry,
-        query: str,
+        entries: list[MemoryEntry],
         keywords: list[str],
         user_name: Optional[str],
-    ) -> float:
-        """Calculate relevance score for a memory entry.
+        similarities: Optional[list[float]] = None,
+        now: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Calculate relevance scores for memory entries.
 
         Args:
-            entry: The memory entry.
-            query: Original query.
+            entries: The memory entries.
             keywords: Extracted keywords.
             user_name: User name for context.
+            similarities: Embedding similarity of each entry to the query,
+                if known.
+            now: Current time (defaults to datetime.now()).
 
         Returns:
-            Relevance score (0.0 to 1.0).
+            Relevance score of each entry (0.0 to 1.0).
         """
-        score = 0.0
+        count = len(entries)
+        config = self.config
 
-        # Keyword match score
-        entry_text = entry.content.lower()
-        matched_keywords = sum(1 for kw in keywords if kw in entry_text)
-        keyword_score = matched_keywords / max(len(keywords), 1)
-        score += keyword_score * (1.0 - self.config.recency_weight - self.config.importance_weight)
+        # Content match score: embedding similarity when available,
+        # otherwise the share of keywords found in the entry
+        if similarities is not None:
+            match_scores = np.maximum(np.asarray(similarities, dtype=np.float64), 0.0)
+        else:
+            # At most 10 keywords against a short entry: separate substring
+            # scans beat building a per-query Aho-Corasick automaton here.
+            # Lowercase each entry once, not once per keyword.
+            texts = [entry.content.lower() for entry in entries]
+            match_scores = np.fromiter(
+                (sum(1 for kw in keywords if kw in text) for text in texts),
+                dtype=np.float64,
+                count=count,
+            )
+            match_scores /= max(len(keywords), 1)
+        scores = match_scores * (1.0 - config.recency_weight - config.importance_weight)
 
         # Recency score
-        age = datetime.now() - entry.timestamp
-        if age < timedelta(hours=1):
-            recency_score = 1.0
-        elif age < timedelta(days=1):
-            recency_score = 0.8
-        elif age < timedelta(days=7):
-            recency_score = 0.5
-        elif age < timedelta(days=30):
-            recency_score = 0.3
-        else:
-            recency_score = 0.1
-        score += recency_score * self.config.recency_weight
+        now = now or datetime.now()
+        ages = np.fromiter(
+            ((now - entry.timestamp).total_seconds() for entry in entries),
+            dtype=np.float64,
+            count=count,
+        )
+        recency_scores = _RECENCY_SCORES[
+            np.searchsorted(_RECENCY_LIMITS, ages, side="right")
+        ]
+        scores += recency_scores * config.recency_weight
 
         # Importance score
-        importance_scores = {
-            Importance.LOW: 0.25,
-            Importance.MEDIUM: 0.5,
-            Importance.HIGH: 0.75,
-            Importance.CRITICAL: 1.0,
-        }
-        importance_score = importance_scores.get(entry.importance, 0.5)
-        score += importance_score * self.config.importance_weight
+        importance_levels = np.fromiter(
+            (_IMPORTANCE_INDEX[entry.importance] for entry in entries),
+            dtype=np.intp,
+            count=count,
+        )
+        importance_scores = _IMPORTANCE_SCORES[importance_levels]
+        scores += importance_scores * config.importance_weight
 
         # User context bonus
-        if user_name and entry.user_name == user_name:
-            score += self.config.user_context_weight * 0.3
+        if user_name:
+            same_user = np.fromiter(
+                (entry.user_name == user_name for entry in entries),
+                dtype=np.float64,
+                count=count,
+            )
+            scores += same_user * (config.user_context_weight * 0.3)
 
-        return min(score, 1.0)
+        return np.minimum(scores, 1.0)
 
     def _extract_facts(
         self,
@@ -370,49 +468,36 @@ class MemoryRetriever:
         """
         facts = []
 
-        # Pattern matching for common fact expressions
-        patterns = [
-            # Japanese patterns
-            (r"(?:私|僕|俺)(?:は|の)(.+?)(?:が好き|が嫌い|です)", Importance.MEDIUM),
-            (r"(.+?)(?:が好き|が嫌い)", Importance.MEDIUM),
-            (r"(?:私|僕|俺)(?:は|の)(.+?)(?:をしている|をやっている)", Importance.MEDIUM),
-            (r"(?:誕生日|たんじょうび)(?:は|が)(.+)", Importance.HIGH),
-            # English patterns
-            (r"(?:I|my)\s+(?:like|love|enjoy)\s+(.+)", Importance.MEDIUM),
-            (r"(?:I|my)\s+(?:hate|dislike)\s+(.+)", Importance.MEDIUM),
-            (r"(?:I am|I'm)\s+(.+)", Importance.MEDIUM),
-            (r"my\s+(?:birthday|name)\s+is\s+(.+)", Importance.HIGH),
-        ]
-
-        for pattern, importance in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]
-                fact = f"{user_name}: {match.strip()}"
+        for pattern, importance in _FACT_PATTERNS:
+            for match in pattern.finditer(text):
+                fact = f"{user_name}: {match.group(1).strip()}"
                 if len(fact) > 10:  # Minimum length check
                     facts.append((fact, importance))
+                    if len(facts) == _MAX_FACTS:
+                        return facts
 
-        return facts[:3]  # Limit to 3 facts per message
+        return facts
 
-    def _format_memory(self, result: MemorySearchResult) -> str:
+    def _format_memory(
+        self,
+        result: MemorySearchResult,
+        now: Optional[datetime] = None,
+    ) -> str:
         """Format a memory search result for context.
 
         Args:
             result: The search result.
+            now: Current time (defaults to datetime.now()).
 
         Returns:
             Formatted string.
         """
         entry = result.entry
-        time_ago = self._time_ago(entry.timestamp)
-
-        # Truncate content if too long
         content = entry.content
-        if len(content) > 200:
-            content = content[:197] + "..."
+        if len(content) > _MAX_CONTENT_LENGTH:
+            content = f"{content[:_MAX_CONTENT_LENGTH - 3]}..."
 
-        return f"- [{time_ago}] {content}"
+        return f"- [{self._time_ago(entry.timestamp, now)}] {content}"
 
     def _format_user_profile(self, profile) -> str:
         """Format user profile for context.
@@ -439,27 +524,25 @@ class MemoryRetriever:
 
         return "\n".join(parts)
 
-    def _time_ago(self, timestamp: datetime) -> str:
+    def _time_ago(self, timestamp: datetime, now: Optional[datetime] = None) -> str:
         """Format timestamp as relative time.
 
         Args:
             timestamp: The timestamp.
+            now: Current time (defaults to datetime.now()).
 
         Returns:
             Human-readable relative time.
         """
-        delta = datetime.now() - timestamp
+        seconds = ((now or datetime.now()) - timestamp).total_seconds()
 
-        if delta < timedelta(minutes=1):
+        if seconds < _MINUTE:
             return "just now"
-        elif delta < timedelta(hours=1):
-            mins = int(delta.total_seconds() / 60)
-            return f"{mins}m ago"
-        elif delta < timedelta(days=1):
-            hours = int(delta.total_seconds() / 3600)
-            return f"{hours}h ago"
-        elif delta < timedelta(days=7):
-            days = delta.days
-            return f"{days}d ago"
+        elif seconds < _HOUR:
+            return f"{int(seconds // _MINUTE)}m ago"
+        elif seconds < _DAY:
+            return f"{int(seconds // _HOUR)}h ago"
+        elif seconds < _WEEK:
+            return f"{int(seconds // _DAY)}d ago"
         else:
             return timestamp.strftime("%m/%d")
@@ -2,6 +2,10 @@
 
 import asyncio
 import logging
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
 from .ai.base import BaseLLMClient
@@ -13,13 +17,67 @@ from .chat.models import Comment
 from .expression.lip_sync import LipSyncController
 from .expression.emotion_analyzer import EmotionAnalyzer, EmotionExpressionController
 from .tts.base import BaseTTSEngine
+from .tts.models import AudioData
 from .utils.audio import AudioPlayer
 
 if TYPE_CHECKING:
+    from .ai.response_cache import CachedResponse, ResponseCache
     from .memory import LongTermMemory, MemoryRetriever
 
 logger = logging.getLogger(__name__)
 
+# A sentence with its ending punctuation. A parenthetical right after the
+# punctuation, such as "（笑）", stays with the sentence. Punctuation inside
+# brackets only ends the sentence when the brackets close it, so
+# "「すごい！」と言った。" stays in one piece. A period only ends a sentence
+# before whitespace, so "3.5" stays in one piece too.
+_SENTENCE_RE = re.compile(
+    r".*?(?:"
+    r"[。！？!?]+(?:[（(][^（()）]*[）)])?"
+    r"(?:[」』）)]+(?=[\s「『（(]|$))?(?![」』）)])"
+    r"|\.+(?=\s)|$)",
+    re.DOTALL,
+)
+
+# Phrase synthesized at startup to warm up the TTS engine
+_TTS_WARMUP_TEXT = "こんにちは。"
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split text into sentences, keeping their ending punctuation.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        Non-empty sentences in order.
+    """
+    sentences = []
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = match.group().strip()
+        if sentence:
+            sentences.append(sentence)
+    return sentences
+
+
+@dataclass
+class _PreparedResponse:
+    """A generated response waiting to be delivered.
+
+    Attributes:
+        comment: The comment being answered.
+        response: The response text.
+        memory_context: Long-term memory context used for the response.
+        cached: The cached response that was reused, if any.
+        first_audio: Synthesized audio of the first sentence, if any.
+    """
+
+    comment: Comment
+    response: str
+    memory_context: str
+    cached: Optional["CachedResponse"]
+    first_audio: Optional[AudioData]
+
 
 class AITuberPipeline:
     """Main orchestrator for the AITuber system.
@@ -36,8 +94,19 @@ class AITuberPipeline:
         llm_client: LLM client for generating responses.
         tts_engine: TTS engine for voice synthesis.
         avatar_controller: Optional avatar controller for lip sync.
-        response_interval: Minimum time between responses in seconds.
+        response_interval: Minimum time between the starts of two responses
+            in seconds. Time spent generating and playing a response counts
+            toward it, so queued comments are answered back to back once a
+            response takes longer than the interval.
         speaker_id: TTS speaker/voice ID to use.
+        tts_warmup: Whether to synthesize a short phrase on start so the
+            first response does not pay for connection setup and model
+            loading.
+        tts_lookahead: Number of following sentences synthesized while a
+            sentence plays. Values above 1 only help TTS servers that can
+            synthesize several requests in parallel.
+        llm_timeout: Seconds to wait for an LLM response before giving up
+            on the comment, or None to wait indefinitely.
 
     Example:
         ```python
@@ -60,6 +129,9 @@ class AITuberPipeline:
         response_interval: float = 5.0,
         speaker_id: int = 1,
         enable_emotion_analysis: bool = True,
+        tts_warmup: bool = True,
+        tts_lookahead: int = 1,
+        llm_timeout: Optional[float] = 30.0,
     ) -> None:
         """Initialize the AITuber pipeline.
 
@@ -71,6 +143,9 @@ class AITuberPipeline:
             response_interval: Seconds between responses.
             speaker_id: Voice ID for TTS.
             enable_emotion_analysis: Whether to analyze emotions and update expressions.
+            tts_warmup: Whether to warm up the TTS engine on start.
+            tts_lookahead: Sentences synthesized ahead of playback.
+            llm_timeout: Seconds to wait for an LLM response.
         """
         self.chat_client = chat_client
         self.llm_client = llm_client
@@ -79,6 +154,9 @@ class AITuberPipeline:
         self.response_interval = response_interval
         self.speaker_id = speaker_id
         self.enable_emotion_analysis = enable_emotion_analysis
+        self.tts_warmup = tts_warmup
+        self.tts_lookahead = max(1, tts_lookahead)
+        self.llm_timeout = llm_timeout
 
         # Internal components
         self.comment_queue = CommentQueue()
@@ -103,15 +181,23 @@ class AITuberPipeline:
         # State
         self._running = False
         self._tasks: list[asyncio.Task] = []
+        # Event loop time before which the next response may not start
+        self._next_ready_at = 0.0
 
         # Long-term memory (set externally if enabled)
         self.memory_store: Optional["LongTermMemory"] = None
         self.memory_retriever: Optional["MemoryRetriever"] = None
 
+        # Cache of responses to repeated comments (set externally if enabled)
+        self.response_cache: Optional["ResponseCache"] = None
+
         logger.info(
-            f"Initialized AITuberPipeline (interval={response_interval}s, "
-            f"speaker={speaker_id}, avatar={'enabled' if avatar_controller else 'disabled'}, "
-            f"emotion={'enabled' if enable_emotion_analysis else 'disabled'})"
+            "Initialized AITuberPipeline (interval=%ss, speaker=%s, avatar=%s, "
+            "emotion=%s)",
+            response_interval,
+            speaker_id,
+            "enabled" if avatar_controller else "disabled",
+            "enabled" if enable_emotion_analysis else "disabled",
         )
 
     @property
@@ -142,13 +228,15 @@ class AITuberPipeline:
                     await self.avatar_controller.connect()
                     logger.info("Connected to avatar controller")
                 except Exception as e:
-                    logger.warning(f"Avatar connection failed: {e}")
+                    logger.warning("Avatar connection failed: %s", e)
                     self.avatar_controller = None
                     self._lip_sync = None
 
             # Check TTS availability
             if await self.tts_engine.is_available():
                 logger.info("TTS engine is available")
+                if self.tts_warmup:
+                    await self._warm_up_tts()
             else:
                 logger.warning("TTS engine not available")
 
@@ -175,7 +263,7 @@ class AITuberPipeline:
         except asyncio.CancelledError:
             logger.info("Pipeline cancelled")
         except Exception as e:
-            logger.error(f"Pipeline error: {e}", exc_info=True)
+            logger.error("Pipeline error: %s", e, exc_info=True)
             raise
         finally:
             await self.stop()
@@ -187,7 +275,7 @@ class AITuberPipeline:
         except asyncio.CancelledError:
             raise
         except Exception as e:
-            logger.error(f"Task error: {e}", exc_info=True)
+            logger.error("Task error: %s", e, exc_info=True)
             raise
 
     async def stop(self) -> None:
@@ -212,20 +300,29 @@ class AITuberPipeline:
         try:
             await self.chat_client.disconnect()
         except Exception as e:
-            logger.warning(f"Error disconnecting chat: {e}")
+            logger.warning("Error disconnecting chat: %s", e)
 
         if self.avatar_controller:
             try:
                 await self.avatar_controller.disconnect()
             except Exception as e:
-                logger.warning(f"Error disconnecting avatar: {e}")
+                logger.warning("Error disconnecting avatar: %s", e)
+
+        # Close the audio output stream
+        try:
+            await self.audio_player.close()
+        except Exception as e:
+            logger.warning("Error closing audio player: %s", e)
+
+        if self.response_cache is not None:
+            self.response_cache.close()
 
         # Close TTS session if needed
         if hasattr(self.tts_engine, "close"):
             try:
                 await self.tts_engine.close()  # type: ignore
             except Exception as e:
-                logger.warning(f"Error closing TTS: {e}")
+                logger.warning("Error closing TTS: %s", e)
 
         logger.info("AITuber pipeline stopped")
 
@@ -237,31 +334,82 @@ class AITuberPipeline:
         """
         added = await self.comment_queue.push(comment)
         if added:
+            # %.50s truncates only if the record is emitted
             logger.debug(
-                f"Queued comment from {comment.user_name}: "
-                f"{comment.message[:50]}... (priority={comment.priority})"
+                "Queued comment from %s: %.50s... (priority=%s)",
+                comment.user_name,
+                comment.message,
+                comment.priority,
             )
 
-    async def _process_comments(self) -> None:
-        """Process comments from queue continuously."""
-        logger.info("Comment processor started")
+    async def _warm_up_tts(self) -> None:
+        """Synthesize a short phrase and discard it.
 
-        while self._running:
-            try:
-                # Get next comment
-                comment = await self.comment_queue.pop()
+        This opens the connection to the TTS server and lets the engine load
+        its voice model before the first comment arrives.
+        """
+        start = time.perf_counter()
+        try:
+            await self.tts_engine.synthesize(
+                _TTS_WARMUP_TEXT, speaker_id=self.speaker_id
+            )
+        except Exception as e:
+            logger.warning("TTS warm-up failed: %s", e)
+        else:
+            logger.info("TTS warm-up took %.2fs", time.perf_counter() - start)
 
-                if comment:
-                    await self._handle_comment(comment)
+    async def _process_comments(self) -> None:
+        """Process comments from queue continuously.
 
-                # Wait before processing next comment
-                await asyncio.sleep(self.response_interval)
+        While a response plays, the response to the next queued comment is
+        generated and its first sentence synthesized.
+        """
+        logger.info("Comment processor started")
 
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                logger.error(f"Error processing comment: {e}", exc_info=True)
-                await asyncio.sleep(1)  # Brief pause on error
+        loop = asyncio.get_running_loop()
+        next_response: Optional[asyncio.Task] = None
+        try:
+            while self._running:
+                try:
+                    # Get next comment unless it is already being prepared
+                    if next_response is None:
+                        comment = await self.comment_queue.pop()
+                        if comment:
+                            next_response = asyncio.create_task(
+                                self._prepare_response(comment)
+                            )
+
+                    if next_response is not None:
+                        current, next_response = next_response, None
+                        prepared = await current
+
+                        # Prepare the following comment while this one plays
+                        comment = await self.comment_queue.pop()
+                        if comment:
+                            next_response = asyncio.create_task(
+                                self._prepare_response(comment)
+                            )
+
+                        if prepared:
+                            # Keep response starts at least the interval apart
+                            delay = self._next_ready_at - loop.time()
+                            if delay > 0:
+                                await asyncio.sleep(delay)
+                            self._next_ready_at = loop.time() + self.response_interval
+                            await self._deliver_response(prepared)
+
+                    # Wait for new comments when nothing is queued
+                    if next_response is None:
+                        await self.comment_queue.wait()
+
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error("Error processing comment: %s", e, exc_info=True)
+                    await asyncio.sleep(1)  # Brief pause on error
+        finally:
+            if next_response is not None:
+                next_response.cancel()
 
     async def _handle_comment(self, comment: Comment) -> None:
         """Process a single comment through the full pipeline.
@@ -269,6 +417,22 @@ class AITuberPipeline:
         Args:
             comment: The comment to process.
         """
+        prepared = await self._prepare_response(comment)
+        if prepared:
+            await self._deliver_response(prepared)
+
+    async def _prepare_response(self, comment: Comment) -> Optional[_PreparedResponse]:
+        """Generate the response to a comment and synthesize its first sentence.
+
+        Nothing is shown or played, so this can run while another response
+        is being delivered.
+
+        Args:
+            comment: The comment to respond to.
+
+        Returns:
+            The prepared response, or None if generation failed.
+        """
         logger.info(
             "Processing comment from %s: %s",
             comment.user_name,
@@ -276,34 +440,72 @@ class AITuberPipeline:
         )
 
         try:
-            # Step 1: Get context (short-term + long-term memory)
-            formatted_message = f"{comment.user_name}さん: {comment.message}"
-            context = self.memory.get_context()
+            # Reuse the response to a repeated comment if one is cached
+            cached = None
+            if self.response_cache is not None:
+                cached = await self.response_cache.get(comment.message)
 
-            # Retrieve relevant long-term memories if available
             memory_context = ""
-            if self.memory_retriever:
-                try:
-                    memory_context = await self.memory_retriever.retrieve_context(
-                        comment.message,
-                        user_name=comment.user_name,
-                    )
-                except Exception as e:
-                    logger.warning("Long-term memory retrieval failed: %s", e)
-
-            # Step 2: Generate AI response
-            response = await self.llm_client.generate_response(
-                formatted_message,
-                context,
-                additional_context=memory_context if memory_context else None,
-            )
+            if cached is not None:
+                response = cached.response
+                logger.info("Cached AI response: %s", response)
+            else:
+                # Step 1: Get context (short-term + long-term memory)
+                formatted_message = f"{comment.user_name}さん: {comment.message}"
+                context = self.memory.get_context()
+
+                # Retrieve relevant long-term memories if available
+                if self.memory_retriever:
+                    try:
+                        memory_context = await self.memory_retriever.retrieve_context(
+                            comment.message,
+                            user_name=comment.user_name,
+                        )
+                    except Exception as e:
+                        logger.warning("Long-term memory retrieval failed: %s", e)
+
+                # Step 2: Generate AI response
+                response = await self._generate_response(
+                    formatted_message,
+                    context,
+                    additional_context=memory_context if memory_context else None,
+                )
 
-            logger.info("AI response: %s", response)
+                logger.info("AI response: %s", response)
 
             # Update short-term memory
             self.memory.add_user_message(comment.message, comment.user_name)
             self.memory.add_assistant_message(response)
 
+            # Synthesize the first sentence ahead of playback
+            first_audio = None
+            if cached is None:
+                sentences = _split_sentences(response)
+                if sentences:
+                    first_audio = await self._synthesize(sentences[0])
+
+            return _PreparedResponse(
+                comment=comment,
+                response=response,
+                memory_context=memory_context,
+                cached=cached,
+                first_audio=first_audio,
+            )
+
+        except Exception as e:
+            logger.error("Error handling comment: %s", e, exc_info=True)
+            return None
+
+    async def _deliver_response(self, prepared: _PreparedResponse) -> None:
+        """Show, store and speak a prepared response.
+
+        Args:
+            prepared: The prepared response.
+        """
+        comment = prepared.comment
+        response = prepared.response
+
+        try:
             # Step 3: Analyze emotion and update expression
             emotion_str = None
             if self._expression_controller:
@@ -316,42 +518,62 @@ class AITuberPipeline:
                 except Exception as e:
                     logger.warning("Emotion analysis failed: %s", e)
 
-            # Step 4: Store in long-term memory if available
+            # Step 4: Store in long-term memory while the response plays
+            store_task = None
             if self.memory_retriever:
-                try:
-                    await self.memory_retriever.store_interaction(
-                        user_name=comment.user_name,
-                        user_message=comment.message,
-                        ai_response=response,
-                        emotion=emotion_str,
-                    )
-                except Exception as e:
-                    logger.warning("Long-term memory storage failed: %s", e)
-
-            # Step 5: Synthesize speech
-            audio = await self.tts_engine.synthesize(
-                response,
-                speaker_id=self.speaker_id,
-            )
-
-            logger.debug("Synthesized %d bytes of audio", len(audio.data))
-
-            # Step 6: Play audio with lip sync
-            if self._lip_sync and self.avatar_controller:
-                # Run lip sync and audio playback concurrently
-                await asyncio.gather(
-                    self._lip_sync.sync_with_audio(audio.data),
-                    self.audio_player.play(audio.data),
+                store_task = asyncio.create_task(
+                    self._store_interaction(comment, response, emotion_str)
                 )
-            else:
-                # Just play audio
-                await self.audio_player.play(audio.data)
+
+            # Step 5: Synthesize and play speech sentence by sentence
+            try:
+                if prepared.cached is not None:
+                    for audio in prepared.cached.audio:
+                        await self._play_audio(audio)
+                else:
+                    audio_clips = await self._speak(response, prepared.first_audio)
+                    # Responses addressing the viewer or drawing on their
+                    # memories are not reusable for other viewers
+                    if (
+                        self.response_cache is not None
+                        and not prepared.memory_context
+                        and comment.user_name not in response
+                    ):
+                        await self.response_cache.put(
+                            comment.message, response, audio_clips
+                        )
+            finally:
+                if store_task is not None:
+                    await store_task
 
             logger.info("Response delivered successfully")
 
         except Exception as e:
             logger.error("Error handling comment: %s", e, exc_info=True)
 
+    async def _store_interaction(
+        self,
+        comment: Comment,
+        response: str,
+        emotion: Optional[str],
+    ) -> None:
+        """Store an interaction in long-term memory, logging any failure.
+
+        Args:
+            comment: The comment that was answered.
+            response: The response text.
+            emotion: The detected emotion of the response, if any.
+        """
+        try:
+            await self.memory_retriever.store_interaction(
+                user_name=comment.user_name,
+                user_message=comment.message,
+                ai_response=response,
+                emotion=emotion,
+            )
+        except Exception as e:
+            logger.warning("Long-term memory storage failed: %s", e)
+
     async def respond_to_text(self, text: str, user_name: str = "User") -> str:
         """Manually respond to a text input.
 
@@ -364,31 +586,136 @@ class AITuberPipeline:
         Returns:
             The generated response text.
         """
-        logger.info(f"Manual response request: {text}")
+        logger.info("Manual response request: %s", text)
 
         formatted_message = f"{user_name}さん: {text}"
         context = self.memory.get_context()
 
-        response = await self.llm_client.generate_response(
-            formatted_message,
-            context,
-        )
+        response = await self._generate_response(formatted_message, context)
 
         self.memory.add_user_message(text, user_name)
         self.memory.add_assistant_message(response)
 
         # Synthesize and play
-        audio = await self.tts_engine.synthesize(
-            response,
-            speaker_id=self.speaker_id,
-        )
+        await self._speak(response)
 
-        if self._lip_sync and self.avatar_controller:
-            await asyncio.gather(
-                self._lip_sync.sync_with_audio(audio.data),
-                self.audio_player.play(audio.data),
-            )
+        return response
+
+    async def _speak(
+        self,
+        text: str,
+        first_audio: Optional[AudioData] = None,
+    ) -> list[AudioData]:
+        """Synthesize and play text one sentence at a time.
+
+        The following sentences (up to tts_lookahead of them) are
+        synthesized while the current one plays, so speech starts once the
+        first sentence is ready instead of the whole response.
+
+        Args:
+            text: The text to speak.
+            first_audio: Already synthesized audio of the first sentence.
+
+        Returns:
+            The audio played, one clip per sentence.
+        """
+        sentences = _split_sentences(text)
+        if not sentences:
+            return []
+
+        clips = []
+        pending: deque[asyncio.Future] = deque()
+        if first_audio is None:
+            pending.append(asyncio.create_task(self._synthesize(sentences[0])))
         else:
-            await self.audio_player.play(audio.data)
+            pending.append(asyncio.get_running_loop().create_future())
+            pending[0].set_result(first_audio)
+        next_index = 1
+        try:
+            while pending:
+                audio = await pending.popleft()
+                clips.append(audio)
+                while len(pending) < self.tts_lookahead and next_index < len(sentences):
+                    pending.append(
+                        asyncio.create_task(self._synthesize(sentences[next_index]))
+                    )
+                    next_index += 1
+                await self._play_audio(audio)
+        finally:
+            for future in pending:
+                future.cancel()
+        return clips
 
-        return response
+    async def _generate_response(
+        self,
+        message: str,
+        context: list[dict[str, str]],
+        additional_context: Optional[str] = None,
+    ) -> str:
+        """Generate an LLM response within the configured timeout.
+
+        Args:
+            message: The formatted user message.
+            context: Conversation history.
+            additional_context: Optional extra context for the prompt.
+
+        Returns:
+            The generated response text.
+
+        Raises:
+            asyncio.TimeoutError: If the LLM does not respond within
+                llm_timeout.
+        """
+        # Only pass the extra context when there is some, since the base
+        # client interface does not take it
+        kwargs = {}
+        if additional_context is not None:
+            kwargs["additional_context"] = additional_context
+        try:
+            return await asyncio.wait_for(
+                self.llm_client.generate_response(message, context, **kwargs),
+                self.llm_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("LLM response timed out after %ss", self.llm_timeout)
+            raise
+
+    async def _synthesize(self, text: str) -> AudioData:
+        """Synthesize text with the configured speaker.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            The synthesized audio.
+        """
+        audio = await self.tts_engine.synthesize(text, speaker_id=self.speaker_id)
+        logger.debug("Synthesized %d bytes of audio", len(audio.data))
+        return audio
+
+    async def _play_audio(self, audio: AudioData) -> None:
+        """Play audio, with lip sync when an avatar is connected.
+
+        Args:
+            audio: The audio to play.
+        """
+        if self._lip_sync and self.avatar_controller:
+            # Run lip sync and audio playback concurrently; if either fails
+            # or this call is cancelled, the other is cancelled too
+            tasks = [
+                asyncio.create_task(self._lip_sync.sync_with_audio(audio)),
+                asyncio.create_task(self.audio_player.play(audio)),
+            ]
+            try:
+                done, _ = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_EXCEPTION
+                )
+                for task in done:
+                    task.result()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            # Just play audio
+            await self.audio_player.play(audio)
@@ -1,11 +1,24 @@
 """TTS (Text-to-Speech) module for voice synthesis."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import BaseTTSEngine
 from .models import AudioData, Speaker
-from .voicevox import VoicevoxEngine
-from .coeiroink import CoeiroinkEngine
-from .style_bert_vits import StyleBertVitsEngine
-from .nijivoice import NijivoiceEngine
+
+if TYPE_CHECKING:
+    from .voicevox import VoicevoxEngine
+    from .coeiroink import CoeiroinkEngine
+    from .style_bert_vits import StyleBertVitsEngine
+    from .nijivoice import NijivoiceEngine
+
+# Engine HTTP clients are only imported when their engine is first used
+_LAZY_IMPORTS = {
+    "VoicevoxEngine": ".voicevox",
+    "CoeiroinkEngine": ".coeiroink",
+    "StyleBertVitsEngine": ".style_bert_vits",
+    "NijivoiceEngine": ".nijivoice",
+}
 
 __all__ = [
     "BaseTTSEngine",
@@ -16,3 +29,13 @@ __all__ = [
     "StyleBertVitsEngine",
     "NijivoiceEngine",
 ]
+
+
+def __getattr__(name: str):
+    """Import backend engines on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,20 +5,62 @@ COEIROINKを使用して音声合成を行います。
 VOICEVOXと互換性のあるAPIを提供しています。
 """
 
+import json
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Optional
 
 import httpx
 
 from .base import BaseTTSEngine
 from .models import AudioData, Speaker
 
+try:
+    import orjson
+except ImportError:  # Optional dependency (pip install orjson)
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _loads(content: bytes) -> Any:
+    """
+    JSONを解析（orjsonがあれば使用）
+
+    Args:
+        content: JSONのバイト列
+
+    Returns:
+        解析結果
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps(value: Any) -> bytes:
+    """
+    JSONにシリアライズ（orjsonがあれば使用）
+
+    Args:
+        value: シリアライズする値
+
+    Returns:
+        UTF-8のJSONバイト列
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 class CoeiroinkEngine(BaseTTSEngine):
     """COEIROINK 音声合成エンジン"""
 
+    # 再利用する音声合成クエリの最大件数
+    QUERY_CACHE_SIZE = 256
+
     def __init__(
         self,
         host: str = "localhost",
@@ -50,7 +92,18 @@ class CoeiroinkEngine(BaseTTSEngine):
         self.volume = volume
 
         self.base_url = f"http://{host}:{port}"
-        self._client = httpx.AsyncClient(timeout=30.0)
+
+        # (話者ID, テキスト) ごとの音声合成クエリ（古い順）。同じ文の再合成では
+        # /audio_query を省略する
+        self._query_cache: OrderedDict[tuple[int, str], dict] = OrderedDict()
+        # コメント間隔をまたいで接続を再利用し、接続失敗は1回だけ再試行する
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=2.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+            ),
+        )
 
     async def synthesize(
         self,
@@ -74,16 +127,8 @@ class CoeiroinkEngine(BaseTTSEngine):
         speaker = speaker_id if speaker_id is not None else self.speaker_id
 
         try:
-            # 1. 音声合成用のクエリを作成
-            query_response = await self._client.post(
-                f"{self.base_url}/audio_query",
-                params={
-                    "text": text,
-                    "speaker": speaker,
-                },
-            )
-            query_response.raise_for_status()
-            query = query_response.json()
+            # 1. 音声合成用のクエリを作成（キャッシュがあれば再利用）
+            query = dict(await self._get_audio_query(text, speaker))
 
             # パラメータを設定
             query["speedScale"] = self.speed
@@ -95,19 +140,52 @@ class CoeiroinkEngine(BaseTTSEngine):
             synthesis_response = await self._client.post(
                 f"{self.base_url}/synthesis",
                 params={"speaker": speaker},
-                json=query,
+                content=_dumps(query),
+                headers=_JSON_HEADERS,
             )
             synthesis_response.raise_for_status()
 
             return synthesis_response.content
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error from COEIROINK: {e}")
+            logger.error("HTTP error from COEIROINK: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error synthesizing speech: {e}")
+            logger.error("Error synthesizing speech: %s", e)
             raise
 
+    async def _get_audio_query(self, text: str, speaker: int) -> dict:
+        """
+        音声合成用のクエリを取得（キャッシュ付き）
+
+        Args:
+            text: 合成するテキスト
+            speaker: 話者ID
+
+        Returns:
+            音声合成クエリ（呼び出し側で変更しないこと）
+        """
+        key = (speaker, text)
+        query = self._query_cache.get(key)
+        if query is not None:
+            self._query_cache.move_to_end(key)
+            return query
+
+        query_response = await self._client.post(
+            f"{self.base_url}/audio_query",
+            params={
+                "text": text,
+                "speaker": speaker,
+            },
+        )
+        query_response.raise_for_status()
+        query = _loads(query_response.content)
+
+        self._query_cache[key] = query
+        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return query
+
     async def synthesize_to_audio_data(
         self,
         text: str,
@@ -142,7 +220,7 @@ class CoeiroinkEngine(BaseTTSEngine):
             response = await self._client.get(f"{self.base_url}/speakers")
             response.raise_for_status()
 
-            speakers_data = response.json()
+            speakers_data = _loads(response.content)
             speakers = []
 
             for speaker_info in speakers_data:
@@ -159,7 +237,7 @@ class CoeiroinkEngine(BaseTTSEngine):
             return speakers
 
         except Exception as e:
-            logger.error(f"Error getting speakers: {e}")
+            logger.error("Error getting speakers: %s", e)
             return []
 
     def set_speed(self, speed: float) -> None:
@@ -1,10 +1,99 @@
 """Data models for TTS (Text-to-Speech) module."""
 
-from dataclasses import dataclass, field
-from typing import Optional
+import logging
+import struct
+from dataclasses import InitVar, dataclass, field
+from typing import Optional, Union
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# RIFF file header and the header of each chunk inside it
+_RIFF_HEADER = struct.Struct("<4sI4s")
+_CHUNK_HEADER = struct.Struct("<4sI")
+# Leading fields of the fmt chunk
+_FMT_CHUNK = struct.Struct("<HHIIHH")
+# WAVE_FORMAT_PCM and WAVE_FORMAT_EXTENSIBLE format tags
+_WAV_PCM_FORMATS = (0x0001, 0xFFFE)
+
+
+@dataclass(frozen=True, slots=True)
+class WavFormat:
+    """Format and PCM location of a WAV file.
+
+    Attributes:
+        sample_rate: Sample rate in Hz.
+        channels: Number of audio channels.
+        sample_width: Bytes per sample.
+        data_offset: Offset of the PCM data in the file.
+        data_size: Size of the PCM data in bytes.
+    """
+
+    sample_rate: int
+    channels: int
+    sample_width: int
+    data_offset: int
+    data_size: int
+
+
+def parse_wav_header(data: Union[bytes, memoryview]) -> WavFormat:
+    """Parse the header of a PCM WAV file.
+
+    Walks the chunk headers up to the data chunk without scanning or
+    copying the audio itself, so extra chunks (LIST, fact, ...) and
+    extended fmt chunks are handled as well.
+
+    Args:
+        data: WAV file bytes.
+
+    Returns:
+        The format of the file and the location of its PCM data.
+
+    Raises:
+        ValueError: If the data is not a valid PCM WAV file.
+    """
+    if len(data) < _RIFF_HEADER.size:
+        raise ValueError("WAV data is too short")
+    riff, _, wave_id = _RIFF_HEADER.unpack_from(data)
+    if riff != b"RIFF" or wave_id != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+
+    fmt = None
+    offset = _RIFF_HEADER.size
+    while offset + _CHUNK_HEADER.size <= len(data):
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(data, offset)
+        offset += _CHUNK_HEADER.size
+        if chunk_id == b"fmt ":
+            if chunk_size < _FMT_CHUNK.size or offset + _FMT_CHUNK.size > len(data):
+                raise ValueError("Truncated fmt chunk")
+            fmt = _FMT_CHUNK.unpack_from(data, offset)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("data chunk before fmt chunk")
+            audio_format, channels, sample_rate, _, _, bits_per_sample = fmt
+            if audio_format not in _WAV_PCM_FORMATS:
+                raise ValueError(f"Unsupported WAV format: {audio_format:#06x}")
+            if (
+                sample_rate == 0
+                or channels == 0
+                or bits_per_sample == 0
+                or bits_per_sample % 8
+            ):
+                raise ValueError(
+                    f"Invalid WAV format: {sample_rate}Hz {channels}ch "
+                    f"{bits_per_sample}bit"
+                )
+            sample_width = bits_per_sample // 8
+            # Streamed WAVs may declare a larger size than what was written
+            size = min(chunk_size, len(data) - offset)
+            size -= size % (channels * sample_width)
+            return WavFormat(sample_rate, channels, sample_width, offset, size)
+        # Chunks are padded to an even size
+        offset += chunk_size + (chunk_size & 1)
+
+    raise ValueError("No data chunk in WAV file")
+
+
+@dataclass(slots=True)
 class Speaker:
     """TTS speaker/voice information.
 
@@ -25,7 +114,7 @@ class Speaker:
         return f"Speaker(id={self.id}, name={self.name!r})"
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioData:
     """Synthesized audio data container.
 
@@ -35,6 +124,12 @@ class AudioData:
         channels: Number of audio channels (1=mono, 2=stereo).
         format: Audio format identifier (e.g., "wav", "mp3").
         duration: Duration in seconds (calculated if not provided).
+        sample_width: Bytes per sample.
+
+    For WAV data the header is parsed once here and describes the samples
+    that are played, so its sample rate, channels and sample width take
+    precedence over the constructor arguments; a mismatch is logged.
+    Consumers use `pcm` instead of parsing the file again.
     """
 
     data: bytes
@@ -42,14 +137,60 @@ class AudioData:
     channels: int = 1
     format: str = "wav"
     duration: Optional[float] = None
+    sample_width: int = 2
+    _pcm_offset: int = field(default=0, init=False, repr=False, compare=False)
+    _pcm_size: int = field(default=0, init=False, repr=False, compare=False)
+    # Header already parsed by the caller, to avoid parsing it again
+    wav: InitVar[Optional[WavFormat]] = None
+
+    def __post_init__(self, wav: Optional[WavFormat]) -> None:
+        """Read the WAV header and calculate duration if not provided."""
+        self._pcm_size = len(self.data)
+        if wav is None and self.format == "wav" and self.data:
+            try:
+                wav = parse_wav_header(self.data)
+            except ValueError:
+                # Treat the data as headerless PCM
+                pass
+        if wav is not None:
+            given = (self.sample_rate, self.channels, self.sample_width)
+            header = (wav.sample_rate, wav.channels, wav.sample_width)
+            if given != header:
+                logger.warning(
+                    "WAV header (%dHz, %dch, %d bytes/sample) overrides "
+                    "the given format (%dHz, %dch, %d bytes/sample)",
+                    *header,
+                    *given,
+                )
+            self.sample_rate, self.channels, self.sample_width = header
+            self._pcm_offset = wav.data_offset
+            self._pcm_size = wav.data_size
 
-    def __post_init__(self) -> None:
-        """Calculate duration if not provided."""
         if self.duration is None and self.data:
-            # Estimate duration for 16-bit audio
-            bytes_per_sample = 2 * self.channels
-            total_samples = len(self.data) / bytes_per_sample
-            self.duration = total_samples / self.sample_rate
+            bytes_per_second = self.sample_rate * self.channels * self.sample_width
+            self.duration = self._pcm_size / bytes_per_second
+
+    @classmethod
+    def from_wav(cls, data: bytes) -> "AudioData":
+        """Create audio data from WAV bytes.
+
+        Args:
+            data: WAV file bytes.
+
+        Returns:
+            Audio data with the format read from the header.
+
+        Raises:
+            ValueError: If the data is not a valid PCM WAV file.
+        """
+        wav = parse_wav_header(data)
+        return cls(
+            data=data,
+            sample_rate=wav.sample_rate,
+            channels=wav.channels,
+            sample_width=wav.sample_width,
+            wav=wav,
+        )
 
     def __len__(self) -> int:
         """Get the size of audio data in bytes."""
@@ -60,8 +201,14 @@ class AudioData:
         """Check if audio data is empty."""
         return len(self.data) == 0
 
+    @property
+    def pcm(self) -> memoryview:
+        """PCM samples without the file header, as a view into `data`."""
+        end = self._pcm_offset + self._pcm_size
+        return memoryview(self.data)[self._pcm_offset : end]
+
 
-@dataclass
+@dataclass(slots=True)
 class SynthesisOptions:
     """Options for speech synthesis.
 
@@ -12,6 +12,12 @@ import httpx
 from .base import BaseTTSEngine
 from .models import AudioData, Speaker
 
+try:
+    import h2  # noqa: F401  # httpxのHTTP/2対応に必要
+    _HTTP2_AVAILABLE = True
+except ImportError:  # Optional dependency (pip install h2)
+    _HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,8 +56,15 @@ class NijivoiceEngine(BaseTTSEngine):
         self.volume = volume
         self.format = format
 
+        # HTTP/2が使えれば1本の接続でリクエストを多重化し、
+        # コメント間隔をまたいで接続を再利用する
         self._client = httpx.AsyncClient(
-            timeout=60.0,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                retries=1,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+            ),
             headers={
                 "x-api-key": api_key,
                 "Content-Type": "application/json",
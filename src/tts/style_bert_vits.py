@@ -61,7 +61,14 @@ class StyleBertVitsEngine(BaseTTSEngine):
         self.style_weight = style_weight
 
         self.base_url = f"http://{host}:{port}"
-        self._client = httpx.AsyncClient(timeout=60.0)
+        # コメント間隔をまたいで接続を再利用し、接続失敗は1回だけ再試行する
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=2.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=1,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+            ),
+        )
 
     async def synthesize(
         self,
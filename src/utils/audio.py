@@ -1,17 +1,20 @@
 """Audio playback utilities."""
 
 import asyncio
-import io
 import logging
-import wave
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
+from typing import Optional, Union
 
-import numpy as np
 import sounddevice as sd
 
+from ..tts.models import AudioData
+
 logger = logging.getLogger(__name__)
 
+# sounddevice sample formats by sample width (8-bit WAV is unsigned)
+_SAMPLE_FORMATS = {1: "uint8", 2: "int16", 3: "int24", 4: "int32"}
+
 
 class AudioPlayer:
     """Async audio player for WAV data.
@@ -19,14 +22,22 @@ class AudioPlayer:
     This player handles audio playback asynchronously, allowing
     other tasks to continue while audio is playing.
 
+    One output stream is opened for the first clip and kept open for the
+    following clips with the same format, so consecutive sentences play
+    without reopening the device in between.
+
     Example:
         ```python
         player = AudioPlayer()
         await player.play(audio_bytes)
         player.stop()
+        await player.close()
         ```
     """
 
+    # Frames written to the output stream at a time
+    BLOCK_FRAMES = 1024
+
     def __init__(self, device: Optional[int] = None) -> None:
         """Initialize the audio player.
 
@@ -36,6 +47,11 @@ class AudioPlayer:
         self._executor = ThreadPoolExecutor(max_workers=1)
         self._device = device
         self._is_playing = False
+        # Output stream and the (device, sample rate, channels, format) it
+        # was opened with; only used from the executor thread
+        self._stream: Optional[sd.RawOutputStream] = None
+        self._stream_key: Optional[tuple] = None
+        self._stop_requested = threading.Event()
         logger.info(
             f"Initialized AudioPlayer (device={device or 'default'})"
         )
@@ -45,11 +61,11 @@ class AudioPlayer:
         """Check if audio is currently playing."""
         return self._is_playing
 
-    async def play(self, audio_data: bytes) -> None:
+    async def play(self, audio_data: Union[AudioData, bytes]) -> None:
         """Play WAV audio data asynchronously.
 
         Args:
-            audio_data: WAV format audio bytes.
+            audio_data: Audio data, or WAV format audio bytes.
         """
         if self._is_playing:
             logger.warning("Already playing audio, stopping current playback")
@@ -65,60 +81,106 @@ class AudioPlayer:
                 self._play_sync,
                 audio_data,
             )
+        except asyncio.CancelledError:
+            # The executor thread keeps writing unless told to stop
+            self.stop()
+            raise
         except Exception as e:
             logger.error(f"Error playing audio: {e}", exc_info=True)
         finally:
             self._is_playing = False
 
-    def _play_sync(self, audio_data: bytes) -> None:
+    def _play_sync(self, audio_data: Union[AudioData, bytes]) -> None:
         """Synchronous audio playback (runs in thread pool).
 
         Args:
-            audio_data: WAV format audio bytes.
+            audio_data: Audio data, or WAV format audio bytes.
         """
+        # A stop requested before this clip was only for the previous one;
+        # the executor runs clips in order, so it has already seen it
+        self._stop_requested.clear()
         try:
-            # Parse WAV data
-            with io.BytesIO(audio_data) as audio_io:
-                with wave.open(audio_io, "rb") as wav:
-                    framerate = wav.getframerate()
-                    n_frames = wav.getnframes()
-                    n_channels = wav.getnchannels()
-                    sampwidth = wav.getsampwidth()
-                    raw_data = wav.readframes(n_frames)
-
-            # Convert to numpy array
-            if sampwidth == 1:
-                dtype = np.int8
-            elif sampwidth == 2:
-                dtype = np.int16
-            elif sampwidth == 4:
-                dtype = np.int32
-            else:
-                logger.warning(f"Unsupported sample width: {sampwidth}")
-                return
+            # Parse WAV data unless the header was already read
+            if not isinstance(audio_data, AudioData):
+                audio_data = AudioData.from_wav(audio_data)
 
-            samples = np.frombuffer(raw_data, dtype=dtype)
-
-            # Reshape for stereo
-            if n_channels == 2:
-                samples = samples.reshape(-1, 2)
+            sample_format = _SAMPLE_FORMATS.get(audio_data.sample_width)
+            if sample_format is None:
+                logger.warning(f"Unsupported sample width: {audio_data.sample_width}")
+                return
 
-            # Normalize to float32 for sounddevice
-            max_val = float(2 ** (sampwidth * 8 - 1))
-            samples_float = samples.astype(np.float32) / max_val
+            stream = self._open_stream(
+                audio_data.sample_rate, audio_data.channels, sample_format
+            )
 
-            # Play audio
-            sd.play(samples_float, samplerate=framerate, device=self._device)
-            sd.wait()
+            # Write the PCM view in blocks so stop() takes effect quickly
+            pcm = audio_data.pcm
+            block_size = (
+                self.BLOCK_FRAMES * audio_data.channels * audio_data.sample_width
+            )
+            for offset in range(0, len(pcm), block_size):
+                if self._stop_requested.is_set():
+                    stream.abort()
+                    logger.debug("Audio playback interrupted")
+                    return
+                stream.write(pcm[offset : offset + block_size])
 
             logger.debug("Audio playback completed")
 
         except Exception as e:
             logger.error(f"Error in sync playback: {e}", exc_info=True)
 
+    def _open_stream(
+        self, sample_rate: int, channels: int, sample_format: str
+    ) -> sd.RawOutputStream:
+        """Get a started output stream for the given format.
+
+        The current stream is reused when the format and device match;
+        otherwise it is closed and a new one opened.
+
+        Args:
+            sample_rate: Sample rate in Hz.
+            channels: Number of channels.
+            sample_format: sounddevice sample format.
+
+        Returns:
+            The started output stream.
+        """
+        key = (self._device, sample_rate, channels, sample_format)
+        if self._stream is None or key != self._stream_key:
+            self._close_stream()
+            self._stream = sd.RawOutputStream(
+                samplerate=sample_rate,
+                channels=channels,
+                dtype=sample_format,
+                device=self._device,
+                blocksize=self.BLOCK_FRAMES,
+            )
+            self._stream_key = key
+            logger.debug(
+                f"Opened output stream ({sample_rate}Hz, {channels}ch, {sample_format})"
+            )
+
+        if not self._stream.active:
+            self._stream.start()
+        return self._stream
+
+    def _close_stream(self) -> None:
+        """Close the output stream, if open."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+            self._stream_key = None
+
+    async def close(self) -> None:
+        """Stop playback and close the output stream."""
+        self.stop()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._close_stream)
+
     def stop(self) -> None:
         """Stop current audio playback."""
-        sd.stop()
+        self._stop_requested.set()
         self._is_playing = False
         logger.debug("Audio playback stopped")
 
@@ -1,5 +1,6 @@
 """Tests for chat module."""
 
+import asyncio
 from datetime import datetime
 
 import pytest
@@ -241,3 +242,77 @@ class TestCommentQueue:
             await queue.push(comment)
 
         assert len(queue) == 3
+
+    @pytest.mark.asyncio
+    async def test_full_queue_keeps_higher_priority(self) -> None:
+        """Test that a full queue drops its lowest priority comment."""
+        queue = CommentQueue(max_size=2)
+        donation = Comment(
+            id="donation",
+            platform=Platform.YOUTUBE,
+            user_id="donor",
+            user_name="Donor",
+            message="Super chat",
+            donation_amount=500,
+        )
+        await queue.push(donation)
+        for i in range(3):
+            await queue.push(
+                Comment(
+                    id=str(i),
+                    platform=Platform.YOUTUBE,
+                    user_id=f"user{i}",
+                    user_name=f"User{i}",
+                    message=f"Message {i}",
+                )
+            )
+        member = Comment(
+            id="member",
+            platform=Platform.YOUTUBE,
+            user_id="member",
+            user_name="Member",
+            message="Member comment",
+            is_member=True,
+        )
+
+        assert await queue.push(member) is True
+        assert [(await queue.pop()).id for _ in range(2)] == ["donation", "member"]
+
+    @pytest.mark.asyncio
+    async def test_equal_priority_is_fifo(self) -> None:
+        """Test that comments with the same priority keep arrival order."""
+        queue = CommentQueue()
+        for i in range(5):
+            await queue.push(
+                Comment(
+                    id=str(i),
+                    platform=Platform.YOUTUBE,
+                    user_id=f"user{i}",
+                    user_name=f"User{i}",
+                    message=f"Message {i}",
+                )
+            )
+
+        assert [(await queue.pop()).id for _ in range(5)] == ["0", "1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_wait(self) -> None:
+        """Test waiting for a comment to arrive."""
+        queue = CommentQueue()
+        waiter = asyncio.create_task(queue.wait())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await queue.push(
+            Comment(
+                id="1",
+                platform=Platform.YOUTUBE,
+                user_id="user1",
+                user_name="User",
+                message="Hello",
+            )
+        )
+        await asyncio.wait_for(waiter, 1)
+
+        await queue.pop()
+        assert not queue._not_empty.is_set()
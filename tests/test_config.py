@@ -106,3 +106,36 @@ class TestLoadConfig:
         assert config.platform.video_id == "test_video_id"
         assert config.llm.model == "gpt-4o-mini"
         assert config.avatar.enabled is False
+
+    def test_load_config_uses_cache(
+        self,
+        test_config_dir: Path,
+        sample_config_yaml: str,
+    ) -> None:
+        """Test that parsed config is cached next to the YAML file."""
+        config_file = test_config_dir / "config.yaml"
+        config_file.write_text(sample_config_yaml)
+
+        first = load_config(config_file)
+        cache_file = test_config_dir / "config.yaml.cache.json"
+        assert cache_file.exists()
+
+        second = load_config(config_file)
+        assert second == first
+
+    def test_load_config_cache_invalidated_on_change(
+        self,
+        test_config_dir: Path,
+        sample_config_yaml: str,
+    ) -> None:
+        """Test that editing the YAML file bypasses a stale cache."""
+        config_file = test_config_dir / "config.yaml"
+        config_file.write_text(sample_config_yaml)
+        load_config(config_file)
+
+        config_file.write_text(
+            sample_config_yaml.replace("test_video_id", "updated_video_id")
+        )
+
+        config = load_config(config_file)
+        assert config.platform.video_id == "updated_video_id"
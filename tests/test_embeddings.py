@@ -0,0 +1,98 @@
+"""Tests for memory embedding index."""
+
+import numpy as np
+import pytest
+
+from src.memory.embeddings import EmbeddingIndex
+
+
+def unit(*values: float) -> np.ndarray:
+    """Build a normalized float32 vector."""
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class TestEmbeddingIndex:
+    """Test EmbeddingIndex class."""
+
+    @pytest.fixture
+    def index(self):
+        """Create an index with three entries."""
+        index = EmbeddingIndex(dimension=2)
+        index.add(
+            ["a", "b", "c"],
+            np.stack([unit(1, 0), unit(1, 1), unit(0, 1)]),
+            ["conversation", "fact", "conversation"],
+            ["alice", "bob", "alice"],
+        )
+        return index
+
+    def test_search_orders_by_similarity(self, index):
+        """Test that results are ordered most similar first."""
+        results = index.search(unit(1, 0.1), k=3)
+
+        assert [entry_id for entry_id, _ in results] == ["a", "b", "c"]
+        assert results[0][1] == pytest.approx(float(unit(1, 0.1) @ unit(1, 0)))
+
+    def test_search_filters(self, index):
+        """Test memory type and user name filters."""
+        facts = index.search(unit(1, 0), k=3, memory_type="fact")
+        assert [i for i, _ in facts] == ["b"]
+        alice = index.search(unit(1, 0), k=3, user_name="alice")
+        assert [i for i, _ in alice] == ["a", "c"]
+        assert index.search(unit(1, 0), k=3, user_name="nobody") == []
+
+    def test_add_replaces_existing(self, index):
+        """Test that adding a known ID updates it in place."""
+        index.add(["a"], unit(0, 1)[None], ["conversation"], ["alice"])
+
+        assert len(index) == 3
+        assert index.search(unit(0, 1), k=1)[0][0] in {"a", "c"}
+        assert index.search(unit(1, 0), k=1)[0][0] == "b"
+
+    def test_remove_keeps_other_rows(self, index):
+        """Test that removal moves rows without losing entries."""
+        index.remove(["a", "missing"])
+
+        assert len(index) == 2
+        assert "a" not in index
+        assert [i for i, _ in index.search(unit(0, 1), k=5)] == ["c", "b"]
+
+    def test_grows_past_initial_capacity(self):
+        """Test that the buffers grow as entries are added."""
+        index = EmbeddingIndex(dimension=2)
+        count = EmbeddingIndex.INITIAL_CAPACITY + 10
+        vectors = np.tile(unit(1, 0), (count, 1))
+
+        index.add(
+            [str(i) for i in range(count)], vectors, ["fact"] * count, [None] * count
+        )
+
+        assert len(index) == count
+        assert len(index.search(unit(1, 0), k=count)) == count
+
+    def test_binary_quantization_rescores_exactly(self):
+        """Test that binary search returns exact similarities of the best rows."""
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((500, 64)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        ids = [str(i) for i in range(500)]
+        exact = EmbeddingIndex(dimension=64)
+        binary = EmbeddingIndex(dimension=64, quantization="binary")
+        for index in (exact, binary):
+            index.add(ids, vectors, ["fact"] * 500, [None] * 500)
+        binary.remove(["0"])
+        exact.remove(["0"])
+
+        query = vectors[42]
+        results = binary.search(query, k=3)
+
+        assert results[0] == exact.search(query, k=1)[0]
+        assert results == sorted(results, key=lambda result: -result[1])
+        for entry_id, similarity in results:
+            assert similarity == pytest.approx(float(vectors[int(entry_id)] @ query))
+
+    def test_invalid_quantization(self):
+        """Test that unsupported quantization is rejected."""
+        with pytest.raises(ValueError):
+            EmbeddingIndex(dimension=8, quantization="int4")
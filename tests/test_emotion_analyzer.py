@@ -1,5 +1,7 @@
 """Tests for emotion analyzer module."""
 
+import dataclasses
+
 import pytest
 
 from src.expression.emotion_analyzer import (
@@ -143,6 +145,14 @@ class TestEmotionAnalyzer:
         result = analyzer.analyze("カスタム喜び")
         assert result.primary_emotion == Emotion.HAPPY
 
+    def test_custom_keywords_do_not_leak(self):
+        """Test that custom keywords do not modify the class defaults."""
+        EmotionAnalyzer(custom_keywords={Emotion.HAPPY: ["カスタム喜び"]})
+
+        assert "カスタム喜び" not in EmotionAnalyzer.EMOTION_KEYWORDS[Emotion.HAPPY]
+        result = EmotionAnalyzer().analyze("カスタム喜び")
+        assert result.primary_emotion == Emotion.NEUTRAL
+
     def test_custom_mappings(self):
         """Test analyzer with custom expression mappings."""
         custom_mapping = ExpressionMapping(
@@ -156,3 +166,48 @@ class TestEmotionAnalyzer:
 
         assert mapping.expression_name == "custom_happy"
         assert mapping.parameter_values["CustomParam"] == 0.5
+
+    def test_keyword_scan_matches_fallback(self, analyzer):
+        """Test that the automaton scan counts like per-keyword str.count."""
+        fallback = EmotionAnalyzer()
+        fallback._automaton = None
+
+        for text in ["大好き！すき", "えええええ", "ウザいうざい😡", "普通"]:
+            assert analyzer.analyze(text) == fallback.analyze(text)
+
+    def test_analyze_cache_is_bounded(self, analyzer):
+        """Test that repeated texts hit the cache and old entries are evicted."""
+        first = analyzer.analyze("嬉しい")
+        assert analyzer.analyze("嬉しい") is first
+
+        for i in range(EmotionAnalyzer.CACHE_SIZE):
+            analyzer.analyze(f"テキスト{i}")
+
+        assert len(analyzer._cache) == EmotionAnalyzer.CACHE_SIZE
+        assert "嬉しい" not in analyzer._cache
+
+    def test_cached_result_is_immutable(self, analyzer):
+        """Test that a shared cached result cannot be modified by a caller."""
+        result = analyzer.analyze("嬉しい")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.intensity = 0.0
+        assert analyzer.analyze("嬉しい").intensity > 0.0
+
+    def test_scaled_mapping_is_immutable(self, analyzer):
+        """Test that a shared scaled mapping cannot be modified by a caller."""
+        _, mapping = analyzer.analyze_and_map("嬉しい")
+        values = dict(mapping.parameter_values)
+
+        with pytest.raises(TypeError):
+            mapping.parameter_values["MouthSmile"] = 0.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            mapping.expression_name = "sad"
+        assert analyzer.analyze_and_map("嬉しい")[1].parameter_values == values
+
+    def test_katakana_matches_hiragana_keywords(self, analyzer):
+        """Test that katakana and hiragana spellings are treated alike."""
+        assert analyzer.analyze("スキ").primary_emotion == Emotion.HAPPY
+        # "マジ" and "まじ" are one keyword after normalization
+        assert analyzer.analyze("マジ") == analyzer.analyze("まじ")
+        assert analyzer.analyze("マジ").intensity == pytest.approx(1 / 3)
@@ -10,6 +10,7 @@ from src.factory import (
     create_tts_engine,
     create_avatar_controller,
 )
+from src.ai.character import Character
 from src.chat.youtube_chat import YouTubeChatClient
 from src.ai.openai_client import OpenAIClient
 from src.ai.ollama_client import OllamaClient
@@ -265,3 +266,68 @@ class TestCreateAvatarController:
         controller = create_avatar_controller(config)
 
         assert controller is None
+
+
+class TestFactoryCache:
+    """Test caching of factory-created clients."""
+
+    def test_same_config_returns_cached_client(self):
+        """Test that identical configs reuse the same client."""
+        config = AppConfig(
+            platform=PlatformConfig(name="youtube", video_id="test_video_id")
+        )
+        settings = Settings()
+        cache = {}
+
+        first = create_chat_client(config, settings, cache)
+        second = create_chat_client(config.model_copy(deep=True), settings, cache)
+
+        assert first is second
+
+    def test_changed_config_creates_new_client(self):
+        """Test that a different config builds a new client."""
+        settings = Settings()
+        cache = {}
+        first = create_chat_client(
+            AppConfig(platform=PlatformConfig(name="youtube", video_id="a")),
+            settings,
+            cache,
+        )
+        second = create_chat_client(
+            AppConfig(platform=PlatformConfig(name="youtube", video_id="b")),
+            settings,
+            cache,
+        )
+
+        assert first is not second
+
+    def test_no_cache_creates_new_client(self):
+        """Test that clients are not shared unless a cache is passed."""
+        config = AppConfig(
+            platform=PlatformConfig(name="youtube", video_id="test_video_id")
+        )
+        settings = Settings()
+
+        assert create_chat_client(config, settings) is not create_chat_client(
+            config, settings
+        )
+        assert create_avatar_controller(config) is not create_avatar_controller(
+            config
+        )
+
+    def test_character_does_not_change_cached_client(self):
+        """Test that another character gets its own LLM client."""
+        config = AppConfig(llm=LLMConfig(provider="ollama", model="llama3.1"))
+        settings = Settings()
+        cache = {}
+        alice = Character(name="Alice")
+        bob = Character(name="Bob")
+
+        first = create_llm_client(config, settings, alice, cache)
+        second = create_llm_client(config, settings, bob, cache)
+
+        assert first is not second
+        assert first.character is alice
+        assert second.character is bob
+        again = create_llm_client(config, settings, Character(name="Alice"), cache)
+        assert again is first
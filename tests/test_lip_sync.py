@@ -0,0 +1,138 @@
+"""Tests for lip sync module."""
+
+import io
+import math
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from src.avatar.base import BaseAvatarController
+from src.expression.lip_sync import LipSyncController
+from src.tts.models import AudioData
+
+
+def make_wav(samples: np.ndarray, n_channels: int = 1, framerate: int = 24000) -> bytes:
+    """Build 16-bit WAV bytes from interleaved samples."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(n_channels)
+        wav.setsampwidth(2)
+        wav.setframerate(framerate)
+        wav.writeframes(samples.astype(np.int16).tobytes())
+    return buffer.getvalue()
+
+
+class FlakyAvatar(BaseAvatarController):
+    """Avatar whose lip sync fails for one value."""
+
+    def __init__(self, failing_value: float):
+        super().__init__()
+        self.failing_value = failing_value
+        self.values: list[float] = []
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def set_parameter(self, name: str, value: float) -> None:
+        if value == self.failing_value:
+            raise RuntimeError("request failed")
+        self.values.append(value)
+
+    async def set_expression(self, expression_name: str) -> None:
+        pass
+
+    async def trigger_hotkey(self, hotkey_id: str) -> None:
+        pass
+
+
+class TestLipSyncSchedule:
+    """Test BaseAvatarController.set_lip_sync_schedule."""
+
+    @pytest.mark.asyncio
+    async def test_failed_value_does_not_stop_schedule(self):
+        """Test that a failing frame is skipped instead of ending the animation."""
+        avatar = FlakyAvatar(failing_value=0.5)
+
+        await avatar.set_lip_sync_schedule([0.2, 0.5, 0.8, 0.4], 0.0)
+
+        assert avatar.values == [0.2, 0.8, 0.4]
+
+
+class TestLipSyncController:
+    """Test LipSyncController class."""
+
+    @pytest.fixture
+    def controller(self):
+        """Create a lip sync controller without an avatar."""
+        return LipSyncController(None)
+
+    def test_parse_mono_wav(self, controller):
+        """Test parsing mono WAV data."""
+        samples = np.arange(-500, 500, dtype=np.int16)
+
+        result = controller._parse_wav(make_wav(samples))
+
+        assert result is not None
+        parsed, framerate = result
+        assert framerate == 24000
+        assert np.array_equal(parsed, samples)
+
+    def test_parse_stereo_wav_downmixes(self, controller):
+        """Test that stereo WAV data is averaged into mono."""
+        left = np.full(100, 1000, dtype=np.int16)
+        right = np.full(100, 3000, dtype=np.int16)
+        interleaved = np.column_stack([left, right]).ravel()
+
+        parsed, _ = controller._parse_wav(make_wav(interleaved, n_channels=2))
+
+        assert parsed.dtype == np.int16
+        assert parsed.flags.c_contiguous
+        assert np.all(parsed == 2000)
+
+    def test_parse_wav_with_extra_chunk(self, controller):
+        """Test that extra chunks before the data chunk are skipped."""
+        samples = np.arange(-500, 500, dtype=np.int16)
+        wav_bytes = make_wav(samples)
+        # Insert a LIST chunk between the fmt and data chunks
+        chunk = b"LIST" + struct.pack("<I", 4) + b"INFO"
+        body = wav_bytes[12:36] + chunk + wav_bytes[36:]
+        extended = b"RIFF" + struct.pack("<I", len(body) + 4) + b"WAVE" + body
+
+        parsed, framerate = controller._parse_wav(extended)
+
+        assert framerate == 24000
+        assert np.array_equal(parsed, samples)
+
+    def test_parse_audio_data(self, controller):
+        """Test that AudioData samples are read through its PCM view."""
+        samples = np.arange(-500, 500, dtype=np.int16)
+        audio = AudioData(data=make_wav(samples, framerate=16000))
+
+        parsed, framerate = controller._parse_wav(audio)
+
+        assert framerate == 16000
+        assert np.array_equal(parsed, samples)
+        assert not parsed.flags.owndata
+
+    def test_parse_invalid_data(self, controller):
+        """Test that invalid data returns None."""
+        assert controller._parse_wav(b"not a wav file") is None
+
+    def test_frame_volumes_match_single_frame(self, controller):
+        """Test vectorized frame volumes against per-frame calculation."""
+        rng = np.random.default_rng(0)
+        samples = rng.integers(-20000, 20000, size=1250, dtype=np.int16)
+
+        volumes = controller._calculate_frame_volumes(samples, 100, 12)
+
+        expected = []
+        for i in range(12):
+            frame = [int(sample) for sample in samples[i * 100 : (i + 1) * 100]]
+            rms = math.sqrt(sum(sample * sample for sample in frame) / len(frame))
+            expected.append(min(1.0, rms / 8000.0))
+        assert volumes == pytest.approx(expected, rel=1e-5)
@@ -0,0 +1,352 @@
+"""Tests for long-term memory module."""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.memory.long_term_memory import LongTermMemory
+from src.memory.models import Importance, MemoryEntry, MemoryType
+
+
+class CharacterEncoder:
+    """Deterministic encoder that embeds texts by character counts."""
+
+    model_name = "test-characters"
+    dimension = 32
+
+    def encode(self, texts):
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for char in text.lower():
+                vectors[row, ord(char) % self.dimension] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class CountingEncoder(CharacterEncoder):
+    """Character encoder that records the size of each encoded batch."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def encode(self, texts):
+        self.batch_sizes.append(len(texts))
+        return super().encode(texts)
+
+
+@pytest.fixture
+async def memory(tmp_path: Path):
+    """Create an initialized memory store."""
+    store = LongTermMemory(db_path=str(tmp_path / "memory.db"))
+    await store.initialize()
+    yield store
+    await store.close()
+
+
+class TestLongTermMemory:
+    """Test LongTermMemory class."""
+
+    @pytest.mark.asyncio
+    async def test_requires_initialize(self, tmp_path: Path):
+        """Test that using the store before initialize raises."""
+        store = LongTermMemory(db_path=str(tmp_path / "memory.db"))
+
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await store.store(MemoryEntry(content="test"))
+
+    @pytest.mark.asyncio
+    async def test_store_and_get(self, memory):
+        """Test storing and retrieving an entry."""
+        entry = MemoryEntry(content="User likes anime", user_name="viewer")
+
+        entry_id = await memory.store(entry)
+        loaded = await memory.get(entry_id)
+
+        assert loaded is not None
+        assert loaded.content == "User likes anime"
+        assert loaded.user_name == "viewer"
+
+    @pytest.mark.asyncio
+    async def test_search_with_min_importance(self, memory):
+        """Test full-text search with an importance filter."""
+        await memory.store(MemoryEntry(content="anime low", importance=Importance.LOW))
+        await memory.store(
+            MemoryEntry(content="anime high", importance=Importance.HIGH)
+        )
+
+        results = await memory.search("anime", min_importance=Importance.HIGH)
+
+        assert [entry.content for entry in results] == ["anime high"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stores(self, memory):
+        """Test that concurrent calls are serialized safely."""
+        await asyncio.gather(
+            *(memory.store(MemoryEntry(content=f"entry {i}")) for i in range(20))
+        )
+
+        stats = await memory.get_stats()
+        assert stats["total_entries"] == 20
+
+    @pytest.mark.asyncio
+    async def test_record_interaction_updates_profile(self, memory):
+        """Test that interactions create entries and update the profile."""
+        await memory.record_interaction("viewer", "hello", "hi!")
+        await memory.record_interaction("viewer", "again", "welcome back")
+
+        profile = await memory.get_user_profile("viewer")
+        stats = await memory.get_stats()
+
+        assert profile is not None
+        assert profile.interaction_count == 2
+        assert stats["by_type"] == {MemoryType.CONVERSATION.value: 2}
+        assert stats["unique_users"] == 1
+
+        latest = (await memory.get_recent(limit=1))[0]
+        assert profile.last_seen == latest.timestamp
+
+    @pytest.mark.asyncio
+    async def test_store_many_and_delete_many(self, memory):
+        """Test batch insert and delete."""
+        entries = [MemoryEntry(content=f"batch {i}") for i in range(5)]
+
+        ids = await memory.store_many(entries)
+        deleted = await memory.delete_many(ids[:3] + ["missing"])
+
+        assert ids == [entry.id for entry in entries]
+        assert deleted == 3
+        assert (await memory.get_stats())["total_entries"] == 2
+        assert await memory.store_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_access_tracking_written_on_close(self, tmp_path: Path):
+        """Test that buffered access tracking is persisted."""
+        db_path = str(tmp_path / "memory.db")
+        store = LongTermMemory(db_path=db_path)
+        await store.initialize()
+        entry_id = await store.store(MemoryEntry(content="tracked"))
+        await store.get(entry_id)
+        await store.get(entry_id)
+        await store.close()
+
+        reopened = LongTermMemory(db_path=db_path)
+        await reopened.initialize()
+        entry = await reopened.get(entry_id)
+        await reopened.close()
+
+        assert entry.access_count == 2
+        assert entry.last_accessed is not None
+
+    @pytest.mark.asyncio
+    async def test_search_with_all_filters(self, memory):
+        """Test search combining type, user and importance filters."""
+        await memory.store_many(
+            [
+                MemoryEntry(
+                    content="game talk",
+                    memory_type=MemoryType.TOPIC,
+                    user_name="alice",
+                    importance=Importance.CRITICAL,
+                ),
+                MemoryEntry(
+                    content="game talk",
+                    memory_type=MemoryType.TOPIC,
+                    user_name="bob",
+                    importance=Importance.CRITICAL,
+                ),
+                MemoryEntry(
+                    content="game talk",
+                    memory_type=MemoryType.CONVERSATION,
+                    user_name="alice",
+                    importance=Importance.CRITICAL,
+                ),
+            ]
+        )
+
+        results = await memory.search(
+            "game",
+            memory_type=MemoryType.TOPIC,
+            user_name="alice",
+            min_importance=Importance.MEDIUM,
+        )
+
+        assert len(results) == 1
+        assert results[0].user_name == "alice"
+        assert results[0].memory_type == MemoryType.TOPIC
+
+    @pytest.mark.asyncio
+    async def test_json_columns_round_trip(self, memory):
+        """Test that keywords and metadata survive storage unchanged."""
+        entry = MemoryEntry(
+            content="メタデータ",
+            keywords=["アニメ", "ゲーム"],
+            metadata={"user_message": "こんにちは", "count": 3},
+        )
+
+        await memory.store(entry)
+        loaded = await memory.get(entry.id)
+
+        assert loaded.keywords == ["アニメ", "ゲーム"]
+        assert loaded.metadata == {"user_message": "こんにちは", "count": 3}
+
+    @pytest.mark.asyncio
+    async def test_user_profile_cache(self, memory):
+        """Test that cached profiles stay consistent with updates."""
+        await memory.record_interaction("viewer", "hello", "hi!")
+
+        profile = await memory.get_user_profile("viewer")
+        profile.notes.append("unsaved note")
+        assert (await memory.get_user_profile("viewer")).notes == []
+
+        profile.interaction_count = 10
+        await memory.update_user_profile(profile)
+        await memory.record_interaction("viewer", "again", "welcome back")
+
+        cached = await memory.get_user_profile("viewer")
+        assert cached.interaction_count == 11
+        assert cached.notes == ["unsaved note"]
+        assert await memory.get_user_profile("nobody") is None
+
+    @pytest.mark.asyncio
+    async def test_uses_wal_journal(self, memory):
+        """Test that the database is opened in WAL mode."""
+        mode = memory._connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        memory._checkpoint_sync()
+
+        assert mode == "wal"
+
+    @pytest.mark.asyncio
+    async def test_stats_reflect_writes(self, memory):
+        """Test that cached stats are refreshed after writes."""
+        assert await memory.get_stats() == {
+            "total_entries": 0,
+            "by_type": {},
+            "unique_users": 0,
+        }
+
+        entry_id = await memory.store(
+            MemoryEntry(content="fact", memory_type=MemoryType.FACT)
+        )
+        assert (await memory.get_stats())["by_type"] == {MemoryType.FACT.value: 1}
+
+        await memory.delete(entry_id)
+        assert (await memory.get_stats())["total_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_restore_after_change_or_delete(self, memory):
+        """Test that re-storing an entry writes changes and survives deletes."""
+        entry = MemoryEntry(content="original")
+        await memory.store(entry)
+        await memory.store(entry)
+
+        entry.content = "edited"
+        await memory.store(entry)
+        assert (await memory.get(entry.id)).content == "edited"
+
+        await memory.delete(entry.id)
+        await memory.store(entry)
+        assert (await memory.get(entry.id)).content == "edited"
+
+    @pytest.mark.asyncio
+    async def test_failed_interaction_rolls_back(self, memory, monkeypatch):
+        """Test that a failure mid-transaction leaves no partial writes."""
+
+        def fail(connection, profile):
+            raise sqlite3.OperationalError("disk full")
+
+        monkeypatch.setattr(memory, "_upsert_user_profile", fail)
+
+        with pytest.raises(sqlite3.OperationalError):
+            await memory.record_interaction("viewer", "hello", "hi!")
+
+        assert (await memory.get_stats())["total_entries"] == 0
+        assert await memory.search("hello") == []
+        assert not memory._connection.in_transaction
+
+    @pytest.mark.asyncio
+    async def test_analyze(self, memory):
+        """Test that analyze collects planner statistics."""
+        await memory.store(MemoryEntry(content="analyzed"))
+
+        await memory.analyze()
+        memory._optimize_sync()
+
+        tables = memory._connection.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchall()
+        assert tables
+
+    @pytest.mark.asyncio
+    async def test_search_similar(self, tmp_path: Path):
+        """Test embedding search, including vectors backfilled on startup."""
+        db_path = str(tmp_path / "memory.db")
+        plain = LongTermMemory(db_path=db_path)
+        await plain.initialize()
+        await plain.store(MemoryEntry(content="aaaa", memory_type=MemoryType.FACT))
+        await plain.close()
+
+        store = LongTermMemory(db_path=db_path, encoder=CharacterEncoder())
+        await store.initialize()
+        try:
+            await store.store(MemoryEntry(content="bbbb"))
+            await store.record_interaction("viewer", "cccc", "cccc")
+
+            results = await store.search_similar("aaab", limit=2)
+            assert [entry.content for entry, _ in results] == ["aaaa", "bbbb"]
+            assert results[0][1] > results[1][1]
+
+            filtered = await store.search_similar(
+                "aaab", memory_type=MemoryType.CONVERSATION
+            )
+            assert [entry.content for entry, _ in filtered] == [
+                "bbbb",
+                "viewer: cccc\nAI: cccc",
+            ]
+
+            await store.delete(results[0][0].id)
+            assert len(await store.search_similar("aaaa")) == 2
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_search_similar_requires_encoder(self, memory):
+        """Test that embedding search is unavailable without an encoder."""
+        assert not memory.has_embeddings
+        with pytest.raises(RuntimeError, match="encoder"):
+            await memory.search_similar("anything")
+
+    @pytest.mark.asyncio
+    async def test_embeddings_encoded_in_batches(self, tmp_path: Path):
+        """Test that separate stores are encoded together and persisted on close."""
+        db_path = str(tmp_path / "memory.db")
+        encoder = CountingEncoder()
+        store = LongTermMemory(db_path=db_path, encoder=encoder)
+        await store.initialize()
+        for text in ("aaaa", "bbbb", "cccc"):
+            await store.store(MemoryEntry(content=text))
+        await store.record_interaction("viewer", "dddd", "dddd")
+
+        results = await store.search_similar("aaaa", limit=1)
+        assert results[0][0].content == "aaaa"
+        assert encoder.batch_sizes == [4, 1]
+
+        await store.store(MemoryEntry(content="eeee"))
+        await asyncio.sleep(store.EMBEDDING_FLUSH_DELAY * 3)
+        assert encoder.batch_sizes == [4, 1, 1]
+
+        await store.store(MemoryEntry(content="ffff"))
+        await store.close()
+
+        reopened_encoder = CountingEncoder()
+        reopened = LongTermMemory(db_path=db_path, encoder=reopened_encoder)
+        await reopened.initialize()
+        try:
+            assert reopened_encoder.batch_sizes == []
+            results = await reopened.search_similar("ffff", limit=1)
+            assert results[0][0].content == "ffff"
+        finally:
+            await reopened.close()
@@ -0,0 +1,227 @@
+"""Tests for pipeline module."""
+
+import asyncio
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    import sounddevice  # noqa: F401
+except (ImportError, OSError):
+    # PortAudio is not needed here; playback is replaced by FakePlayer
+    sounddevice_stub = types.ModuleType("sounddevice")
+    sounddevice_stub.RawOutputStream = object
+    sys.modules["sounddevice"] = sounddevice_stub
+
+from src.chat.models import Comment, Platform
+from src.pipeline import AITuberPipeline, _PreparedResponse, _split_sentences
+from src.tts.models import AudioData
+
+
+class FakeTTS:
+    """TTS engine whose syntheses finish when the test releases them."""
+
+    def __init__(self):
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+        self.release: dict[str, asyncio.Event] = {}
+
+    def event(self, text: str) -> asyncio.Event:
+        return self.release.setdefault(text, asyncio.Event())
+
+    async def synthesize(self, text: str, speaker_id: int = 1) -> AudioData:
+        self.started.append(text)
+        try:
+            await self.event(text).wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(text)
+            raise
+        return AudioData(data=text.encode("utf-8"), format="raw")
+
+
+class FakePlayer:
+    """Audio player that records what it plays."""
+
+    def __init__(self):
+        self.played: list[bytes] = []
+        self.gate: asyncio.Event = asyncio.Event()
+        self.gate.set()
+
+    async def play(self, audio: AudioData) -> None:
+        self.played.append(audio.data)
+        await self.gate.wait()
+
+
+def make_pipeline(tts=None, **kwargs) -> AITuberPipeline:
+    """Build a pipeline without an avatar and with fake playback."""
+    pipeline = AITuberPipeline(
+        chat_client=MagicMock(),
+        llm_client=MagicMock(),
+        tts_engine=tts or FakeTTS(),
+        **kwargs,
+    )
+    pipeline.audio_player = FakePlayer()
+    return pipeline
+
+
+def make_comment(comment_id: str) -> Comment:
+    """Build a chat comment."""
+    return Comment(
+        id=comment_id,
+        platform=Platform.YOUTUBE,
+        user_id=f"user{comment_id}",
+        user_name=f"User{comment_id}",
+        message=f"Message {comment_id}",
+    )
+
+
+async def settle() -> None:
+    """Let pending tasks run until they block."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestSplitSentences:
+    """Test _split_sentences function."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("今日は楽しい！明日も頑張る。", ["今日は楽しい！", "明日も頑張る。"]),
+            ("「すごい！」と言った。", ["「すごい！」と言った。"]),
+            ("「はい。」「いいえ。」", ["「はい。」", "「いいえ。」"]),
+            ("楽しかった！（笑）また明日。", ["楽しかった！（笑）", "また明日。"]),
+            ("本当？！」", ["本当？！」"]),
+            (
+                "円周率は3.14です。 Hello. World",
+                ["円周率は3.14です。", "Hello.", "World"],
+            ),
+            ("  ", []),
+        ],
+    )
+    def test_split(self, text, expected):
+        """Test sentence boundaries around brackets and periods."""
+        assert _split_sentences(text) == expected
+
+
+class TestSpeak:
+    """Test sentence-by-sentence speech."""
+
+    @pytest.mark.asyncio
+    async def test_plays_in_order_with_lookahead(self):
+        """Test that sentences play in order while later ones are synthesized."""
+        tts = FakeTTS()
+        pipeline = make_pipeline(tts, tts_lookahead=2)
+        pipeline.audio_player.gate.clear()
+
+        speak = asyncio.create_task(pipeline._speak("一。二。三。四。"))
+        await settle()
+        assert tts.started == ["一。"]
+
+        # The third sentence finishes before the second
+        tts.event("一。").set()
+        tts.event("三。").set()
+        await settle()
+        # The first plays while up to two sentences are synthesized ahead
+        assert pipeline.audio_player.played == ["一。".encode()]
+        assert tts.started == ["一。", "二。", "三。"]
+
+        tts.event("二。").set()
+        tts.event("四。").set()
+        pipeline.audio_player.gate.set()
+        clips = await speak
+
+        expected = [s.encode() for s in ["一。", "二。", "三。", "四。"]]
+        assert pipeline.audio_player.played == expected
+        assert [clip.data for clip in clips] == expected
+
+    @pytest.mark.asyncio
+    async def test_cancel_cancels_pending_syntheses(self):
+        """Test that cancelling speech cancels syntheses not yet played."""
+        tts = FakeTTS()
+        pipeline = make_pipeline(tts, tts_lookahead=2)
+        pipeline.audio_player.gate.clear()
+
+        speak = asyncio.create_task(pipeline._speak("一。二。三。"))
+        tts.event("一。").set()
+        await settle()
+        assert tts.started == ["一。", "二。", "三。"]
+
+        speak.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await speak
+        await settle()
+
+        assert sorted(tts.cancelled) == ["三。", "二。"]
+
+    @pytest.mark.asyncio
+    async def test_first_audio_is_not_synthesized_again(self):
+        """Test that prefetched audio of the first sentence is played as is."""
+        tts = FakeTTS()
+        pipeline = make_pipeline(tts)
+        first = AudioData(data=b"prefetched", format="raw")
+        tts.event("二。").set()
+
+        await pipeline._speak("一。二。", first_audio=first)
+
+        assert tts.started == ["二。"]
+        assert pipeline.audio_player.played == [b"prefetched", "二。".encode()]
+
+
+class TestProcessComments:
+    """Test the comment processing loop."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_and_interval(self):
+        """Test that the next response is prepared while one is delivered."""
+        pipeline = make_pipeline(response_interval=0.05)
+        loop = asyncio.get_running_loop()
+        events: list[tuple[str, str, float]] = []
+        delivered = asyncio.Event()
+
+        async def prepare(comment):
+            events.append(("prepare", comment.id, loop.time()))
+            return _PreparedResponse(
+                comment=comment,
+                response="",
+                memory_context="",
+                cached=None,
+                first_audio=None,
+            )
+
+        async def deliver(prepared):
+            events.append(("deliver", prepared.comment.id, loop.time()))
+            await asyncio.sleep(0.01)
+            events.append(("done", prepared.comment.id, loop.time()))
+            if prepared.comment.id == "2":
+                delivered.set()
+
+        pipeline._prepare_response = prepare
+        pipeline._deliver_response = deliver
+        await pipeline.comment_queue.push(make_comment("1"))
+        await pipeline.comment_queue.push(make_comment("2"))
+
+        pipeline._running = True
+        task = asyncio.create_task(pipeline._process_comments())
+        try:
+            await asyncio.wait_for(delivered.wait(), 1.0)
+        finally:
+            pipeline._running = False
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        order = [(kind, comment_id) for kind, comment_id, _ in events]
+        # The second comment is prepared while the first is delivered
+        assert order == [
+            ("prepare", "1"),
+            ("deliver", "1"),
+            ("prepare", "2"),
+            ("done", "1"),
+            ("deliver", "2"),
+            ("done", "2"),
+        ]
+        starts = [at for kind, _, at in events if kind == "deliver"]
+        # Allow for the clock resolution of the event loop
+        assert starts[1] - starts[0] >= 0.045
@@ -0,0 +1,86 @@
+"""Tests for response cache module."""
+
+import numpy as np
+import pytest
+
+from src.ai.response_cache import ResponseCache
+from src.tts.models import AudioData
+
+
+class WordEncoder:
+    """Deterministic encoder that embeds texts by their words."""
+
+    dimension = 16
+
+    def encode(self, texts):
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                vectors[row, sum(map(ord, word)) % self.dimension] += 1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+def clip(size: int = 100) -> AudioData:
+    """Build an audio clip of the given size."""
+    return AudioData(data=b"\0" * size)
+
+
+class TestResponseCache:
+    """Test ResponseCache class."""
+
+    @pytest.mark.asyncio
+    async def test_exact_match_is_normalized(self):
+        """Test that width, case and whitespace differences still match."""
+        cache = ResponseCache()
+        await cache.put("Ｈｅｌｌｏ ", "Hi!", [clip()])
+
+        cached = await cache.get("hello")
+
+        assert cached is not None
+        assert cached.response == "Hi!"
+        assert await cache.get("goodbye") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        """Test eviction by entry count and by audio size."""
+        cache = ResponseCache(max_entries=2, max_bytes=250)
+        await cache.put("a", "A", [clip()])
+        await cache.put("b", "B", [clip()])
+        await cache.get("a")
+        await cache.put("c", "C", [clip()])
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+
+        await cache.put("d", "D", [clip(200)])
+        assert len(cache) == 1
+        assert await cache.get("d") is not None
+
+        await cache.put("e", "E", [clip(300)])
+        assert await cache.get("e") is None
+
+    @pytest.mark.asyncio
+    async def test_similar_match(self):
+        """Test that similar comments reuse responses with an encoder."""
+        cache = ResponseCache(encoder=WordEncoder(), similarity_threshold=0.8)
+        await cache.put("good morning everyone", "Morning!", [clip()])
+        await cache.put("nice stream", "Thanks!", [clip()])
+
+        assert (await cache.get("good morning everyone !")).response == "Morning!"
+        assert await cache.get("what game is this") is None
+
+    @pytest.mark.asyncio
+    async def test_similar_match_after_eviction(self):
+        """Test that evicted comments are no longer matched by similarity."""
+        cache = ResponseCache(
+            max_entries=1, encoder=WordEncoder(), similarity_threshold=0.8
+        )
+        await cache.put("good morning", "Morning!", [clip()])
+        await cache.put("nice stream", "Thanks!", [clip()])
+
+        assert await cache.get("good morning !") is None
+
+        cache.clear()
+        assert len(cache) == 0
+        assert await cache.get("nice stream") is None
@@ -0,0 +1,123 @@
+"""Tests for memory retriever module."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.memory.long_term_memory import LongTermMemory
+from src.memory.models import Importance, MemoryEntry, MemorySearchResult
+from src.memory.retriever import MemoryRetriever
+
+
+class TestMemoryRetriever:
+    """Test MemoryRetriever class."""
+
+    @pytest.fixture
+    def retriever(self):
+        """Create a retriever without a memory store."""
+        return MemoryRetriever(None)
+
+    def test_extract_keywords_filters_and_keeps_order(self, retriever):
+        """Test that keywords drop stopwords and keep first occurrence order."""
+        keywords = retriever._extract_keywords("The anime and the Manga, anime again!")
+
+        assert keywords == ["anime", "manga"]
+
+    def test_extract_keywords_limit(self, retriever):
+        """Test that at most 10 keywords are returned."""
+        text = " ".join(f"word{i}" for i in range(20))
+
+        assert retriever._extract_keywords(text) == [f"word{i}" for i in range(10)]
+
+    def test_extract_facts(self, retriever):
+        """Test fact extraction from Japanese and English messages."""
+        assert retriever._extract_facts("my birthday is May 5th", "viewer") == [
+            ("viewer: May 5th", Importance.HIGH),
+        ]
+        assert retriever._extract_facts("私はラーメンが好き", "viewer")[0] == (
+            "viewer: ラーメン",
+            Importance.MEDIUM,
+        )
+        assert retriever._extract_facts("hello", "viewer") == []
+
+    def test_extract_facts_limit(self, retriever):
+        """Test that overlapping patterns yield at most 3 facts in pattern order."""
+        facts = retriever._extract_facts(
+            "私はラーメンが好き、猫が好き。I'm a student", "viewer"
+        )
+
+        assert facts == [
+            ("viewer: ラーメン", Importance.MEDIUM),
+            ("viewer: 私はラーメン", Importance.MEDIUM),
+            ("viewer: a student", Importance.MEDIUM),
+        ]
+
+    def test_score_batch(self, retriever):
+        """Test relevance scoring of recent and old entries."""
+        entries = [
+            MemoryEntry(
+                content="Anime night", user_name="alice", importance=Importance.HIGH
+            ),
+            MemoryEntry(
+                content="cooking",
+                user_name="bob",
+                importance=Importance.LOW,
+                timestamp=datetime.now() - timedelta(days=40),
+            ),
+        ]
+
+        scores = retriever._score_batch(entries, ["anime", "manga"], "alice")
+
+        assert scores.tolist() == pytest.approx([0.79, 0.08])
+
+    def test_score_batch_with_similarities(self, retriever):
+        """Test that similarities replace keyword matching and are clamped."""
+        entries = [MemoryEntry(content="x"), MemoryEntry(content="y")]
+
+        scores = retriever._score_batch(entries, [], None, [1.0, -0.5])
+
+        assert scores.tolist() == pytest.approx([0.9, 0.4])
+
+    def test_time_ago(self, retriever):
+        """Test relative time formatting against a fixed current time."""
+        now = datetime(2024, 5, 10, 12, 0)
+
+        assert retriever._time_ago(now - timedelta(seconds=30), now) == "just now"
+        assert retriever._time_ago(now - timedelta(minutes=5), now) == "5m ago"
+        just_under_hour = now - timedelta(minutes=59, seconds=59)
+        assert retriever._time_ago(just_under_hour, now) == "59m ago"
+        assert retriever._time_ago(now - timedelta(hours=3), now) == "3h ago"
+        assert retriever._time_ago(now - timedelta(days=2), now) == "2d ago"
+        assert retriever._time_ago(now - timedelta(days=30), now) == "04/10"
+
+    @pytest.mark.asyncio
+    async def test_retrieve_skips_duplicate_user_memories(self, tmp_path: Path):
+        """Test that keyword matches are not repeated as user context."""
+        store = LongTermMemory(db_path=str(tmp_path / "memory.db"))
+        await store.initialize()
+        try:
+            retriever = MemoryRetriever(store)
+            await retriever.store_interaction("alice", "I like anime", "great!")
+            await retriever.store_interaction("alice", "good night", "bye!")
+
+            results = await retriever.retrieve("anime", user_name="alice")
+
+            ids = [result.entry.id for result in results]
+            assert len(ids) == len(set(ids))
+            assert results[0].match_reason == "keyword_match"
+            assert "user_context" in {result.match_reason for result in results}
+        finally:
+            await store.close()
+
+    def test_format_memory_truncates_long_content(self, retriever):
+        """Test that long memory content is cut to 200 characters."""
+        now = datetime(2024, 5, 10, 12, 0)
+        entry = MemoryEntry(content="x" * 250, timestamp=now)
+
+        formatted = retriever._format_memory(MemorySearchResult(entry, 0.5), now)
+
+        assert formatted == "- [just now] " + "x" * 197 + "..."
+        assert retriever._format_memory(
+            MemorySearchResult(MemoryEntry(content="short", timestamp=now), 0.5), now
+        ) == "- [just now] short"
@@ -1,5 +1,9 @@
 """Tests for TTS engine modules."""
 
+import io
+import struct
+import wave
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -275,3 +279,70 @@ class TestNijivoiceEngine:
         assert result is False
 
         await engine.close()
+
+
+class TestAudioData:
+    """Test AudioData class."""
+
+    @staticmethod
+    def make_wav(frames: bytes, n_channels: int = 1, framerate: int = 24000) -> bytes:
+        """Build 16-bit WAV bytes."""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(n_channels)
+            wav.setsampwidth(2)
+            wav.setframerate(framerate)
+            wav.writeframes(frames)
+        return buffer.getvalue()
+
+    def test_reads_wav_header(self):
+        """Test that format and duration come from the header, not the byte count."""
+        frames = b"\x01\x02" * 2 * 22050
+        audio = AudioData(data=self.make_wav(frames, n_channels=2, framerate=44100))
+
+        assert audio.sample_rate == 44100
+        assert audio.channels == 2
+        assert audio.duration == 0.5
+        assert audio.pcm == frames
+        assert audio.pcm.obj is audio.data
+
+    def test_wav_with_extra_chunk(self):
+        """Test that chunks before the data chunk are skipped."""
+        wav_bytes = self.make_wav(b"\x00\x01" * 24000)
+        # Insert an odd-sized, padded chunk between the fmt and data chunks
+        chunk = b"LIST" + struct.pack("<I", 3) + b"abc\0"
+        body = wav_bytes[12:36] + chunk + wav_bytes[36:]
+        extended = b"RIFF" + struct.pack("<I", len(body) + 4) + b"WAVE" + body
+
+        audio = AudioData.from_wav(extended)
+
+        assert audio.duration == 1.0
+        assert audio.pcm == b"\x00\x01" * 24000
+
+    def test_headerless_data(self):
+        """Test that data without a WAV header is treated as raw PCM."""
+        audio = AudioData(data=b"\0" * 4800, sample_rate=24000)
+
+        assert audio.duration == 0.1
+        assert len(audio.pcm) == 4800
+        with pytest.raises(ValueError):
+            AudioData.from_wav(b"\0" * 4800)
+
+    def test_zero_sample_rate_header(self):
+        """Test that a header with a zero sample rate is rejected."""
+        wav_bytes = bytearray(self.make_wav(b"\x00\x01" * 100))
+        # Sample rate field of the fmt chunk
+        struct.pack_into("<I", wav_bytes, 24, 0)
+
+        with pytest.raises(ValueError, match="Invalid WAV format"):
+            AudioData.from_wav(bytes(wav_bytes))
+
+    def test_header_mismatch_is_logged(self, caplog):
+        """Test that the header overriding the given format is logged."""
+        wav_bytes = self.make_wav(b"\x00\x01" * 44100, framerate=44100)
+
+        audio = AudioData(data=wav_bytes, sample_rate=24000)
+
+        assert audio.sample_rate == 44100
+        assert audio.duration == 1.0
+        assert "overrides the given format" in caplog.text